@@ -0,0 +1,8 @@
+# api/__init__.py
+"""
+HTTP/JSON API for Employee Management System
+"""
+
+from .server import ApiServer
+
+__all__ = ['ApiServer']
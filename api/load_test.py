@@ -0,0 +1,201 @@
+"""
+Local load test for the API server
+
+Starts a server on a seeded temporary database (or an existing one) and
+measures requests per second and latency percentiles with concurrent
+keep-alive clients.
+
+    python -m api.load_test --concurrency 32 --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+
+from models import Employee, TimeEntry, LeaveRequest, LeaveType
+from storage.database import Database
+from api.server import ApiServer
+
+
+def seed_database(db_path: str, employees: int = 200, days: int = 120) -> List[int]:
+    """Fill database with employees, time entries and leave requests"""
+    db = Database(db_path)
+    db.create_tables()
+    first_day = date.today() - timedelta(days=days)
+    with db.transaction():
+        employee_ids = [
+            db.create_employee(Employee(first_name=f"First{i}", last_name=f"Last{i}",
+                                        pesel=f"{i:011d}", department=f"Dept{i % 8}",
+                                        hire_date=first_day))
+            for i in range(employees)
+        ]
+        for employee_id in employee_ids:
+            entries = []
+            for offset in range(days):
+                day = first_day + timedelta(days=offset)
+                if day.weekday() < 5:
+                    check_in = datetime.combine(day, datetime.min.time()) + timedelta(hours=8)
+                    entries.append(TimeEntry(employee_id=employee_id, date=day,
+                                             check_in=check_in, check_out=check_in + timedelta(hours=8)))
+            db.create_time_entries(entries)
+            db.create_leave_request(LeaveRequest(employee_id=employee_id, leave_type=LeaveType.VACATION,
+                                                 start_date=first_day, end_date=first_day + timedelta(days=2),
+                                                 days_count=3))
+    db.close()
+    return employee_ids
+
+
+async def _read_response(reader: asyncio.StreamReader) -> int:
+    """Read one response, returning its status"""
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ', 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    if headers.get('transfer-encoding') == 'chunked':
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    else:
+        await reader.readexactly(int(headers.get('content-length', 0)))
+    return status
+
+
+async def _client(host: str, port: int, requests: List[Tuple[str, str, bytes]],
+                  latencies: List[float], errors: List[int]):
+    """Send requests one after another on a keep-alive connection"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for method, path, body in requests:
+            started = time.perf_counter()
+            writer.write(
+                f"{method} {path} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+            )
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - started)
+            if status >= 400:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+def _request_mix(employee_ids: List[int], count: int, write_ratio: float) -> List[Tuple[str, str, bytes]]:
+    """Build a random mix of list, detail and write requests"""
+    today = date.today()
+    requests = []
+    for i in range(count):
+        employee_id = random.choice(employee_ids)
+        if random.random() < write_ratio:
+            day = (today + timedelta(days=1 + i % 365)).strftime('%Y-%m-%d')
+            body = (f'{{"employee_id":{employee_id},"date":"{day}",'
+                    f'"check_in":"{day} 08:00","check_out":"{day} 16:00"}}').encode('utf-8')
+            requests.append(('POST', '/time-entries', body))
+            continue
+        requests.append(random.choice([
+            ('GET', '/employees?limit=50', b''),
+            ('GET', f'/employees/{employee_id}', b''),
+            ('GET', f'/time-entries?employee_id={employee_id}&limit=100', b''),
+            ('GET', '/leave-requests?status=Pending&limit=50', b''),
+            ('GET', '/notifications?unread=1', b''),
+        ]))
+    return requests
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Get percentile of sorted values"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_load_test(db_path: str = None, concurrency: int = 32, requests: int = 10000,
+                  workers: int = 4, write_ratio: float = 0.1) -> Dict[str, float]:
+    """
+    Run load test against a server in a background thread
+
+    Args:
+        db_path: Existing database, a seeded temporary one if None
+        concurrency: Number of concurrent client connections
+        requests: Total number of requests
+        workers: Database worker threads of the server
+        write_ratio: Share of requests that insert a time entry
+
+    Returns:
+        Throughput and latency statistics
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if db_path is None:
+            db_path = os.path.join(tmp_dir, "load_test.db")
+            employee_ids = seed_database(db_path)
+        else:
+            db = Database(db_path)
+            employee_ids = [emp.id for emp in db.get_employee_names()]
+            db.close()
+
+        server = ApiServer(db_path, port=0, workers=workers)
+        ready = threading.Event()
+        loop = asyncio.new_event_loop()
+
+        def serve():
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(server.start())
+            ready.set()
+            loop.run_forever()
+            loop.run_until_complete(server.close())
+            loop.close()
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        ready.wait()
+
+        per_client = max(1, requests // concurrency)
+        plans = [_request_mix(employee_ids, per_client, write_ratio) for _ in range(concurrency)]
+        latencies: List[float] = []
+        errors: List[int] = []
+
+        async def run_clients():
+            await asyncio.gather(*(_client(server.host, server.port, plan, latencies, errors) for plan in plans))
+
+        started = time.perf_counter()
+        asyncio.run(run_clients())
+        elapsed = time.perf_counter() - started
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'seconds': round(elapsed, 2),
+        'requests_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(_percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(_percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(_percentile(latencies, 99) * 1000, 2),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load test the API server')
+    parser.add_argument('--db', help='Existing database (default: seeded temporary database)')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    args = parser.parse_args()
+    print(run_load_test(args.db, args.concurrency, args.requests, args.workers, args.write_ratio))
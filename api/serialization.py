@@ -0,0 +1,131 @@
+"""
+JSON conversion of models for the API server
+"""
+
+import dataclasses
+import typing
+from datetime import date, datetime
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from models import Employee, TimeEntry, Notification
+
+
+# Read-only properties included in JSON output
+COMPUTED_FIELDS = {
+    Employee: ('full_name',),
+    TimeEntry: ('hours_worked',),
+    Notification: ('is_overdue',),
+}
+
+# Fields clients cannot set
+READ_ONLY_FIELDS = {'id', 'created_at', 'updated_at'}
+
+
+class ValidationError(ValueError):
+    """Invalid value in request body"""
+
+
+def _field_kind(field_type) -> type:
+    """Get the concrete type of a field, unwrapping Optional"""
+    if typing.get_origin(field_type) is typing.Union:
+        args = [arg for arg in typing.get_args(field_type) if arg is not type(None)]
+        return args[0] if args else object
+    return field_type
+
+
+@lru_cache(maxsize=None)
+def _fields(model_class) -> Tuple[Tuple[str, type], ...]:
+    """Get (name, type) of the dataclass fields of a model"""
+    return tuple((f.name, _field_kind(f.type)) for f in dataclasses.fields(model_class))
+
+
+def _encode(value) -> Any:
+    """Convert a field value to a JSON type"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(' ', 'seconds')
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def to_dict(obj) -> Dict[str, Any]:
+    """Convert model to a JSON-compatible dictionary"""
+    model_class = type(obj)
+    data = {name: _encode(getattr(obj, name)) for name, _ in _fields(model_class)}
+    for name in COMPUTED_FIELDS.get(model_class, ()):
+        data[name] = getattr(obj, name)
+    return data
+
+
+def _decode(name: str, kind: type, value):
+    """Convert a JSON value to the field type"""
+    if value is None or value == '':
+        if isinstance(kind, type) and issubclass(kind, Enum):
+            raise ValidationError(f"{name} cannot be empty")
+        return None
+    try:
+        if kind is datetime:
+            return datetime.strptime(value, '%Y-%m-%d %H:%M:%S') if len(value) > 16 \
+                else datetime.strptime(value, '%Y-%m-%d %H:%M')
+        if kind is date:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        if isinstance(kind, type) and issubclass(kind, Enum):
+            return kind(value)
+        if kind is bool:
+            # Only JSON booleans and 0/1; bool("false") would be True
+            if isinstance(value, bool) or (type(value) is int and value in (0, 1)):
+                return bool(value)
+            raise ValueError(value)
+        if kind is int:
+            return int(value)
+        if kind is float:
+            return float(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid value for {name}: {value!r}")
+    return value
+
+
+def from_dict(model_class, data: Dict[str, Any], instance=None):
+    """
+    Build or update a model from request JSON
+
+    Args:
+        model_class: Model dataclass
+        data: Decoded JSON object
+        instance: Existing object to update, only given fields change
+
+    Returns:
+        Model instance
+    """
+    if not isinstance(data, dict):
+        raise ValidationError("Request body must be a JSON object")
+
+    fields = dict(_fields(model_class))
+    unknown = set(data) - set(fields)
+    if unknown:
+        raise ValidationError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    values = {
+        name: _decode(name, fields[name], value)
+        for name, value in data.items()
+        if name not in READ_ONLY_FIELDS
+    }
+
+    if instance is None:
+        # Keep model defaults for missing and null values
+        return model_class(**{name: value for name, value in values.items() if value is not None})
+
+    for name, value in values.items():
+        setattr(instance, name, value)
+    return instance
+
+
+def require(data: Dict[str, Any], names: List[str]):
+    """Check that required fields are present"""
+    missing = [name for name in names if data.get(name) in (None, '')]
+    if missing:
+        raise ValidationError(f"Missing fields: {', '.join(missing)}")
@@ -0,0 +1,499 @@
+"""
+HTTP/JSON API server for Employee Management System
+
+Exposes employees, time entries, leave requests and notifications to other
+internal tools. Built on asyncio streams only; database work runs on a
+bounded pool of worker threads with one WAL-mode connection each.
+
+    python -m api.server --port 8080
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from models import Employee, TimeEntry, LeaveRequest
+from storage.connection_pool import ConnectionPool
+from storage.database import Database, ConflictError
+from utils.business_calendar import business_days
+from utils.config import Config
+from utils.leave_index import find_overlapping_requests
+from utils.logger import get_logger, setup_logger
+from api.serialization import ValidationError, from_dict, require, to_dict
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10000
+
+# Pages with more items are sent with chunked encoding in pieces
+STREAM_THRESHOLD = 500
+STREAM_CHUNK_ITEMS = 250
+
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+
+class ApiError(Exception):
+    """Error returned to the client with an HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class Request:
+    """Parsed HTTP request"""
+    method: str
+    path: str
+    query: Dict[str, str]
+    body: bytes = b''
+    params: Dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        """Decode JSON body"""
+        try:
+            return json.loads(self.body or b'null')
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Request body is not valid JSON")
+
+    def int_param(self, name: str) -> int:
+        """Get integer path parameter"""
+        return int(self.params[name])
+
+    def query_int(self, name: str, default: Optional[int] = None) -> Optional[int]:
+        """Get integer query parameter"""
+        value = self.query.get(name)
+        if value in (None, ''):
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Query parameter {name} must be an integer")
+
+    def query_date(self, name: str):
+        """Get YYYY-MM-DD query parameter"""
+        value = self.query.get(name)
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Query parameter {name} must be a YYYY-MM-DD date")
+
+    def page(self) -> Tuple[int, int]:
+        """Get (offset, limit) from query parameters"""
+        offset = self.query_int('offset', 0)
+        limit = self.query_int('limit', DEFAULT_PAGE_SIZE)
+        if offset < 0 or not 0 < limit <= MAX_PAGE_SIZE:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"limit must be 1-{MAX_PAGE_SIZE} and offset not negative")
+        return offset, limit
+
+
+@dataclass
+class Response:
+    """Handler result with explicit status"""
+    status: int
+    data: Any
+
+
+class Page:
+    """One page of a list result"""
+
+    def __init__(self, items: list, offset: int, limit: int):
+        # Handlers fetch limit + 1 rows to learn if another page exists
+        self.has_more = len(items) > limit
+        self.items = items[:limit]
+        self.offset = offset
+        self.limit = limit
+
+    @property
+    def next_offset(self) -> Optional[int]:
+        return self.offset + self.limit if self.has_more else None
+
+
+# Handlers run on pool workers and receive that worker's connection
+def list_employees(db: Database, request: Request) -> Page:
+    offset, limit = request.page()
+    return Page(db.get_all_employees(limit + 1, offset), offset, limit)
+
+
+def get_employee(db: Database, request: Request) -> Employee:
+    employee = db.get_employee(request.int_param('id'))
+    if not employee:
+        raise ApiError(HTTPStatus.NOT_FOUND, "Employee not found")
+    return employee
+
+
+def create_employee(db: Database, request: Request) -> Response:
+    data = request.json()
+    employee = from_dict(Employee, data)
+    require(data, ['first_name', 'last_name', 'pesel'])
+    employee.id = db.create_employee(employee)
+    return Response(HTTPStatus.CREATED, db.get_employee(employee.id))
+
+
+def update_employee(db: Database, request: Request) -> Employee:
+    # A version in the body makes the update fail with 409 if the
+    # employee changed since the client read it
+    employee = from_dict(Employee, request.json(), get_employee(db, request))
+    if not db.update_employee(employee):
+        raise ApiError(HTTPStatus.NOT_FOUND, "Employee not found")
+    return db.get_employee(employee.id)
+
+
+def list_time_entries(db: Database, request: Request) -> Page:
+    offset, limit = request.page()
+    entries = db.get_time_entries(
+        request.query_int('employee_id'), request.query_date('from'), request.query_date('to'),
+        limit + 1, offset
+    )
+    return Page(entries, offset, limit)
+
+
+def create_time_entries(db: Database, request: Request) -> Response:
+    data = request.json()
+    items = data if isinstance(data, list) else [data]
+    entries = []
+    for item in items:
+        require(item, ['employee_id', 'date'])
+        entries.append(from_dict(TimeEntry, item))
+
+    if len(entries) == 1:
+        entries[0].id = db.create_time_entry(entries[0])
+        return Response(HTTPStatus.CREATED, entries[0])
+    db.create_time_entries(entries)
+    return Response(HTTPStatus.CREATED, {'created': len(entries)})
+
+
+def list_leave_requests(db: Database, request: Request) -> Page:
+    offset, limit = request.page()
+    requests = db.get_leave_requests(
+        request.query_int('employee_id'), request.query.get('status'), limit + 1, offset
+    )
+    return Page(requests, offset, limit)
+
+
+def get_leave_request(db: Database, request: Request) -> LeaveRequest:
+    leave_request = db.get_leave_request(request.int_param('id'))
+    if not leave_request:
+        raise ApiError(HTTPStatus.NOT_FOUND, "Leave request not found")
+    return leave_request
+
+
+def create_leave_request(db: Database, request: Request) -> Response:
+    data = request.json()
+    require(data, ['employee_id', 'leave_type', 'start_date', 'end_date'])
+    leave_request = from_dict(LeaveRequest, data)
+    leave_request.status = 'Pending'
+    if leave_request.end_date < leave_request.start_date:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "end_date is before start_date")
+    if not leave_request.days_count:
+        leave_request.days_count = business_days(leave_request.start_date, leave_request.end_date)
+    overlapping = find_overlapping_requests(db, leave_request.employee_id,
+                                            leave_request.start_date, leave_request.end_date)
+    if overlapping:
+        raise ApiError(HTTPStatus.CONFLICT, "Request overlaps leave requests " +
+                       ", ".join(f"#{r.id} ({r.status})" for r in overlapping))
+    leave_request.id = db.create_leave_request(leave_request)
+    return Response(HTTPStatus.CREATED, db.get_leave_request(leave_request.id))
+
+
+def approve_leave_request(db: Database, request: Request) -> LeaveRequest:
+    data = request.json() or {}
+    require(data, ['approved_by'])
+    if not db.approve_leave_request(request.int_param('id'), data['approved_by']):
+        leave_request = get_leave_request(db, request)
+        if leave_request.status == 'Pending':
+            raise ApiError(HTTPStatus.CONFLICT, "Leave request overlaps approved leave")
+        raise ApiError(HTTPStatus.CONFLICT, f"Leave request is already {leave_request.status.lower()}")
+    return get_leave_request(db, request)
+
+
+def decide_leave_requests(db: Database, request: Request) -> Dict[str, str]:
+    data = request.json() or {}
+    require(data, ['ids', 'approved_by'])
+    if not isinstance(data['ids'], list) or not all(isinstance(i, int) for i in data['ids']):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "ids must be a list of integers")
+    if request.params['action'] == 'approve':
+        outcomes = db.approve_leave_requests(data['ids'], data['approved_by'])
+    else:
+        outcomes = db.reject_leave_requests(data['ids'], data['approved_by'], data.get('reason'))
+    return {str(request_id): outcome for request_id, outcome in outcomes.items()}
+
+
+def list_notifications(db: Database, request: Request) -> Page:
+    offset, limit = request.page()
+    notifications = db.get_notifications(
+        request.query_int('employee_id'), request.query.get('unread') in ('1', 'true'), limit + 1, offset
+    )
+    return Page(notifications, offset, limit)
+
+
+def mark_notification(db: Database, request: Request):
+    is_read = request.params['action'] == 'read'
+    if not db.mark_notification_read(request.int_param('id'), is_read):
+        raise ApiError(HTTPStatus.NOT_FOUND, "Notification not found")
+    return db.get_notification(request.int_param('id'))
+
+
+def get_statistics(db: Database, request: Request) -> Dict[str, int]:
+    return db.get_statistics()
+
+
+ROUTES: List[Tuple[str, str, Callable]] = [
+    ('GET', r'/employees', list_employees),
+    ('POST', r'/employees', create_employee),
+    ('GET', r'/employees/(?P<id>\d+)', get_employee),
+    ('PUT', r'/employees/(?P<id>\d+)', update_employee),
+    ('PATCH', r'/employees/(?P<id>\d+)', update_employee),
+    ('GET', r'/time-entries', list_time_entries),
+    ('POST', r'/time-entries', create_time_entries),
+    ('GET', r'/leave-requests', list_leave_requests),
+    ('POST', r'/leave-requests', create_leave_request),
+    ('GET', r'/leave-requests/(?P<id>\d+)', get_leave_request),
+    ('POST', r'/leave-requests/(?P<id>\d+)/approve', approve_leave_request),
+    ('POST', r'/leave-requests/(?P<action>approve|reject)', decide_leave_requests),
+    ('GET', r'/notifications', list_notifications),
+    ('POST', r'/notifications/(?P<id>\d+)/(?P<action>read|unread)', mark_notification),
+    ('GET', r'/stats', get_statistics),
+]
+
+
+def _encode_json(data) -> bytes:
+    """Encode handler result as JSON"""
+    if hasattr(data, '__dataclass_fields__'):
+        data = to_dict(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class ApiServer:
+    """Asyncio HTTP/1.1 server dispatching JSON requests to the database"""
+
+    def __init__(self, db_path: str = "employee_management.db", host: str = "127.0.0.1",
+                 port: int = 8080, workers: int = 4):
+        """
+        Initialize API server
+
+        Args:
+            db_path: Path to database file
+            host: Interface to listen on
+            port: Port to listen on, 0 picks a free port
+            workers: Number of database worker threads
+        """
+        self.db_path = db_path
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.logger = get_logger()
+        self.pool: Optional[ConnectionPool] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.routes = [(method, re.compile(pattern), handler) for method, pattern, handler in ROUTES]
+
+    async def start(self):
+        """Prepare database and start listening"""
+        db = Database(self.db_path)
+        db.create_tables()
+        # WAL mode is persistent, readers no longer block on writers
+        db.connection.execute("PRAGMA journal_mode = WAL")
+        db.close()
+
+        self.pool = ConnectionPool(self.db_path, self.workers)
+        self.server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_SIZE
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.logger.info(f"API server listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """Start and serve until cancelled"""
+        if self.server is None:
+            await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and close database connections"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.pool is not None:
+            # Waiting for workers must not block the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.pool.close)
+            self.pool = None
+        self.logger.info("API server stopped")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests on one keep-alive connection"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_error(writer, HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                                           "Request headers too large", False)
+                    break
+
+                try:
+                    request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                    method, target, version = request_line.split(' ', 2)
+                    headers = {}
+                    for line in header_lines:
+                        if line:
+                            name, _, value = line.partition(':')
+                            headers[name.strip().lower()] = value.strip()
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    await self._send_error(writer, HTTPStatus.BAD_REQUEST, "Malformed request", False)
+                    break
+
+                if length > MAX_BODY_SIZE:
+                    await self._send_error(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large", False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                url = urlsplit(target)
+                request = Request(method.upper(), url.path.rstrip('/') or '/', dict(parse_qsl(url.query)), body)
+                await self._dispatch(request, writer, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Request, writer: asyncio.StreamWriter, keep_alive: bool):
+        """Route request to handler and write the response"""
+        handler = None
+        path_matched = False
+        for method, pattern, route_handler in self.routes:
+            match = pattern.fullmatch(request.path)
+            if match:
+                path_matched = True
+                if method == request.method:
+                    handler = route_handler
+                    request.params = match.groupdict()
+                    break
+
+        if handler is None:
+            if path_matched:
+                await self._send_error(writer, HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed", keep_alive)
+            else:
+                await self._send_error(writer, HTTPStatus.NOT_FOUND, "Not found", keep_alive)
+            return
+
+        try:
+            result = await self.pool.run(handler, request)
+        except ApiError as e:
+            await self._send_error(writer, e.status, e.message, keep_alive)
+            return
+        except ValidationError as e:
+            await self._send_error(writer, HTTPStatus.BAD_REQUEST, str(e), keep_alive)
+            return
+        except (ConflictError, sqlite3.IntegrityError) as e:
+            await self._send_error(writer, HTTPStatus.CONFLICT, str(e), keep_alive)
+            return
+        except Exception as e:
+            self.logger.error(f"API {request.method} {request.path} failed: {e}")
+            await self._send_error(writer, HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error", keep_alive)
+            return
+
+        if isinstance(result, Page):
+            await self._send_page(writer, result, keep_alive)
+        elif isinstance(result, Response):
+            await self._send(writer, result.status, _encode_json(result.data), keep_alive)
+        else:
+            await self._send(writer, HTTPStatus.OK, _encode_json(result), keep_alive)
+
+    @staticmethod
+    def _head(status: int, keep_alive: bool, extra: str) -> bytes:
+        """Build status line and headers"""
+        status = HTTPStatus(status)
+        return (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"{extra}"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode('latin-1')
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, body: bytes, keep_alive: bool):
+        """Write complete response"""
+        writer.write(self._head(status, keep_alive, f"Content-Length: {len(body)}\r\n") + body)
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int, message: str, keep_alive: bool):
+        """Write error response"""
+        await self._send(writer, status, _encode_json({'error': message}), keep_alive)
+
+    async def _send_page(self, writer: asyncio.StreamWriter, page: Page, keep_alive: bool):
+        """Write list response, streaming large pages in chunks"""
+        prefix = (
+            f'{{"offset":{page.offset},"limit":{page.limit},'
+            f'"next_offset":{json.dumps(page.next_offset)},"items":['
+        ).encode('utf-8')
+
+        if len(page.items) <= STREAM_THRESHOLD:
+            items = b','.join(_encode_json(to_dict(item)) for item in page.items)
+            await self._send(writer, HTTPStatus.OK, prefix + items + b']}', keep_alive)
+            return
+
+        # Encode and send piece by piece so large pages neither build one
+        # big string nor keep other connections waiting
+        writer.write(self._head(HTTPStatus.OK, keep_alive, "Transfer-Encoding: chunked\r\n"))
+        self._write_chunk(writer, prefix)
+        for start in range(0, len(page.items), STREAM_CHUNK_ITEMS):
+            chunk = b','.join(_encode_json(to_dict(item))
+                              for item in page.items[start:start + STREAM_CHUNK_ITEMS])
+            self._write_chunk(writer, (b',' if start else b'') + chunk)
+            await writer.drain()
+        self._write_chunk(writer, b']}')
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    @staticmethod
+    def _write_chunk(writer: asyncio.StreamWriter, data: bytes):
+        """Write one chunk of a chunked response"""
+        writer.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+
+def main(argv: List[str] = None) -> int:
+    """Run API server from the command line"""
+    config = Config()
+    parser = argparse.ArgumentParser(prog='employee-management-api',
+                                     description='Employee Management System HTTP/JSON API')
+    parser.add_argument('--db', default=config.get('database_name'), help='Path to database file')
+    parser.add_argument('--host', default=config.get('api_host'), help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=config.get('api_port'), help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=config.get('api_workers'),
+                        help='Database worker threads')
+    args = parser.parse_args(argv)
+
+    setup_logger(config.get('log_file'), json_lines=config.get('log_json'),
+                 sampling=config.get('log_sampling'), queue_size=config.get('log_queue_size'))
+    server = ApiServer(args.db, args.host, args.port, args.workers)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
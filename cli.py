@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Employee Management System - Command Line Interface
+
+Runs batch operations without starting the GUI, e.g. from cron:
+
+    python cli.py import employees employees.csv
+    python cli.py import time-entries entries.csv
+    python cli.py export time-entries --from 2025-01-01 --to 2025-01-31
+    python cli.py check-notifications
+    python cli.py generate-documents --type certificate --employee all
+    python cli.py partitions enable
+    python cli.py archive --time-entries-days 730
+    python cli.py backup create
+    python cli.py accrue-leave --year 2026
+    python cli.py stats
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+from datetime import date, datetime
+from typing import List, Optional
+
+# Add the current directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from models import Employee, TimeEntry, ContractType, WorkMode
+from storage.archive import ColdArchive
+from storage.backup import BackupManager
+from storage.database import Database, ConflictError
+from storage.document_store import DocumentStore, import_document_files
+from storage.time_entry_buffer import TimeEntryBuffer
+from utils.config import Config
+from utils.document_generator import DocumentGenerator
+from utils.leave_accrual import LeaveAccrual
+from utils.logger import setup_logger
+from utils.notification_checker import NotificationChecker
+
+
+EMPLOYEE_COLUMNS = [
+    'id', 'first_name', 'last_name', 'pesel', 'address', 'phone', 'email',
+    'position', 'department', 'hire_date', 'contract_number', 'contract_type',
+    'contract_end_date', 'annual_leave_days', 'remaining_leave_days', 'work_mode',
+    'medical_exam_date', 'safety_training_date'
+]
+
+TIME_ENTRY_COLUMNS = ['id', 'employee_id', 'date', 'check_in', 'check_out', 'work_mode', 'notes']
+
+LEAVE_REQUEST_COLUMNS = [
+    'id', 'employee_id', 'leave_type', 'start_date', 'end_date', 'days_count',
+    'reason', 'status', 'approved_by', 'approved_date'
+]
+
+DOCUMENT_KINDS = {
+    'certificate': 'Employment Certificate',
+    'contract': 'Employment Contract',
+}
+
+
+def parse_date(value: str) -> Optional[date]:
+    """Parse YYYY-MM-DD date, empty values give None"""
+    value = (value or '').strip()
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+
+
+def parse_time(value: str, day: date) -> Optional[datetime]:
+    """Parse full datetime or HH:MM time on the given day"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    if len(value) <= 5:
+        return datetime.combine(day, datetime.strptime(value, '%H:%M').time())
+    return datetime.fromisoformat(value)
+
+
+def format_value(value) -> str:
+    """Format value for CSV output"""
+    if value is None:
+        return ''
+    if hasattr(value, 'value'):
+        return value.value
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def write_csv(path: str, columns: List[str], records) -> int:
+    """Write model objects to CSV"""
+    count = 0
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for record in records:
+            writer.writerow([format_value(getattr(record, column)) for column in columns])
+            count += 1
+    return count
+
+
+def employee_from_row(row: dict) -> Employee:
+    """Build employee from CSV row"""
+    employee = Employee(
+        first_name=row['first_name'].strip(),
+        last_name=row['last_name'].strip(),
+        pesel=row.get('pesel', '').strip(),
+        address=row.get('address', ''),
+        phone=row.get('phone', ''),
+        email=row.get('email', ''),
+        position=row.get('position', ''),
+        department=row.get('department', ''),
+        hire_date=parse_date(row.get('hire_date')) or date.today(),
+        contract_number=row.get('contract_number', ''),
+        contract_end_date=parse_date(row.get('contract_end_date')),
+        medical_exam_date=parse_date(row.get('medical_exam_date')),
+        safety_training_date=parse_date(row.get('safety_training_date'))
+    )
+    if row.get('contract_type'):
+        employee.contract_type = ContractType(row['contract_type'])
+    if row.get('work_mode'):
+        employee.work_mode = WorkMode(row['work_mode'])
+    if row.get('annual_leave_days'):
+        employee.annual_leave_days = int(row['annual_leave_days'])
+        employee.remaining_leave_days = employee.annual_leave_days
+    if row.get('remaining_leave_days'):
+        employee.remaining_leave_days = int(row['remaining_leave_days'])
+    return employee
+
+
+def time_entry_from_row(row: dict) -> TimeEntry:
+    """Build time entry from CSV row"""
+    day = parse_date(row['date'])
+    return TimeEntry(
+        employee_id=int(row['employee_id']),
+        date=day,
+        check_in=parse_time(row.get('check_in'), day),
+        check_out=parse_time(row.get('check_out'), day),
+        work_mode=WorkMode(row['work_mode']) if row.get('work_mode') else WorkMode.OFFICE,
+        notes=row.get('notes', '')
+    )
+
+
+# Commands
+def cmd_import(args, db: Database, config: Config) -> int:
+    """Import employees, time entries or loose document files"""
+    if args.kind == 'documents':
+        directory = args.file or config.get('generated_documents_dir')
+        imported, skipped = import_document_files(db, directory)
+        print(f"Imported {imported} documents, skipped {skipped}")
+        return 0
+
+    if not args.file:
+        print(f"File is required for importing {args.kind}", file=sys.stderr)
+        return 2
+
+    with open(args.file, newline='', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+
+    if args.kind == 'employees':
+        with db.transaction():
+            for row in rows:
+                db.create_employee(employee_from_row(row))
+        print(f"Imported {len(rows)} employees")
+    else:
+        entries = [time_entry_from_row(row) for row in rows]
+        # Check the whole file first so a bad row does not leave part of it imported
+        known = {row[0] for row in db.get_employee_columns(['id'])}
+        unknown = sorted({entry.employee_id for entry in entries} - known)
+        if unknown:
+            raise ValueError(f"Unknown employee IDs: {', '.join(map(str, unknown))}")
+        with TimeEntryBuffer(args.db, batch_size=args.batch_size) as buffer:
+            buffer.add_many(entries)
+        if buffer.rejected:
+            print(f"Imported {len(rows) - len(buffer.rejected)} time entries, "
+                  f"{len(buffer.rejected)} rejected", file=sys.stderr)
+            return 1
+        print(f"Imported {len(rows)} time entries")
+    return 0
+
+
+def cmd_export(args, db: Database, config: Config) -> int:
+    """Export records to CSV"""
+    start_date = parse_date(args.start_date)
+    end_date = parse_date(args.end_date)
+
+    if args.kind == 'employees':
+        columns, records = EMPLOYEE_COLUMNS, db.get_all_employees()
+    elif args.kind == 'time-entries':
+        columns = TIME_ENTRY_COLUMNS
+        records = db.get_time_entries(args.employee, start_date, end_date)
+    else:
+        columns = LEAVE_REQUEST_COLUMNS
+        records = db.get_leave_requests(args.employee, args.status)
+
+    output = args.output or os.path.join(
+        config.get('export_dir'), f"{args.kind.replace('-', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    )
+    count = write_csv(output, columns, records)
+    print(f"Exported {count} {args.kind.replace('-', ' ')} to {output}")
+    return 0
+
+
+def cmd_check_notifications(args, db: Database, config: Config) -> int:
+    """Run one notification check"""
+    checker = NotificationChecker(db, lambda count: print(f"Unread notifications: {count}"))
+    checker.check_notifications()
+    return 0
+
+
+def cmd_generate_documents(args, db: Database, config: Config) -> int:
+    """Generate documents for selected employees"""
+    if args.employee == 'all':
+        employees = db.get_all_employees()
+    else:
+        employees = []
+        for employee_id in args.employee.split(','):
+            employee = db.get_employee(int(employee_id))
+            if not employee:
+                print(f"Employee {employee_id} not found", file=sys.stderr)
+                return 1
+            employees.append(employee)
+
+    generator = DocumentGenerator(config.get('document_templates_dir'), config)
+    if args.type == 'certificate':
+        contents = generator.generate_certificates(employees, args.purpose, args.notes)
+    else:
+        contents = generator.generate_contracts(employees, args.salary, args.benefits, args.notes)
+
+    doc_type = DOCUMENT_KINDS[args.type]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    store = DocumentStore(config.get('document_store_dir'), config.get('document_compression'))
+
+    with db.transaction():
+        for employee, content in zip(employees, contents):
+            filename = f"{doc_type.replace(' ', '_')}_{employee.full_name.replace(' ', '_')}_{timestamp}.txt"
+            if args.files:
+                generator.save_document(content, filename, config.get('generated_documents_dir'))
+            else:
+                store.save_document(db, employee.id, doc_type, filename, content)
+
+    print(f"Generated {len(contents)} documents")
+    return 0
+
+
+def cmd_partitions(args, db: Database, config: Config) -> int:
+    """Manage year partitions of time entries"""
+    partitions = db.partitions
+    if args.action == 'enable':
+        if partitions.enabled:
+            print("Time entry partitioning is already enabled")
+            return 0
+        for year, moved in partitions.enable().items():
+            print(f"{year}: moved {moved} time entries")
+        db.connection.execute('VACUUM')
+        return 0
+
+    if args.action in ('detach', 'attach'):
+        if not args.year:
+            print(f"Year is required to {args.action} a partition", file=sys.stderr)
+            return 2
+        if args.action == 'detach':
+            partitions.detach(args.year)
+        else:
+            partitions.reattach(args.year)
+
+    if not partitions.enabled:
+        print("Time entry partitioning is not enabled")
+        return 0
+    for info in partitions.info():
+        state = 'detached' if info['detached'] else 'active'
+        print(f"{info['year']}  {state:<9}{info['size_bytes'] / 1024:>10.0f} KB  {info['file_path']}")
+    return 0
+
+
+def cmd_archive(args, db: Database, config: Config) -> int:
+    """Move old time entries and read notifications to the archive file"""
+    archive = ColdArchive(db, config.get('archive_file') or None,
+                          batch_rows=config.get('archive_batch_rows', 5000))
+    try:
+        archived = archive.run(
+            args.time_entries_days or config.get('archive_time_entries_after_days', 730),
+            args.notifications_days or config.get('archive_notifications_after_days', 180)
+        )
+        for kind, count in archived.items():
+            print(f"Archived {count} {kind.replace('_', ' ')}")
+        print(f"Archive {archive.archive_path}: {archive.size() / 1024:.0f} KB")
+    finally:
+        archive.close()
+    return 0
+
+
+def cmd_backup(args, db: Database, config: Config) -> int:
+    """Create, list, verify or restore online backups"""
+    manager = BackupManager(
+        db.db_path,
+        backup_dir=config.get('backup_dir'),
+        pages_per_step=config.get('backup_pages_per_step'),
+        step_sleep=config.get('backup_step_sleep_ms') / 1000,
+        keep=config.get('backup_keep'),
+        compress=config.get('backup_compress')
+    )
+
+    if args.action == 'create':
+        report = manager.create_backup()
+        print(f"Backup {report['name']}: {report['files']} files, {report['pages']} pages, "
+              f"{report['database_bytes'] / 1024:.0f} KB -> {report['backup_bytes'] / 1024:.0f} KB "
+              f"in {report['duration_seconds']:.2f} s ({report['mb_per_second']} MB/s)")
+        for name in manager.rotate():
+            print(f"Removed backup {name}")
+        args.name = report['name']
+        if not config.get('backup_verify'):
+            return 0
+
+    if args.action in ('create', 'verify'):
+        ok, problems = manager.verify_backup(args.name)
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        print("Backup verified" if ok else "Backup verification failed")
+        return 0 if ok else 1
+
+    if args.action == 'restore':
+        if not args.name or not args.target:
+            print("Backup name and --target are required to restore", file=sys.stderr)
+            return 2
+        for path in manager.restore_backup(args.name, args.target):
+            print(f"Restored {path}")
+        return 0
+
+    for backup in manager.list_backups():
+        print(f"{backup['name']}  {len(backup['files'])} files  "
+              f"{backup['backup_bytes'] / 1024:>10.0f} KB  {backup['duration_seconds']:>8.2f} s")
+    return 0
+
+
+def cmd_accrue_leave(args, db: Database, config: Config) -> int:
+    """Open a year's leave balances from the previous year's ledger"""
+    accrual = LeaveAccrual(db, config.get('leave_carry_over_cap'))
+    year = args.year or date.today().year
+    print(f"Accrued {year} leave for {accrual.run(year)} employees")
+    if args.show:
+        for employee_id, _, entitlement, carried_over, used, adjustment, balance in db.get_leave_ledger(year):
+            print(f"{employee_id:>6}  entitlement {entitlement:>3}  carried over {carried_over:>4}  "
+                  f"used {used:>3}  adjusted {adjustment:>4}  balance {balance:>4}")
+    return 0
+
+
+def cmd_stats(args, db: Database, config: Config) -> int:
+    """Print record counts"""
+    for name, count in db.get_statistics().items():
+        print(f"{name.replace('_', ' ').capitalize():<28}{count}")
+    return 0
+
+
+def build_parser(config: Config) -> argparse.ArgumentParser:
+    """Build command line parser"""
+    parser = argparse.ArgumentParser(
+        prog='employee-management-cli',
+        description='Employee Management System batch operations'
+    )
+    parser.add_argument('--db', default=config.get('database_name'), help='Path to database file')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help='Import records from CSV')
+    import_parser.add_argument('kind', choices=['employees', 'time-entries', 'documents'])
+    import_parser.add_argument('file', nargs='?',
+                               help='CSV file (directory of generated files for documents)')
+    import_parser.add_argument('--batch-size', type=int, default=500,
+                               help='Time entries written per commit')
+    import_parser.set_defaults(handler=cmd_import)
+
+    export_parser = subparsers.add_parser('export', help='Export records to CSV')
+    export_parser.add_argument('kind', choices=['employees', 'time-entries', 'leave-requests'])
+    export_parser.add_argument('-o', '--output', help='Output file (default: export directory)')
+    export_parser.add_argument('--employee', type=int, help='Employee ID')
+    export_parser.add_argument('--from', dest='start_date', help='Start date (YYYY-MM-DD)')
+    export_parser.add_argument('--to', dest='end_date', help='End date (YYYY-MM-DD)')
+    export_parser.add_argument('--status', choices=['Pending', 'Approved', 'Rejected'],
+                               help='Leave request status')
+    export_parser.set_defaults(handler=cmd_export)
+
+    check_parser = subparsers.add_parser('check-notifications', help='Run notification checks once')
+    check_parser.set_defaults(handler=cmd_check_notifications)
+
+    generate_parser = subparsers.add_parser('generate-documents', help='Generate documents in batch')
+    generate_parser.add_argument('--type', required=True, choices=sorted(DOCUMENT_KINDS))
+    generate_parser.add_argument('--employee', required=True,
+                                 help="Comma separated employee IDs or 'all'")
+    generate_parser.add_argument('--purpose', default='', help='Certificate purpose')
+    generate_parser.add_argument('--salary', default='', help='Contract salary')
+    generate_parser.add_argument('--benefits', default='', help='Contract benefits')
+    generate_parser.add_argument('--notes', default='', help='Additional notes or terms')
+    generate_parser.add_argument('--files', action='store_true',
+                                 help='Write plain text files instead of using the document store')
+    generate_parser.set_defaults(handler=cmd_generate_documents)
+
+    partitions_parser = subparsers.add_parser('partitions', help='Manage yearly time entry files')
+    partitions_parser.add_argument('action', choices=['list', 'enable', 'detach', 'attach'])
+    partitions_parser.add_argument('year', type=int, nargs='?', help='Partition year')
+    partitions_parser.set_defaults(handler=cmd_partitions)
+
+    archive_parser = subparsers.add_parser('archive', help='Archive old time entries and notifications')
+    archive_parser.add_argument('--time-entries-days', type=int,
+                                help='Archive time entries older than this many days')
+    archive_parser.add_argument('--notifications-days', type=int,
+                                help='Archive read notifications older than this many days')
+    archive_parser.set_defaults(handler=cmd_archive)
+
+    backup_parser = subparsers.add_parser('backup', help='Manage online backups')
+    backup_parser.add_argument('action', choices=['create', 'list', 'verify', 'restore'])
+    backup_parser.add_argument('name', nargs='?', help='Backup name (default: newest for verify)')
+    backup_parser.add_argument('--target', help='Directory to restore files into')
+    backup_parser.set_defaults(handler=cmd_backup)
+
+    accrue_parser = subparsers.add_parser('accrue-leave', help='Open yearly leave balances')
+    accrue_parser.add_argument('--year', type=int, help='Year to accrue (default: current year)')
+    accrue_parser.add_argument('--show', action='store_true', help='Print the ledger for the year')
+    accrue_parser.set_defaults(handler=cmd_accrue_leave)
+
+    stats_parser = subparsers.add_parser('stats', help='Show record counts')
+    stats_parser.set_defaults(handler=cmd_stats)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    config = Config()
+    args = build_parser(config).parse_args(argv)
+    logger = setup_logger(config.get('log_file'), json_lines=config.get('log_json'),
+                          sampling=config.get('log_sampling'), queue_size=config.get('log_queue_size'))
+    logger.info(f"CLI command: {args.command}")
+
+    db = Database(args.db)
+    try:
+        db.create_tables()
+        return args.handler(args, db, config)
+    except (OSError, ValueError, KeyError, sqlite3.Error, ConflictError) as e:
+        logger.error(f"CLI command {args.command} failed: {e}")
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
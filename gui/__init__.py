@@ -10,6 +10,7 @@ from .time_tracking_tab import TimeTrackingTab
 from .leave_management_tab import LeaveManagementTab
 from .documents_tab import DocumentsTab
 from .notifications_tab import NotificationsTab
+from .reports_tab import ReportsTab
 
 
 __all__ = [
@@ -20,5 +21,6 @@ __all__ = [
     'LeaveManagementTab',
     'DocumentsTab',
     'NotificationsTab',
+    'ReportsTab',
 
 ]
\ No newline at end of file
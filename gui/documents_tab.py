@@ -3,22 +3,40 @@ Documents tab for Employee Management System
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 from datetime import datetime, date
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
-from models import Document, Employee
-from storage.database import Database
+from models import Document, Employee, LeaveRequest
+from storage.database import Database, ConflictError
+from storage.document_store import DocumentStore, DOCUMENT_TYPES, import_document_files
+from utils.business_calendar import business_days
+from utils.config import Config
+from utils.document_generator import DocumentGenerator
 
 class DocumentsTab:
     """Documents management tab"""
 
+    PAGE_SIZE = 200
+
     def __init__(self, parent, database: Database):
         self.parent = parent
         self.db = database
         self.selected_document_id = None
+        self.page = 0
+
+        # Document generator with cached templates
+        self.config = Config()
+        self.generator = DocumentGenerator(self.config.get('document_templates_dir'), self.config)
+        self.store = DocumentStore(self.config.get('document_store_dir'),
+                                   self.config.get('document_compression'))
+        self.document_hashes = {}
+
+        # Index documents generated before the catalog existed, on the first start only
+        import_document_files(self.db, self.config.get('generated_documents_dir'), once=True)
 
         # Create main frame
         self.frame = ttk.Frame(parent)
@@ -46,16 +64,7 @@ class DocumentsTab:
         ttk.Label(gen_frame, text="Document Type:").grid(row=0, column=2, padx=5, pady=5, sticky='w')
         self.doc_type_var = tk.StringVar()
         doc_type_combo = ttk.Combobox(gen_frame, textvariable=self.doc_type_var, width=25)
-        doc_type_combo['values'] = [
-            'Employment Contract',
-            'Service Contract',
-            'Work Contract',
-            'Employment Certificate',
-            'Salary Certificate',
-            'Leave Confirmation',
-            'Termination Letter',
-            'Reference Letter'
-        ]
+        doc_type_combo['values'] = DOCUMENT_TYPES
         doc_type_combo.set('Employment Certificate')
         doc_type_combo.grid(row=0, column=3, padx=5, pady=5)
 
@@ -113,6 +122,12 @@ class DocumentsTab:
         self.filter_employee_combo.pack(side='left', padx=5)
         self.filter_employee_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
 
+        # Pagination
+        ttk.Button(search_frame, text="Next >", command=self.next_page).pack(side='right', padx=5)
+        self.page_label = ttk.Label(search_frame, text="Page 1 of 1")
+        self.page_label.pack(side='right', padx=5)
+        ttk.Button(search_frame, text="< Previous", command=self.previous_page).pack(side='right', padx=5)
+
         # Create treeview with scrollbar
         tree_scroll = ttk.Scrollbar(list_frame)
         tree_scroll.pack(side='right', fill='y')
@@ -195,8 +210,8 @@ class DocumentsTab:
     def refresh_data(self):
         """Refresh all data"""
         # Refresh employee list
-        employees = self.db.get_all_employees()
-        employee_names = [f"{emp.first_name} {emp.last_name}" for emp in employees]
+        employees = self.db.get_employee_names()
+        employee_names = [emp.name for emp in employees]
 
         self.employee_combo['values'] = employee_names
         self.filter_employee_combo['values'] = ['All'] + employee_names
@@ -206,7 +221,7 @@ class DocumentsTab:
             self.filter_employee_combo.set('All')
 
         # Store employee mapping
-        self.employee_map = {f"{emp.first_name} {emp.last_name}": emp.id for emp in employees}
+        self.employee_map = {emp.name: emp.id for emp in employees}
 
         # Refresh documents list
         self.refresh_documents()
@@ -217,35 +232,32 @@ class DocumentsTab:
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        # Get all documents from database
-        # TODO: Implement get_all_documents in database.py
-        documents = []  # self.db.get_all_documents()
-
-        # Apply filters
-        search_term = self.search_var.get().lower()
+        # Get filter values
+        search_term = self.search_var.get().strip()
         employee_filter = self.filter_employee_var.get()
 
-        filtered_documents = []
-        for doc in documents:
-            # Apply search filter
-            if search_term:
-                if not any(search_term in str(getattr(doc, field, '')).lower()
-                          for field in ['document_type', 'document_name']):
-                    continue
+        employee_id = None
+        if employee_filter and employee_filter != 'All':
+            employee_id = self.employee_map.get(employee_filter)
 
-            # Apply employee filter
-            if employee_filter and employee_filter != 'All':
-                employee_id = self.employee_map.get(employee_filter)
-                if doc.employee_id != employee_id:
-                    continue
+        # Query one page of matching documents
+        total = self.db.count_documents(employee_id=employee_id, search=search_term or None)
+        last_page = max(0, (total - 1) // self.PAGE_SIZE)
+        self.page = min(self.page, last_page)
 
-            filtered_documents.append(doc)
+        filtered_documents = self.db.get_documents(
+            employee_id=employee_id,
+            search=search_term or None,
+            limit=self.PAGE_SIZE,
+            offset=self.page * self.PAGE_SIZE
+        )
 
         # Add to tree
+        self.document_hashes = {doc.id: doc.content_hash for doc in filtered_documents}
+        employee_names = {emp_id: name for name, emp_id in self.employee_map.items()}
         for doc in filtered_documents:
             # Get employee name
-            employee = self.db.get_employee(doc.employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
+            employee_name = employee_names.get(doc.employee_id, "Unknown")
 
             self.tree.insert('', 'end', values=(
                 doc.id,
@@ -257,7 +269,8 @@ class DocumentsTab:
             ))
 
         # Update statistics
-        self.stats_label.config(text=f"Total Documents: {len(filtered_documents)}")
+        self.stats_label.config(text=f"Total Documents: {total}")
+        self.page_label.config(text=f"Page {self.page + 1} of {last_page + 1}")
 
     def generate_document(self):
         """Generate document"""
@@ -284,26 +297,10 @@ class DocumentsTab:
             safe_name = employee_name.replace(' ', '_')
             filename = f"{doc_type.replace(' ', '_')}_{safe_name}_{timestamp}.txt"
 
-            # Save document
-            doc_path = os.path.join('documents', filename)
-            os.makedirs('documents', exist_ok=True)
-
-            with open(doc_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-
-            # Save to database
-            document = Document(
-                employee_id=employee_id,
-                document_type=doc_type,
-                document_name=filename,
-                file_path=doc_path,
-                generated_date=datetime.now()
-            )
+            # Store compressed content and record it in the database
+            document = self.store.save_document(self.db, employee_id, doc_type, filename, content)
 
-            # TODO: Implement create_document in database.py
-            # self.db.create_document(document)
-
-            messagebox.showinfo("Success", f"Document generated successfully!\n\nSaved to: {doc_path}")
+            messagebox.showinfo("Success", f"Document generated successfully!\n\nSaved as: {document.document_name}")
 
             # Refresh list
             self.refresh_documents()
@@ -313,134 +310,33 @@ class DocumentsTab:
 
     def create_document_content(self, employee: Employee, doc_type: str) -> str:
         """Create document content based on type"""
-        company_name = "Your Company Ltd."
-        company_address = "123 Business Street, City, Country"
-        current_date = date.today().strftime('%B %d, %Y')
+        notes = self.notes_text.get('1.0', 'end-1c')
 
         if doc_type == "Employment Certificate":
-            content = f"""
-{company_name}
-{company_address}
-
-EMPLOYMENT CERTIFICATE
-
-Date: {current_date}
-
-TO WHOM IT MAY CONCERN
-
-This is to certify that {employee.full_name} (PESEL: {employee.pesel}) has been employed 
-with {company_name} since {employee.hire_date.strftime('%B %d, %Y') if employee.hire_date else 'N/A'}.
-
-Current Position: {employee.position or 'N/A'}
-Department: {employee.department or 'N/A'}
-Employment Type: {employee.contract_type.value}
-
-{employee.first_name} {employee.last_name} is a valued member of our organization and 
-continues to be employed with us as of the date of this certificate.
-
-This certificate is issued upon request for {self.purpose_var.get() or 'official purposes'}.
-
-Additional Notes:
-{self.notes_text.get('1.0', 'end-1c')}
-
-Sincerely,
-
-_______________________
-HR Department
-{company_name}
-"""
+            return self.generator.generate_employment_certificate(
+                employee, purpose=self.purpose_var.get(), additional_notes=notes
+            )
 
         elif doc_type == "Leave Confirmation":
-            content = f"""
-{company_name}
-{company_address}
-
-LEAVE CONFIRMATION
-
-Date: {current_date}
-
-Employee Name: {employee.full_name}
-Employee ID: {employee.id}
-Department: {employee.department or 'N/A'}
-
-This letter confirms the approved leave for the above-mentioned employee.
-
-Leave Period: {self.period_from.get()} to {self.period_to.get()}
-Remaining Leave Balance: {employee.remaining_leave_days} days
-
-Additional Notes:
-{self.notes_text.get('1.0', 'end-1c')}
-
-Approved by:
-
-_______________________
-HR Department
-{company_name}
-"""
-
-        elif doc_type == "Employment Contract":
-            content = f"""
-EMPLOYMENT CONTRACT
-
-This Employment Contract is entered into on {current_date} between:
-
-EMPLOYER:
-{company_name}
-{company_address}
-
-EMPLOYEE:
-Name: {employee.full_name}
-PESEL: {employee.pesel}
-Address: {employee.address or 'N/A'}
-
-TERMS OF EMPLOYMENT:
-
-1. Position: {employee.position or 'To be determined'}
-2. Department: {employee.department or 'To be determined'}
-3. Start Date: {employee.hire_date.strftime('%B %d, %Y') if employee.hire_date else 'To be determined'}
-4. Contract Type: {employee.contract_type.value}
-5. Work Mode: {employee.work_mode.value}
-
-6. LEAVE ENTITLEMENT:
-   Annual Leave: {employee.annual_leave_days} days per year
-
-7. ADDITIONAL TERMS:
-{self.notes_text.get('1.0', 'end-1c')}
-
-This contract is subject to the labor laws and regulations of the jurisdiction.
-
-SIGNATURES:
-
-_______________________                 _______________________
-EMPLOYER                                EMPLOYEE
-{company_name}                          {employee.full_name}
-Date: _____________                     Date: _____________
-"""
-
-        else:
-            # Generic template
-            content = f"""
-{company_name}
-{company_address}
-
-{doc_type.upper()}
-
-Date: {current_date}
-
-Employee Information:
-Name: {employee.full_name}
-PESEL: {employee.pesel}
-Position: {employee.position or 'N/A'}
-Department: {employee.department or 'N/A'}
-
-{self.notes_text.get('1.0', 'end-1c')}
+            start_date = datetime.strptime(self.period_from.get().strip(), '%Y-%m-%d').date()
+            end_date = datetime.strptime(self.period_to.get().strip(), '%Y-%m-%d').date()
+            leave_request = LeaveRequest(
+                employee_id=employee.id,
+                start_date=start_date,
+                end_date=end_date,
+                days_count=business_days(start_date, end_date),
+                reason=self.purpose_var.get(),
+                status="Approved"
+            )
+            return self.generator.generate_leave_confirmation(
+                employee, leave_request, additional_notes=notes
+            )
 
-_______________________
-Authorized Signature
-{company_name}
-"""
+        elif doc_type in ("Employment Contract", "Service Contract", "Work Contract"):
+            return self.generator.generate_contract(employee, additional_terms=notes)
 
-        return content
+        # Generic template
+        return self.generator.generate_generic_document(employee, doc_type, additional_notes=notes)
 
     def preview_document(self):
         """Preview document before generation"""
@@ -454,6 +350,12 @@ Authorized Signature
         employee = self.db.get_employee(employee_id)
         doc_type = self.doc_type_var.get()
 
+        try:
+            content = self.create_document_content(employee, doc_type)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to preview document: {str(e)}")
+            return
+
         # Create preview window
         preview_window = tk.Toplevel(self.parent)
         preview_window.title(f"Document Preview - {doc_type}")
@@ -471,7 +373,6 @@ Authorized Signature
         text_scroll.config(command=preview_text.yview)
 
         # Insert document content
-        content = self.create_document_content(employee, doc_type)
         preview_text.insert('1.0', content)
         preview_text.config(state='disabled')
 
@@ -497,10 +398,23 @@ Authorized Signature
 
     def on_search(self, event=None):
         """Handle search"""
+        self.page = 0
         self.refresh_documents()
 
     def on_filter_change(self, event=None):
         """Handle filter change"""
+        self.page = 0
+        self.refresh_documents()
+
+    def previous_page(self):
+        """Show previous page of documents"""
+        if self.page > 0:
+            self.page -= 1
+            self.refresh_documents()
+
+    def next_page(self):
+        """Show next page of documents"""
+        self.page += 1
         self.refresh_documents()
 
     def on_document_select(self, event=None):
@@ -524,6 +438,13 @@ Authorized Signature
             item = self.tree.item(selection[0])
             file_path = item['values'][5]  # File path column
 
+            # Documents in the store are compressed, open a plain copy
+            content_hash = self.document_hashes.get(self.selected_document_id)
+            if content_hash and self.store.exists(content_hash):
+                export_dir = os.path.join(tempfile.gettempdir(), 'EmployeeManagement')
+                os.makedirs(export_dir, exist_ok=True)
+                file_path = self.store.export(content_hash, os.path.join(export_dir, item['values'][3]))
+
             if file_path and os.path.exists(file_path):
                 try:
                     os.startfile(file_path)  # Windows
@@ -567,8 +488,23 @@ Authorized Signature
             messagebox.showwarning("Warning", "Please select a document")
             return
 
-        # TODO: Implement rename dialog
-        messagebox.showinfo("Info", "Rename functionality to be implemented")
+        document = self.db.get_document(self.selected_document_id)
+        if not document:
+            messagebox.showerror("Error", "Document not found")
+            return
+
+        new_name = simpledialog.askstring("Rename Document", "New document name:",
+                                          initialvalue=document.document_name, parent=self.frame)
+        if new_name and new_name.strip() and new_name.strip() != document.document_name:
+            document.document_name = new_name.strip()
+            try:
+                if self.db.update_document(document):
+                    self.refresh_documents()
+                else:
+                    messagebox.showerror("Error", "Failed to rename document")
+            except ConflictError:
+                messagebox.showerror("Conflict", "The document was changed by another user. Please try again.")
+                self.refresh_documents()
 
     def delete_document(self):
         """Delete selected document"""
@@ -577,8 +513,15 @@ Authorized Signature
             return
 
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this document?"):
-            # TODO: Implement delete functionality
-            messagebox.showinfo("Info", "Delete functionality to be implemented")
+            document = self.db.get_document(self.selected_document_id)
+            if document and self.db.delete_document(document.id):
+                # Remove stored content once no other document references it
+                if document.content_hash and not self.db.count_documents_with_hash(document.content_hash):
+                    self.store.delete(document.content_hash)
+                self.selected_document_id = None
+                self.refresh_documents()
+            else:
+                messagebox.showerror("Error", "Failed to delete document")
 
     def manage_templates(self):
         """Manage document templates"""
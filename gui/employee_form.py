@@ -5,10 +5,12 @@ Employee form dialog for Employee Management System
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, date
+from typing import Optional
 from tkcalendar import DateEntry
 
 from models import Employee, ContractType, WorkMode
-from storage.database import Database
+from storage.database import Database, ConflictError
+from utils.notification_checker import NotificationChecker
 
 
 class EmployeeForm:
@@ -17,7 +19,7 @@ class EmployeeForm:
     def __init__(self, parent, database: Database, employee: Employee = None):
         self.db = database
         self.employee = employee
-        self.result = False
+        self.result: Optional[Employee] = None  # Saved employee
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -266,14 +268,23 @@ class EmployeeForm:
             if self.employee:
                 success = self.db.update_employee(employee)
             else:
-                employee_id = self.db.create_employee(employee)
-                success = employee_id is not None
+                # Create employee and its initial notifications together
+                with self.db.transaction():
+                    employee.id = self.db.create_employee(employee)
+                    NotificationChecker(self.db, None).check_employee(employee)
+                success = employee.id is not None
 
             if success:
-                self.result = True
+                self.result = employee
                 self.dialog.destroy()
             else:
                 messagebox.showerror("Error", "Failed to save employee")
 
+        except ConflictError:
+            messagebox.showerror(
+                "Conflict",
+                "This employee was changed by another user since the form was opened.\n\n"
+                "Close the form and open it again to edit the latest data."
+            )
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save employee: {str(e)}")
\ No newline at end of file
@@ -2,6 +2,7 @@
 Employee management tab for Employee Management System
 """
 
+import sqlite3
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime, date
@@ -10,6 +11,7 @@ from typing import Optional
 from models import Employee, ContractType, WorkMode
 from storage.database import Database
 from gui.employee_form import EmployeeForm
+from utils.employee_directory import EmployeeDirectory
 
 
 class EmployeeTab:
@@ -19,6 +21,7 @@ class EmployeeTab:
         self.parent = parent
         self.db = database
         self.selected_employee_id = None
+        self.directory = EmployeeDirectory(database)
 
         # Create main frame
         self.frame = ttk.Frame(parent)
@@ -128,33 +131,24 @@ class EmployeeTab:
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        # Get all employees
-        employees = self.db.get_all_employees()
+        # Load employees as columns, reloading only if they changed elsewhere
+        self.directory.refresh()
 
         # Get unique departments
-        departments = set(emp.department for emp in employees if emp.department)
-        self.dept_combo['values'] = ['All'] + sorted(departments)
+        departments = [name for name in self.directory.categories('department') if name]
+        self.dept_combo['values'] = ['All'] + departments
 
         # Apply filters
-        search_term = self.search_var.get().lower()
         dept_filter = self.dept_var.get()
-
-        filtered_employees = []
-        for emp in employees:
-            # Apply search filter
-            if search_term:
-                if not any(search_term in str(getattr(emp, field, '')).lower()
-                           for field in ['first_name', 'last_name', 'pesel', 'position']):
-                    continue
-
-            # Apply department filter
-            if dept_filter and dept_filter != 'All' and emp.department != dept_filter:
-                continue
-
-            filtered_employees.append(emp)
+        if dept_filter and dept_filter != 'All':
+            mask = self.directory.mask(search=self.search_var.get(), department=dept_filter)
+        else:
+            mask = self.directory.mask(search=self.search_var.get())
+        rows = self.directory.rows(mask)
 
         # Add employees to tree
-        for emp in filtered_employees:
+        for row in rows:
+            emp = self.directory.list_row(row)
             tags = []
 
             # Check contract expiry
@@ -167,17 +161,17 @@ class EmployeeTab:
 
             self.tree.insert('', 'end', values=(
                 emp.id,
-                emp.full_name,
+                emp.name,
                 emp.pesel,
-                emp.position or '',
-                emp.department or '',
-                emp.contract_type.value,
+                emp.position,
+                emp.department,
+                emp.contract_type,
                 emp.hire_date.strftime('%Y-%m-%d') if emp.hire_date else '',
                 emp.contract_end_date.strftime('%Y-%m-%d') if emp.contract_end_date else ''
             ), tags=tags)
 
         # Update statistics
-        self.stats_label.config(text=f"Total Employees: {len(filtered_employees)}")
+        self.stats_label.config(text=f"Total Employees: {len(rows)}")
 
     def on_search(self, event=None):
         """Handle search"""
@@ -210,6 +204,7 @@ class EmployeeTab:
         """Add new employee"""
         form = EmployeeForm(self.parent, self.db)
         if form.result:
+            self.directory.upsert(form.result)
             self.refresh_employee_list()
             messagebox.showinfo("Success", "Employee added successfully!")
 
@@ -223,6 +218,7 @@ class EmployeeTab:
         if employee:
             form = EmployeeForm(self.parent, self.db, employee)
             if form.result:
+                self.directory.upsert(form.result)
                 self.refresh_employee_list()
                 messagebox.showinfo("Success", "Employee updated successfully!")
 
@@ -236,7 +232,19 @@ class EmployeeTab:
         if employee:
             if messagebox.askyesno("Confirm Delete",
                                    f"Are you sure you want to delete {employee.full_name}?"):
-                if self.db.delete_employee(self.selected_employee_id):
+                try:
+                    deleted = self.db.delete_employee(self.selected_employee_id)
+                except sqlite3.IntegrityError:
+                    messagebox.showerror(
+                        "Error",
+                        "Cannot delete an employee who still has time entries, leave requests or documents"
+                    )
+                    return
+                except sqlite3.Error as e:
+                    messagebox.showerror("Error", f"Failed to delete employee: {str(e)}")
+                    return
+                if deleted:
+                    self.directory.remove(self.selected_employee_id)
                     self.refresh_employee_list()
                     messagebox.showinfo("Success", "Employee deleted successfully!")
                 else:
@@ -0,0 +1,119 @@
+"""
+Leave calendar dialog for Employee Management System
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from datetime import date, timedelta
+
+from utils.availability import AvailabilityEngine
+from utils.business_calendar import is_business_day
+from utils.config import Config
+
+
+class LeaveCalendar:
+    """Daily absences per department for a quarter"""
+
+    def __init__(self, parent, engine: AvailabilityEngine):
+        self.engine = engine
+        config = Config()
+        self.minimum_ratio = config.get('minimum_staffing_ratio', 0.5)
+        self.minimums = config.get('minimum_staffing', {})
+
+        # Create dialog window
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Leave Calendar")
+        self.dialog.geometry("900x600")
+        self.dialog.transient(parent)
+
+        self.create_controls()
+        self.create_calendar()
+
+        today = date.today()
+        self.year_var.set(today.year)
+        self.quarter_var.set(f"Q{(today.month - 1) // 3 + 1}")
+        self.refresh()
+
+    def create_controls(self):
+        """Create quarter selection"""
+        control_frame = ttk.Frame(self.dialog)
+        control_frame.pack(fill='x', padx=10, pady=5)
+
+        ttk.Label(control_frame, text="Year:").pack(side='left', padx=5)
+        self.year_var = tk.IntVar()
+        ttk.Spinbox(control_frame, from_=2000, to=2100, textvariable=self.year_var,
+                    width=6, command=self.refresh).pack(side='left', padx=5)
+
+        ttk.Label(control_frame, text="Quarter:").pack(side='left', padx=5)
+        self.quarter_var = tk.StringVar()
+        quarter_combo = ttk.Combobox(control_frame, textvariable=self.quarter_var, width=5, state='readonly')
+        quarter_combo['values'] = ['Q1', 'Q2', 'Q3', 'Q4']
+        quarter_combo.pack(side='left', padx=5)
+        quarter_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh())
+
+        self.warning_label = ttk.Label(control_frame, text="", foreground='red')
+        self.warning_label.pack(side='right', padx=5)
+
+    def create_calendar(self):
+        """Create day by department table"""
+        calendar_frame = ttk.Frame(self.dialog)
+        calendar_frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+        y_scroll = ttk.Scrollbar(calendar_frame)
+        y_scroll.pack(side='right', fill='y')
+        x_scroll = ttk.Scrollbar(calendar_frame, orient='horizontal')
+        x_scroll.pack(side='bottom', fill='x')
+
+        self.tree = ttk.Treeview(
+            calendar_frame,
+            yscrollcommand=y_scroll.set,
+            xscrollcommand=x_scroll.set,
+            show='headings'
+        )
+        y_scroll.config(command=self.tree.yview)
+        x_scroll.config(command=self.tree.xview)
+        self.tree.tag_configure('understaffed', background='#ffcccc')
+        self.tree.tag_configure('non_working', foreground='gray')
+        self.tree.pack(fill='both', expand=True)
+
+    def refresh(self):
+        """Show absences for the selected quarter"""
+        try:
+            year = int(self.year_var.get())
+        except (tk.TclError, ValueError):
+            return
+        quarter = int(self.quarter_var.get()[1])
+        start = date(year, 3 * quarter - 2, 1)
+        end = (date(year + 1, 1, 1) if quarter == 4 else date(year, 3 * quarter + 1, 1)) - timedelta(days=1)
+
+        departments = self.engine.all_departments(start, end)
+        warnings = self.engine.staffing_warnings(start, end, self.minimum_ratio, self.minimums)
+        understaffed = {(department, day) for department, day, _, _ in warnings}
+
+        # Rebuild columns for the departments
+        self.tree.delete(*self.tree.get_children())
+        columns = ['Date'] + list(departments)
+        self.tree['columns'] = columns
+        self.tree.heading('Date', text='Date', anchor='w')
+        self.tree.column('Date', width=110, stretch=False)
+        for name in departments:
+            self.tree.heading(name, text=name, anchor='center')
+            self.tree.column(name, width=110, anchor='center', stretch=False)
+
+        for index in range((end - start).days + 1):
+            day = start + timedelta(days=index)
+            values = [day.strftime('%Y-%m-%d %a')]
+            for availability in departments.values():
+                values.append(f"{availability.absent[index]} / {availability.headcount}")
+            if any((name, day) in understaffed for name in departments):
+                tags = ('understaffed',)
+            elif not is_business_day(day):
+                tags = ('non_working',)
+            else:
+                tags = ()
+            self.tree.insert('', 'end', values=values, tags=tags)
+
+        days = len({day for _, day, _, _ in warnings})
+        self.warning_label.config(
+            text=f"Below minimum staffing on {days} working days" if warnings else ""
+        )
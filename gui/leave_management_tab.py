@@ -3,12 +3,28 @@ Leave management tab for Employee Management System
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime, date, timedelta
+from typing import Dict, List
 from tkcalendar import DateEntry
 
+from gui.leave_calendar import LeaveCalendar
 from models import LeaveRequest, LeaveType, Employee
 from storage.database import Database
+from storage.document_store import DocumentStore
+from utils.availability import AvailabilityEngine
+from utils.business_calendar import business_days
+from utils.config import Config
+from utils.document_generator import DocumentGenerator
+from utils.leave_index import LeaveIndex, find_overlapping_requests
+
+# Why a bulk action skipped a request
+OUTCOME_REASONS = {
+    'not_pending': 'no longer pending',
+    'not_found': 'not found',
+    'overlaps': 'overlaps approved leave',
+}
+
 
 class LeaveManagementTab:
     """Leave management tab"""
@@ -17,6 +33,16 @@ class LeaveManagementTab:
         self.parent = parent
         self.db = database
         self.selected_request_id = None
+        self.selected_request_ids: List[int] = []
+        self.leave_index = LeaveIndex(database)
+        self.availability = AvailabilityEngine(database)
+
+        # Confirmation letters
+        config = Config()
+        self.minimum_staffing_ratio = config.get('minimum_staffing_ratio', 0.5)
+        self.minimum_staffing = config.get('minimum_staffing', {})
+        self.generator = DocumentGenerator(config.get('document_templates_dir'), config)
+        self.store = DocumentStore(config.get('document_store_dir'), config.get('document_compression'))
 
         # Create main frame
         self.frame = ttk.Frame(parent)
@@ -131,7 +157,7 @@ class LeaveManagementTab:
         self.tree = ttk.Treeview(
             list_frame,
             yscrollcommand=tree_scroll.set,
-            selectmode='browse'
+            selectmode='extended'
         )
         tree_scroll.config(command=self.tree.yview)
 
@@ -186,7 +212,9 @@ class LeaveManagementTab:
     def show_context_menu(self, event):
         """Show context menu"""
         try:
-            self.tree.selection_set(self.tree.identify_row(event.y))
+            row = self.tree.identify_row(event.y)
+            if row not in self.tree.selection():
+                self.tree.selection_set(row)
             self.context_menu.post(event.x_root, event.y_root)
         except:
             pass
@@ -206,16 +234,20 @@ class LeaveManagementTab:
         self.rejected_label = ttk.Label(summary_frame, text="Rejected: 0")
         self.rejected_label.pack(side='left', padx=10, pady=5)
 
+        self.off_label = ttk.Label(summary_frame, text="Employees off: 0")
+        self.off_label.pack(side='left', padx=10, pady=5)
+
         # Action buttons
         ttk.Button(summary_frame, text="Approve Selected", command=self.approve_request).pack(side='right', padx=5, pady=5)
         ttk.Button(summary_frame, text="Reject Selected", command=self.reject_request).pack(side='right', padx=5, pady=5)
         ttk.Button(summary_frame, text="Export Report", command=self.export_report).pack(side='right', padx=5, pady=5)
+        ttk.Button(summary_frame, text="Leave Calendar", command=self.show_calendar).pack(side='right', padx=5, pady=5)
 
     def refresh_data(self):
         """Refresh all data"""
         # Refresh employee lists
-        employees = self.db.get_all_employees()
-        employee_names = [f"{emp.first_name} {emp.last_name}" for emp in employees]
+        employees = self.db.get_employee_names()
+        employee_names = [emp.name for emp in employees]
 
         self.employee_combo['values'] = employee_names
         self.filter_employee_combo['values'] = ['All'] + employee_names
@@ -225,7 +257,8 @@ class LeaveManagementTab:
             self.filter_employee_combo.set('All')
 
         # Store employee mapping
-        self.employee_map = {f"{emp.first_name} {emp.last_name}": emp for emp in employees}
+        self.employee_map = {emp.name: emp for emp in employees}
+        self.employee_names = {emp.id: emp.name for emp in employees}
 
         # Refresh leave requests
         self.refresh_requests()
@@ -252,17 +285,11 @@ class LeaveManagementTab:
         # Get status filter
         status = None if status_filter == 'All' else status_filter
 
-        # Get all leave requests
-        requests = self.db.get_leave_requests(employee_id, status)
-
-        # Apply date filter
+        # Get leave requests overlapping the date range
         from_date = self.filter_from_date.get_date()
         to_date = self.filter_to_date.get_date()
-
-        filtered_requests = []
-        for req in requests:
-            if from_date <= req.start_date <= to_date:
-                filtered_requests.append(req)
+        request_ids = self.leave_index.requests_in_range(from_date, to_date, employee_id, status)
+        filtered_requests = self.db.get_leave_requests_by_ids(request_ids)
 
         # Count by status
         pending_count = sum(1 for r in filtered_requests if r.status == 'Pending')
@@ -272,8 +299,7 @@ class LeaveManagementTab:
         # Add to tree
         for request in filtered_requests:
             # Get employee name
-            employee = self.db.get_employee(request.employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
+            employee_name = self.employee_names.get(request.employee_id, "Unknown")
 
             # Determine tag
             tag = request.status.lower()
@@ -295,12 +321,14 @@ class LeaveManagementTab:
         self.pending_label.config(text=f"Pending: {pending_count}")
         self.approved_label.config(text=f"Approved: {approved_count}")
         self.rejected_label.config(text=f"Rejected: {rejected_count}")
+        self.off_label.config(text=f"Employees off: {len(self.leave_index.employees_off(from_date, to_date))}")
 
     def on_employee_select(self, event=None):
         """Handle employee selection"""
         employee_name = self.employee_var.get()
         if employee_name:
-            employee = self.employee_map.get(employee_name)
+            entry = self.employee_map.get(employee_name)
+            employee = self.db.get_employee(entry.id) if entry else None
             if employee:
                 self.balance_label.config(text=str(employee.remaining_leave_days))
 
@@ -310,13 +338,8 @@ class LeaveManagementTab:
         end = self.end_date.get_date()
 
         if start and end and end >= start:
-            # Calculate business days
-            days = 0
-            current = start
-            while current <= end:
-                if current.weekday() < 5:  # Monday to Friday
-                    days += 1
-                current += timedelta(days=1)
+            # Calculate business days, excluding public holidays
+            days = business_days(start, end)
 
             self.days_label.config(text=str(days))
         else:
@@ -330,7 +353,8 @@ class LeaveManagementTab:
             messagebox.showerror("Error", "Please select an employee")
             return
 
-        employee = self.employee_map.get(employee_name)
+        entry = self.employee_map.get(employee_name)
+        employee = self.db.get_employee(entry.id) if entry else None
         if not employee:
             messagebox.showerror("Error", "Invalid employee selection")
             return
@@ -356,6 +380,28 @@ class LeaveManagementTab:
                                       f"Request exceeds available balance ({employee.remaining_leave_days} days). Continue?"):
                 return
 
+        # Reject overlaps with the employee's pending or approved requests
+        overlapping = find_overlapping_requests(self.db, employee.id, start, end, self.leave_index)
+        if overlapping:
+            details = "\n".join(
+                f"{r.leave_type.value} {r.start_date:%Y-%m-%d} - {r.end_date:%Y-%m-%d} ({r.status})"
+                for r in overlapping
+            )
+            messagebox.showerror("Error", f"Request overlaps with existing leave:\n{details}")
+            return
+
+        # Warn if the department would drop below minimum staffing
+        warnings = self.availability.staffing_warnings(
+            start, end, self.minimum_staffing_ratio, self.minimum_staffing,
+            department=employee.department or '(none)', extra_absent=1
+        )
+        if warnings:
+            days = ", ".join(day.strftime('%Y-%m-%d') for _, day, _, _ in warnings[:5])
+            if not messagebox.askyesno("Warning",
+                                       f"{employee.department or 'The department'} would be below minimum "
+                                       f"staffing on {len(warnings)} working days ({days}). Continue?"):
+                return
+
         # Create request
         request = LeaveRequest(
             employee_id=employee.id,
@@ -368,7 +414,8 @@ class LeaveManagementTab:
         )
 
         try:
-            self.db.create_leave_request(request)
+            request.id = self.db.create_leave_request(request)
+            self.leave_index.add_request(request, employee.department)
             messagebox.showinfo("Success", "Leave request submitted successfully")
             self.clear_form()
             self.refresh_requests()
@@ -385,11 +432,8 @@ class LeaveManagementTab:
     def on_request_select(self, event=None):
         """Handle request selection"""
         selection = self.tree.selection()
-        if selection:
-            item = self.tree.item(selection[0])
-            self.selected_request_id = item['values'][0]
-        else:
-            self.selected_request_id = None
+        self.selected_request_ids = [self.tree.item(item)['values'][0] for item in selection]
+        self.selected_request_id = self.selected_request_ids[0] if selection else None
 
     def on_request_double_click(self, event=None):
         """Handle double click on request"""
@@ -405,42 +449,101 @@ class LeaveManagementTab:
         messagebox.showinfo("Info", "Detailed view to be implemented")
 
     def approve_request(self):
-        """Approve selected request"""
-        if not self.selected_request_id:
+        """Approve selected requests"""
+        if not self.selected_request_ids:
             messagebox.showwarning("Warning", "Please select a request to approve")
             return
 
-        if messagebox.askyesno("Confirm", "Approve this leave request?"):
+        count = len(self.selected_request_ids)
+        if messagebox.askyesno("Confirm", "Approve this leave request?" if count == 1
+                               else f"Approve {count} leave requests?"):
             try:
-                # TODO: Get actual approver name from logged-in user
-                success = self.db.approve_leave_request(self.selected_request_id, "Manager")
-                if success:
-                    messagebox.showinfo("Success", "Leave request approved")
-                    self.refresh_requests()
-                    self.refresh_data()  # Update balances
-                else:
-                    messagebox.showerror("Error", "Failed to approve request")
+                # Approve and store the confirmation letters in one transaction
+                with self.db.transaction(immediate=True):
+                    # TODO: Get actual approver name from logged-in user
+                    outcomes = self.db.approve_leave_requests(self.selected_request_ids, "Manager")
+                    for request_id, outcome in outcomes.items():
+                        if outcome == 'approved':
+                            self.create_confirmation_document(request_id)
+                for request_id, outcome in outcomes.items():
+                    if outcome == 'approved':
+                        self.leave_index.set_status(request_id, 'Approved')
+                self.show_outcomes(outcomes, 'approved')
+                self.refresh_data()  # Update balances
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to approve request: {str(e)}")
 
+    def create_confirmation_document(self, request_id: int):
+        """Generate and store leave confirmation letter for a request"""
+        request = self.db.get_leave_request(request_id)
+        employee = self.db.get_employee(request.employee_id) if request else None
+        if not employee:
+            return
+
+        content = self.generator.generate_leave_confirmation(employee, request)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"Leave_Confirmation_{employee.full_name.replace(' ', '_')}_{request.id}_{timestamp}.txt"
+        self.store.save_document(self.db, employee.id, "Leave Confirmation", filename, content)
+
     def reject_request(self):
-        """Reject selected request"""
-        if not self.selected_request_id:
+        """Reject selected requests"""
+        if not self.selected_request_ids:
             messagebox.showwarning("Warning", "Please select a request to reject")
             return
 
-        # TODO: Implement rejection with reason
-        messagebox.showinfo("Info", "Rejection functionality to be implemented")
+        reason = simpledialog.askstring("Reject", "Reason for rejection:", parent=self.frame)
+        if reason is None:
+            return
+
+        try:
+            # TODO: Get actual approver name from logged-in user
+            outcomes = self.db.reject_leave_requests(self.selected_request_ids, "Manager", reason.strip() or None)
+            for request_id, outcome in outcomes.items():
+                if outcome == 'rejected':
+                    self.leave_index.set_status(request_id, 'Rejected')
+            self.show_outcomes(outcomes, 'rejected')
+            self.refresh_requests()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to reject request: {str(e)}")
 
     def delete_request(self):
-        """Delete selected request"""
-        if not self.selected_request_id:
+        """Delete selected requests"""
+        if not self.selected_request_ids:
             messagebox.showwarning("Warning", "Please select a request to delete")
             return
 
-        if messagebox.askyesno("Confirm", "Delete this leave request?"):
-            # TODO: Implement delete functionality
-            messagebox.showinfo("Info", "Delete functionality to be implemented")
+        count = len(self.selected_request_ids)
+        if messagebox.askyesno("Confirm", "Delete this leave request?" if count == 1
+                               else f"Delete {count} leave requests?"):
+            try:
+                outcomes = self.db.delete_leave_requests(self.selected_request_ids)
+                for request_id in outcomes:
+                    self.leave_index.remove_request(request_id)
+                self.show_outcomes(outcomes, 'deleted')
+                self.refresh_data()  # Approved days go back to the balances
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to delete request: {str(e)}")
+
+    def show_outcomes(self, outcomes: Dict[int, str], done: str):
+        """Summarize the result of a bulk action"""
+        succeeded = sum(1 for outcome in outcomes.values() if outcome == done)
+        failed = [
+            f"#{request_id}: {OUTCOME_REASONS.get(outcome, outcome)}"
+            for request_id, outcome in outcomes.items() if outcome != done
+        ]
+        if not failed:
+            messagebox.showinfo("Success", f"Leave request {done}" if succeeded == 1
+                                else f"{succeeded} leave requests {done}")
+        else:
+            details = "\n".join(failed[:10])
+            if len(failed) > 10:
+                details += f"\n... and {len(failed) - 10} more"
+            messagebox.showwarning("Warning", f"{succeeded} of {len(outcomes)} leave requests {done}.\n\n{details}")
+            self.refresh_requests()
+
+    def show_calendar(self):
+        """Show daily absences per department"""
+        LeaveCalendar(self.frame, self.availability)
 
     def apply_filters(self):
         """Apply filters"""
@@ -11,7 +11,14 @@ from gui.time_tracking_tab import TimeTrackingTab
 from gui.leave_management_tab import LeaveManagementTab
 from gui.documents_tab import DocumentsTab
 from gui.notifications_tab import NotificationsTab
+from gui.reports_tab import ReportsTab
+from storage.backup import BackupManager
 from storage.database import Database
+from utils.backup_scheduler import BackupScheduler
+from utils.config import Config
+from utils.kpi_service import KpiService
+from utils.leave_accrual import LeaveAccrual
+from utils.logger import get_logger
 from utils.notification_checker import NotificationChecker
 
 class MainWindow:
@@ -20,6 +27,11 @@ class MainWindow:
     def __init__(self, root: tk.Tk, database: Database):
         self.root = root
         self.db = database
+        config = Config()
+        self.kpi_service = KpiService(database, config.get('contract_expiry_warning_days', 30))
+        self.kpi_reconcile_interval = config.get('kpi_reconcile_interval', 900)
+        self.leave_accrual = LeaveAccrual(database, config.get('leave_carry_over_cap'))
+        self.accrue_leave()
 
         # Create main container
         self.main_frame = ttk.Frame(root)
@@ -42,6 +54,23 @@ class MainWindow:
         self.notification_checker = NotificationChecker(self.db, self.update_notifications)
         self.notification_checker.start()
 
+        # Start scheduled backups
+        self.backup_scheduler = None
+        if config.get('backup_interval_hours'):
+            self.backup_scheduler = BackupScheduler(
+                BackupManager(
+                    self.db.db_path,
+                    backup_dir=config.get('backup_dir'),
+                    pages_per_step=config.get('backup_pages_per_step'),
+                    step_sleep=config.get('backup_step_sleep_ms') / 1000,
+                    keep=config.get('backup_keep'),
+                    compress=config.get('backup_compress')
+                ),
+                config.get('backup_interval_hours'),
+                verify=config.get('backup_verify')
+            )
+            self.backup_scheduler.start()
+
     def create_header(self):
         """Create application header"""
         header_frame = ttk.Frame(self.main_frame)
@@ -55,6 +84,18 @@ class MainWindow:
         )
         title_label.pack(side='left')
 
+        # Dashboard counters
+        kpi_frame = ttk.Frame(header_frame)
+        kpi_frame.pack(side='left', padx=30)
+        self.kpi_labels = {}
+        for name, caption in (('headcount', "Employees"), ('attendance_today', "Present today"),
+                              ('on_leave', "On leave"), ('expiring_contracts', "Contracts expiring")):
+            box = ttk.Frame(kpi_frame)
+            box.pack(side='left', padx=10)
+            self.kpi_labels[name] = ttk.Label(box, text="-", font=('Arial', 14, 'bold'))
+            self.kpi_labels[name].pack()
+            ttk.Label(box, text=caption, font=('Arial', 8)).pack()
+
         # Date and time
         self.datetime_label = ttk.Label(
             header_frame,
@@ -63,8 +104,9 @@ class MainWindow:
         )
         self.datetime_label.pack(side='right')
 
-        # Update datetime every minute
+        # Update datetime and counters every minute
         self.update_datetime()
+        self.root.after(self.kpi_reconcile_interval * 1000, self.reconcile_kpis)
 
     def create_tabs(self):
         """Create all application tabs"""
@@ -88,6 +130,10 @@ class MainWindow:
         self.notifications_tab = NotificationsTab(self.notebook, self.db)
         self.notebook.add(self.notifications_tab.frame, text="Notifications")
 
+        # Reports tab
+        self.reports_tab = ReportsTab(self.notebook, self.db)
+        self.notebook.add(self.reports_tab.frame, text="Reports")
+
         # Bind tab change event
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
@@ -117,8 +163,36 @@ class MainWindow:
     def update_datetime(self):
         """Update datetime display"""
         self.datetime_label.config(text=datetime.now().strftime('%Y-%m-%d %H:%M'))
+        self.update_kpis()
         self.root.after(60000, self.update_datetime)  # Update every minute
 
+    def update_kpis(self):
+        """Update dashboard counters in the header"""
+        try:
+            kpis = self.kpi_service.current()
+        except Exception as e:
+            get_logger().error(f"Reading KPI counters failed: {e}")
+            return
+        for name, label in self.kpi_labels.items():
+            label.config(text=str(kpis.get(name, '-')))
+
+    def reconcile_kpis(self):
+        """Correct counter drift periodically"""
+        try:
+            self.kpi_service.reconcile()
+        except Exception as e:
+            get_logger().error(f"KPI reconciliation failed: {e}")
+        self.update_kpis()
+        self.root.after(self.kpi_reconcile_interval * 1000, self.reconcile_kpis)
+
+    def accrue_leave(self):
+        """Open the new year's leave balances once the year turns"""
+        try:
+            self.leave_accrual.ensure_current_year()
+        except Exception as e:
+            get_logger().error(f"Leave accrual failed: {e}")
+        self.root.after(3600 * 1000, self.accrue_leave)
+
     def update_notifications(self, count: int):
         """Update notifications indicator"""
         if count > 0:
@@ -131,6 +205,7 @@ class MainWindow:
         """Handle tab change event"""
         selected_tab = event.widget.tab('current')['text']
         self.status_message.config(text=f"Viewing {selected_tab}")
+        self.update_kpis()
 
         # Refresh data in the selected tab
         if selected_tab == "Employees":
@@ -141,3 +216,5 @@ class MainWindow:
             self.leave_management_tab.refresh_data()
         elif selected_tab == "Notifications":
             self.notifications_tab.refresh_notifications()
+        elif selected_tab == "Reports":
+            self.reports_tab.refresh_report()
@@ -43,6 +43,10 @@ class NotificationsTab:
             'Contract Expiry',
             'Medical Exam',
             'Safety Training',
+            'Daily Overtime',
+            'Weekly Overtime',
+            'Daily Rest',
+            'Weekly Rest',
             'Leave Request',
             'Document Expiry',
             'Other'
@@ -204,12 +208,12 @@ class NotificationsTab:
             self.tree.delete(item)
 
         # Get employees for combo
-        employees = self.db.get_all_employees()
-        employee_names = ['All'] + [f"{emp.first_name} {emp.last_name}" for emp in employees]
+        employees = self.db.get_employee_names()
+        employee_names = ['All'] + [emp.name for emp in employees]
         self.employee_combo['values'] = employee_names
 
         # Store employee mapping
-        self.employee_map = {emp.id: f"{emp.first_name} {emp.last_name}" for emp in employees}
+        self.employee_map = {emp.id: emp.name for emp in employees}
 
         # Get all notifications
         all_notifications = self.db.get_pending_notifications()
@@ -0,0 +1,121 @@
+"""
+Reports tab for Employee Management System
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox
+from datetime import date, timedelta
+from tkcalendar import DateEntry
+
+from storage.database import Database
+from utils.reports import REPORTS, ReportEngine
+
+
+class ReportsTab:
+    """Aggregate reports tab"""
+
+    def __init__(self, parent, database: Database):
+        self.parent = parent
+        self.db = database
+        self.engine = ReportEngine(database)
+        self.report_keys = {definition.title: key for key, definition in REPORTS.items()}
+
+        # Create main frame
+        self.frame = ttk.Frame(parent)
+
+        # Create UI components
+        self.create_selection_frame()
+        self.create_report_view()
+
+        # Load initial data
+        self.refresh_report()
+
+    def create_selection_frame(self):
+        """Create report selection frame"""
+        selection_frame = ttk.LabelFrame(self.frame, text="Report")
+        selection_frame.pack(fill='x', padx=10, pady=5)
+
+        # Report selection
+        ttk.Label(selection_frame, text="Report:").grid(row=0, column=0, padx=5, pady=5, sticky='w')
+        self.report_var = tk.StringVar()
+        report_combo = ttk.Combobox(selection_frame, textvariable=self.report_var,
+                                    width=30, state='readonly')
+        report_combo['values'] = list(self.report_keys)
+        report_combo.set(next(iter(self.report_keys)))
+        report_combo.grid(row=0, column=1, padx=5, pady=5)
+        report_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_report())
+
+        # Date range
+        ttk.Label(selection_frame, text="From:").grid(row=0, column=2, padx=5, pady=5, sticky='w')
+        self.start_date = DateEntry(selection_frame, width=12, background='darkblue',
+                                    foreground='white', borderwidth=2)
+        self.start_date.set_date(date.today().replace(day=1) - timedelta(days=365))
+        self.start_date.grid(row=0, column=3, padx=5, pady=5)
+
+        ttk.Label(selection_frame, text="To:").grid(row=0, column=4, padx=5, pady=5, sticky='w')
+        self.end_date = DateEntry(selection_frame, width=12, background='darkblue',
+                                  foreground='white', borderwidth=2)
+        self.end_date.grid(row=0, column=5, padx=5, pady=5)
+
+        ttk.Button(selection_frame, text="Show", command=self.refresh_report).grid(row=0, column=6, padx=5, pady=5)
+
+        # Report description
+        self.description_label = ttk.Label(selection_frame, text="", foreground='gray')
+        self.description_label.grid(row=1, column=0, columnspan=7, padx=5, pady=2, sticky='w')
+
+    def create_report_view(self):
+        """Create report table"""
+        view_frame = ttk.LabelFrame(self.frame, text="Results")
+        view_frame.pack(fill='both', expand=True, padx=10, pady=5)
+
+        # Create treeview with scrollbar
+        tree_scroll = ttk.Scrollbar(view_frame)
+        tree_scroll.pack(side='right', fill='y')
+
+        self.tree = ttk.Treeview(
+            view_frame,
+            yscrollcommand=tree_scroll.set,
+            selectmode='browse',
+            show='headings'
+        )
+        tree_scroll.config(command=self.tree.yview)
+        self.tree.tag_configure('total', font=('Arial', 9, 'bold'))
+        self.tree.pack(fill='both', expand=True)
+
+        # Status line
+        self.status_label = ttk.Label(self.frame, text="")
+        self.status_label.pack(fill='x', padx=10, pady=(0, 5))
+
+    def refresh_report(self):
+        """Show selected report"""
+        key = self.report_keys.get(self.report_var.get())
+        if key is None:
+            return
+
+        try:
+            result = self.engine.run(key, self.start_date.get_date(), self.end_date.get_date())
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to run report: {str(e)}")
+            return
+
+        definition = result.definition
+        self.description_label.config(text=definition.description)
+        self.start_date.config(state='normal' if definition.uses_dates else 'disabled')
+        self.end_date.config(state='normal' if definition.uses_dates else 'disabled')
+
+        # Rebuild columns for this report
+        self.tree.delete(*self.tree.get_children())
+        self.tree['columns'] = definition.columns
+        for index, col in enumerate(definition.columns):
+            self.tree.heading(col, text=col, anchor='w' if index == 0 else 'center')
+            self.tree.column(col, width=200 if index == 0 else 110, anchor='w' if index == 0 else 'center')
+
+        for row in result.rows:
+            self.tree.insert('', 'end', values=row)
+        if result.rows:
+            self.tree.insert('', 'end', values=result.totals, tags=('total',))
+
+        source = "cached" if result.cached else "computed"
+        self.status_label.config(
+            text=f"{len(result.rows)} rows, {source} at {result.generated_at.strftime('%H:%M:%S')}"
+        )
@@ -9,6 +9,7 @@ from tkcalendar import DateEntry
 
 from models import TimeEntry, WorkMode, Employee
 from storage.database import Database
+from utils.analytics import TimeEntryArrays, summarize_hours
 
 
 class TimeTrackingTab:
@@ -205,8 +206,8 @@ class TimeTrackingTab:
     def refresh_data(self):
         """Refresh all data"""
         # Refresh employee lists
-        employees = self.db.get_all_employees()
-        employee_names = ['All'] + [f"{emp.first_name} {emp.last_name}" for emp in employees]
+        employees = self.db.get_employee_names()
+        employee_names = ['All'] + [emp.name for emp in employees]
 
         self.employee_combo['values'] = employee_names[1:]  # Exclude 'All' for entry
         self.filter_employee_combo['values'] = employee_names
@@ -216,7 +217,7 @@ class TimeTrackingTab:
             self.filter_employee_combo.set('All')
 
         # Store employee mapping
-        self.employee_map = {f"{emp.first_name} {emp.last_name}": emp.id for emp in employees}
+        self.employee_map = {emp.name: emp.id for emp in employees}
 
         # Refresh time entries
         self.refresh_time_entries()
@@ -237,26 +238,18 @@ class TimeTrackingTab:
         if filter_employee and filter_employee != 'All':
             employee_id = self.employee_map.get(filter_employee)
 
-        # Get time entries
-        if employee_id:
-            entries = self.db.get_time_entries(employee_id, start_date, end_date)
-        else:
-            # Get entries for all employees
-            entries = []
-            for emp_id in self.employee_map.values():
-                entries.extend(self.db.get_time_entries(emp_id, start_date, end_date))
+        # Get time entries (all employees if none selected)
+        entries = self.db.get_time_entries(employee_id, start_date, end_date)
 
         # Sort by date descending
         entries.sort(key=lambda x: x.date, reverse=True)
 
         # Add entries to tree
-        total_hours = 0
-        unique_dates = set()
+        employee_names = {emp_id: name for name, emp_id in self.employee_map.items()}
 
         for entry in entries:
             # Get employee name
-            employee = self.db.get_employee(entry.employee_id)
-            employee_name = f"{employee.first_name} {employee.last_name}" if employee else "Unknown"
+            employee_name = employee_names.get(entry.employee_id, "Unknown")
 
             # Format times
             check_in = entry.check_in.strftime('%H:%M') if entry.check_in else ''
@@ -264,8 +257,6 @@ class TimeTrackingTab:
 
             # Calculate hours
             hours = entry.hours_worked
-            total_hours += hours
-            unique_dates.add(entry.date)
 
             # Add to tree
             self.tree.insert('', 'end', values=(
@@ -279,8 +270,10 @@ class TimeTrackingTab:
                 entry.notes or ''
             ))
 
-        # Update summary
-        self.update_summary(len(entries), total_hours, len(unique_dates))
+        # Update summary with vectorized aggregates over the entries just loaded
+        summary = summarize_hours(TimeEntryArrays.from_entries(entries))
+        self.update_summary(int(summary.entry_counts.sum()), summary.grand_total,
+                            summary.total_distinct_days)
 
     def update_summary(self, total_entries: int, total_hours: float, unique_days: int):
         """Update summary information"""
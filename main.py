@@ -15,19 +15,21 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from gui.main_window import MainWindow
 from storage.database import Database
 from utils.config import Config
-from utils.logger import setup_logger
+from utils.logger import setup_logger, shutdown_logger
 
 
 class EmployeeManagementApp:
     """Main application class"""
 
     def __init__(self):
-        self.logger = setup_logger()
-        self.logger.info("Starting Employee Management System")
-
         # Initialize configuration
         self.config = Config()
 
+        self.logger = setup_logger(self.config.get('log_file'), json_lines=self.config.get('log_json'),
+                                   sampling=self.config.get('log_sampling'),
+                                   queue_size=self.config.get('log_queue_size'))
+        self.logger.info("Starting Employee Management System")
+
         # Initialize database
         self.db = Database()
         self.db.create_tables()
@@ -66,7 +68,10 @@ class EmployeeManagementApp:
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
             self.logger.info("Closing Employee Management System")
+            if self.main_window.backup_scheduler:
+                self.main_window.backup_scheduler.stop()
             self.db.close()
+            shutdown_logger()
             self.root.destroy()
 
     def run(self):
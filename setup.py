@@ -26,10 +26,13 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "tkcalendar>=1.6.1",
+        "numpy>=1.21",
     ],
     entry_points={
         "console_scripts": [
             "employee-management=main:main",
+            "employee-management-cli=cli:main",
+            "employee-management-api=api.server:main",
         ],
     },
 )
\ No newline at end of file
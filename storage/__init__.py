@@ -3,6 +3,11 @@
 Storage components for Employee Management System
 """
 
-from .database import Database
+from .archive import ColdArchive
+from .backup import BackupManager
+from .database import Database, ConflictError
+from .connection_pool import ConnectionPool
+from .document_store import DocumentStore
+from .time_entry_buffer import TimeEntryBuffer
 
-__all__ = ['Database']
\ No newline at end of file
+__all__ = ['Database', 'ConflictError', 'ColdArchive', 'BackupManager', 'ConnectionPool', 'DocumentStore', 'TimeEntryBuffer']
\ No newline at end of file
@@ -0,0 +1,306 @@
+"""
+Cold archive for old time entries and read notifications
+"""
+
+import json
+import os
+import sqlite3
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models import Notification, TimeEntry
+
+
+TIME_ENTRY_COLUMNS = ('id', 'employee_id', 'date', 'check_in', 'check_out', 'work_mode', 'notes', 'created_at')
+NOTIFICATION_COLUMNS = ('id', 'employee_id', 'notification_type', 'title', 'message',
+                        'due_date', 'is_read', 'created_at')
+
+
+def month_start(day: date) -> date:
+    """Get first day of the month containing a date"""
+    return day.replace(day=1)
+
+
+def _compress(rows: List[tuple]) -> bytes:
+    """Pack rows into a compressed blob"""
+    return zlib.compress(json.dumps(rows, separators=(',', ':')).encode('utf-8'), 9)
+
+
+def _decompress(payload: bytes) -> List[list]:
+    """Unpack rows from a compressed blob"""
+    return json.loads(zlib.decompress(payload).decode('utf-8'))
+
+
+def _merge_rows(existing: List[list], rows: List[tuple]) -> List[list]:
+    """Combine rows of an existing chunk with new ones, keyed by ID"""
+    merged = {row[0]: list(row) for row in existing}
+    merged.update((row[0], list(row)) for row in rows)
+    return [merged[row_id] for row_id in sorted(merged)]
+
+
+def _hours(check_in: Optional[str], check_out: Optional[str]) -> float:
+    """Hours between stored check in and check out values"""
+    if not check_in or not check_out:
+        return 0.0
+    return (datetime.fromisoformat(check_out) - datetime.fromisoformat(check_in)).total_seconds() / 3600
+
+
+class ColdArchive:
+    """
+    Move old rows out of the hot database into a compressed archive file
+
+    Time entries are stored per employee and month, and notifications per
+    month, as zlib-compressed JSON chunks in a separate SQLite file. The
+    hot database keeps per-month summaries and the archive boundary, so
+    Database.get_time_entries reads through to the archive when asked for
+    archived dates.
+
+    Rows are moved in batches: each batch is written to the archive first,
+    then deleted from the hot database in a short transaction. Archived
+    chunks are merged by row ID, so repeating an interrupted batch is safe.
+    """
+
+    def __init__(self, database, archive_path: Optional[str] = None, batch_rows: int = 5000):
+        """
+        Initialize archive
+
+        Args:
+            database: Hot Database instance
+            archive_path: Archive file, defaults to <database>_archive.db
+            batch_rows: Maximum rows moved per hot database transaction
+        """
+        self.db = database
+        if not archive_path:
+            stem, _ = os.path.splitext(os.path.abspath(database.db_path))
+            archive_path = f'{stem}_archive.db'
+        self.archive_path = archive_path
+        self.batch_rows = batch_rows
+        self._connection = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection to the archive file, opened on first use"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.archive_path, check_same_thread=False)
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS time_entry_chunks (
+                    month TEXT NOT NULL,
+                    employee_id INTEGER NOT NULL,
+                    row_count INTEGER NOT NULL,
+                    payload BLOB NOT NULL,
+                    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (month, employee_id)
+                )
+            ''')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS notification_chunks (
+                    month TEXT PRIMARY KEY,
+                    row_count INTEGER NOT NULL,
+                    payload BLOB NOT NULL,
+                    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._connection.commit()
+        return self._connection
+
+    def close(self):
+        """Close archive connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    # Archiving
+    def archive_time_entries(self, before: date) -> int:
+        """
+        Archive time entries dated before the start of a month
+
+        Args:
+            before: Cutoff, rounded down to the first day of its month
+
+        Returns:
+            Number of archived entries
+        """
+        cutoff = month_start(before)
+        archived = 0
+
+        for first_day in self.db.get_time_entry_months(before=cutoff):
+            next_month = (first_day + timedelta(days=32)).replace(day=1)
+            rows = self.db.get_time_entry_rows(first_day, next_month - timedelta(days=1))
+
+            for batch in self._batches(rows, key=lambda row: row[1]):
+                self._store_time_entries(first_day, batch)
+                with self.db.transaction(immediate=True):
+                    self.db.delete_time_entries((row[0], row[2]) for row in batch)
+                    self.db.add_time_entry_archive_summary(self._summarize_time_entries(first_day, batch))
+                    self.db.add_time_entry_archive_work_modes(self._summarize_work_modes(first_day, batch))
+                    self.db.set_archive_boundary('time_entries', cutoff, self.archive_path)
+                archived += len(batch)
+
+        # Record the boundary even if nothing was left to move
+        self.db.set_archive_boundary('time_entries', cutoff, self.archive_path)
+        return archived
+
+    def archive_notifications(self, before: date) -> int:
+        """
+        Archive read notifications created before the start of a month
+
+        Returns:
+            Number of archived notifications
+        """
+        cutoff = month_start(before)
+        archived = 0
+
+        while True:
+            rows = self.db.get_archivable_notification_rows(cutoff, self.batch_rows)
+            if not rows:
+                break
+
+            by_month: Dict[str, List[tuple]] = {}
+            for row in rows:
+                by_month.setdefault((row[7] or cutoff.isoformat())[:7], []).append(row)
+
+            for month, month_rows in by_month.items():
+                self._store_chunk('notification_chunks', {'month': month}, month_rows)
+            self.connection.commit()
+
+            counts: Dict[Tuple[str, str], int] = {}
+            for month, month_rows in by_month.items():
+                for row in month_rows:
+                    counts[(month, row[2])] = counts.get((month, row[2]), 0) + 1
+
+            with self.db.transaction(immediate=True):
+                self.db.delete_notifications(row[0] for row in rows)
+                self.db.add_notification_archive_summary(
+                    [(month, notification_type, count) for (month, notification_type), count in counts.items()]
+                )
+                self.db.set_archive_boundary('notifications', cutoff, self.archive_path)
+            archived += len(rows)
+
+        return archived
+
+    def run(self, time_entries_after_days: int, notifications_after_days: int) -> Dict[str, int]:
+        """Archive rows older than the given ages"""
+        today = date.today()
+        return {
+            'time_entries': self.archive_time_entries(today - timedelta(days=time_entries_after_days)),
+            'notifications': self.archive_notifications(today - timedelta(days=notifications_after_days)),
+        }
+
+    # Read-through
+    def get_time_entry_rows(self, employee_id: int = None, start_date: date = None,
+                            end_date: date = None) -> List[list]:
+        """Get archived time entry rows in a range, newest first"""
+        query = 'SELECT payload FROM time_entry_chunks WHERE 1=1'
+        params = []
+
+        if employee_id:
+            query += ' AND employee_id = ?'
+            params.append(employee_id)
+        if start_date:
+            query += ' AND month >= ?'
+            params.append(start_date.strftime('%Y-%m'))
+        if end_date:
+            query += ' AND month <= ?'
+            params.append(end_date.strftime('%Y-%m'))
+
+        first = start_date.isoformat() if start_date else ''
+        last = end_date.isoformat() if end_date else '9999-12-31'
+        rows = []
+        for (payload,) in self.connection.execute(query, params):
+            rows.extend(row for row in _decompress(payload) if first <= row[2] <= last)
+
+        rows.sort(key=lambda row: (row[2], row[0]), reverse=True)
+        return rows
+
+    def get_time_entries(self, employee_id: int = None, start_date: date = None,
+                         end_date: date = None) -> List[TimeEntry]:
+        """Get archived time entries in a range, newest first"""
+        return [
+            self.db._row_to_time_entry(dict(zip(TIME_ENTRY_COLUMNS, row)))
+            for row in self.get_time_entry_rows(employee_id, start_date, end_date)
+        ]
+
+    def get_notifications(self, start_date: date = None, end_date: date = None) -> List[Notification]:
+        """Get archived notifications created in a range"""
+        query = 'SELECT payload FROM notification_chunks WHERE 1=1'
+        params = []
+        if start_date:
+            query += ' AND month >= ?'
+            params.append(start_date.strftime('%Y-%m'))
+        if end_date:
+            query += ' AND month <= ?'
+            params.append(end_date.strftime('%Y-%m'))
+
+        notifications = []
+        for (payload,) in self.connection.execute(query, params):
+            notifications.extend(
+                self.db._row_to_notification(dict(zip(NOTIFICATION_COLUMNS, row)))
+                for row in _decompress(payload)
+            )
+        return notifications
+
+    def size(self) -> int:
+        """Size of the archive file in bytes"""
+        return os.path.getsize(self.archive_path) if os.path.exists(self.archive_path) else 0
+
+    # Helpers
+    def _batches(self, rows: List[tuple], key) -> Iterable[List[tuple]]:
+        """Split rows into batches of whole groups of at most batch_rows"""
+        batch = []
+        current = None
+        for row in sorted(rows, key=key):
+            group = key(row)
+            if batch and group != current and len(batch) >= self.batch_rows:
+                yield batch
+                batch = []
+            current = group
+            batch.append(row)
+        if batch:
+            yield batch
+
+    def _store_time_entries(self, first_day: date, rows: List[tuple]):
+        """Write time entry chunks for a month and commit"""
+        month = first_day.strftime('%Y-%m')
+        by_employee: Dict[int, List[tuple]] = {}
+        for row in rows:
+            by_employee.setdefault(row[1], []).append(row)
+        for employee_id, employee_rows in by_employee.items():
+            self._store_chunk('time_entry_chunks', {'month': month, 'employee_id': employee_id}, employee_rows)
+        self.connection.commit()
+
+    def _store_chunk(self, table: str, key: Dict[str, object], rows: List[tuple]):
+        """Write rows to a chunk, merging with rows archived earlier"""
+        where = ' AND '.join(f'{column} = ?' for column in key)
+        existing = self.connection.execute(
+            f'SELECT payload FROM {table} WHERE {where}', list(key.values())
+        ).fetchone()
+        merged = _merge_rows(_decompress(existing[0]), rows) if existing else [list(row) for row in rows]
+
+        columns = list(key) + ['row_count', 'payload']
+        self.connection.execute(
+            f'INSERT OR REPLACE INTO {table} ({", ".join(columns)}) VALUES ({", ".join("?" * len(columns))})',
+            list(key.values()) + [len(merged), _compress(merged)]
+        )
+
+    @staticmethod
+    def _summarize_time_entries(first_day: date, rows: List[tuple]) -> List[tuple]:
+        """Get (employee_id, month, entries, hours) for archived rows"""
+        month = first_day.strftime('%Y-%m')
+        totals: Dict[int, list] = {}
+        for row in rows:
+            total = totals.setdefault(row[1], [0, 0.0])
+            total[0] += 1
+            total[1] += _hours(row[3], row[4])
+        return [(employee_id, month, count, round(hours, 2)) for employee_id, (count, hours) in totals.items()]
+
+    @staticmethod
+    def _summarize_work_modes(first_day: date, rows: List[tuple]) -> List[tuple]:
+        """Get (month, work_mode, entries, hours) for archived rows"""
+        month = first_day.strftime('%Y-%m')
+        totals: Dict[str, list] = {}
+        for row in rows:
+            total = totals.setdefault(row[5] or 'Office', [0, 0.0])
+            total[0] += 1
+            total[1] += _hours(row[3], row[4])
+        return [(month, work_mode, count, round(hours, 2)) for work_mode, (count, hours) in totals.items()]
@@ -0,0 +1,329 @@
+"""
+Online backups of the database using the SQLite backup API
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+
+MANIFEST_NAME = 'manifest.json'
+
+
+class _BackupRestarted(Exception):
+    """Raised from the progress callback when writes keep restarting a backup"""
+
+
+def _sha256(path: str) -> str:
+    """Get SHA-256 digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _table_counts(connection: sqlite3.Connection) -> Dict[str, int]:
+    """Count rows of every table in a database"""
+    tables = [row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+    )]
+    return {table: connection.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+
+
+class BackupManager:
+    """
+    Create, rotate and verify backups while the application is running
+
+    Each backup is a directory named after its start time, holding a copy
+    of the main database, its year partitions and its archive file, plus a
+    manifest with checksums and row counts.
+
+    Files are copied with Connection.backup a few pages at a time, sleeping
+    between steps. The source is only read-locked during a step, so the GUI
+    and other writers can work in between. A write from another connection
+    makes SQLite restart the copy of that file, so the result is always a
+    consistent snapshot. If writes restart a file more than max_restarts
+    times, it is copied in a single step instead.
+    """
+
+    def __init__(self, db_path: str, backup_dir: str = "backups", pages_per_step: int = 256,
+                 step_sleep: float = 0.005, keep: int = 7, compress: bool = True, max_restarts: int = 3):
+        """
+        Initialize backup manager
+
+        Args:
+            db_path: Path to the main database file
+            backup_dir: Directory holding backups
+            pages_per_step: Pages copied per backup step
+            step_sleep: Seconds to sleep between steps
+            keep: Number of backups kept by rotate()
+            compress: Gzip copied files
+            max_restarts: Restarts caused by writes before copying in one step
+        """
+        self.db_path = db_path
+        self.backup_dir = backup_dir
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+        self.keep = keep
+        self.compress = compress
+        self.max_restarts = max_restarts
+        self.logger = get_logger()
+
+    def data_files(self) -> List[str]:
+        """Get paths of the main database and the files it refers to"""
+        files = [os.path.abspath(self.db_path)]
+        directory = os.path.dirname(files[0])
+        connection = sqlite3.connect(self.db_path)
+        try:
+            tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            if 'time_entry_partitions' in tables:
+                for (file_name,) in connection.execute('SELECT file_name FROM time_entry_partitions ORDER BY year'):
+                    files.append(os.path.join(directory, file_name))
+            if 'archive_state' in tables:
+                for (archive_file,) in connection.execute('SELECT DISTINCT archive_file FROM archive_state'):
+                    files.append(os.path.abspath(archive_file))
+        finally:
+            connection.close()
+        return [path for path in dict.fromkeys(files) if os.path.exists(path)]
+
+    def create_backup(self) -> dict:
+        """
+        Back up all data files
+
+        Returns:
+            Report with backup path, file count, pages, bytes, duration
+            and throughput
+        """
+        started = time.perf_counter()
+        name, target_dir = self._new_backup_dir()
+
+        manifest = {'created_at': datetime.now().isoformat(' ', 'seconds'), 'files': []}
+        try:
+            for source in self.data_files():
+                manifest['files'].append(self._backup_file(source, target_dir))
+        except Exception:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            raise
+
+        duration = time.perf_counter() - started
+        database_bytes = sum(entry['database_bytes'] for entry in manifest['files'])
+        manifest.update({
+            'duration_seconds': round(duration, 3),
+            'database_bytes': database_bytes,
+            'backup_bytes': sum(entry['backup_bytes'] for entry in manifest['files']),
+            'pages': sum(entry['pages'] for entry in manifest['files']),
+            'mb_per_second': round(database_bytes / (1024 * 1024) / duration, 2) if duration else 0.0,
+        })
+        with open(os.path.join(target_dir, MANIFEST_NAME), 'w') as f:
+            json.dump(manifest, f, indent=4)
+
+        self.logger.info(
+            f"Backup {name} created: {len(manifest['files'])} files, {database_bytes} bytes "
+            f"in {manifest['duration_seconds']} s ({manifest['mb_per_second']} MB/s)"
+        )
+        return {'path': target_dir, 'name': name, **{k: v for k, v in manifest.items() if k != 'files'},
+                'files': len(manifest['files'])}
+
+    def verify_backup(self, name: Optional[str] = None) -> Tuple[bool, List[str]]:
+        """
+        Check that a backup can be restored
+
+        Every file is checked against its checksum, restored to a temporary
+        file, checked with PRAGMA integrity_check and its row counts are
+        compared with the manifest.
+
+        Args:
+            name: Backup name, the newest backup if None
+
+        Returns:
+            Tuple of (all files OK, list of problems)
+        """
+        name = name or self.latest_backup()
+        if name is None:
+            return False, ["No backups found"]
+
+        backup_path = os.path.join(self.backup_dir, name)
+        with open(os.path.join(backup_path, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+
+        problems = []
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for entry in manifest['files']:
+                path = os.path.join(backup_path, entry['file'])
+                if not os.path.exists(path):
+                    problems.append(f"{entry['file']}: missing")
+                    continue
+                if _sha256(path) != entry['sha256']:
+                    problems.append(f"{entry['file']}: checksum mismatch")
+                    continue
+
+                restored = os.path.join(tmp_dir, entry['source'])
+                self._restore_file(path, restored)
+                connection = sqlite3.connect(restored)
+                try:
+                    result = connection.execute('PRAGMA integrity_check').fetchone()[0]
+                    if result != 'ok':
+                        problems.append(f"{entry['file']}: {result}")
+                    elif _table_counts(connection) != entry['tables']:
+                        problems.append(f"{entry['file']}: row counts differ from manifest")
+                except sqlite3.DatabaseError as e:
+                    problems.append(f"{entry['file']}: {e}")
+                finally:
+                    connection.close()
+
+        if problems:
+            self.logger.error(f"Backup {name} failed verification: {'; '.join(problems)}")
+        else:
+            self.logger.info(f"Backup {name} verified")
+        return not problems, problems
+
+    def restore_backup(self, name: str, target_dir: str) -> List[str]:
+        """
+        Restore files of a backup into a directory
+
+        The application must not use the target files while restoring.
+
+        Returns:
+            Paths of restored files
+        """
+        backup_path = os.path.join(self.backup_dir, name)
+        with open(os.path.join(backup_path, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+
+        os.makedirs(target_dir, exist_ok=True)
+        restored = []
+        for entry in manifest['files']:
+            path = os.path.join(target_dir, entry['source'])
+            # A leftover write-ahead log would be applied to the restored file
+            for suffix in ('-wal', '-shm'):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            self._restore_file(os.path.join(backup_path, entry['file']), path)
+            restored.append(path)
+        return restored
+
+    def list_backups(self) -> List[dict]:
+        """Get manifests of all backups, oldest first"""
+        backups = []
+        for name in self._backup_names():
+            with open(os.path.join(self.backup_dir, name, MANIFEST_NAME)) as f:
+                manifest = json.load(f)
+            manifest['name'] = name
+            backups.append(manifest)
+        return backups
+
+    def latest_backup(self) -> Optional[str]:
+        """Get name of the newest backup"""
+        names = self._backup_names()
+        return names[-1] if names else None
+
+    def rotate(self) -> List[str]:
+        """
+        Delete the oldest backups beyond the number to keep
+
+        Returns:
+            Names of deleted backups
+        """
+        names = self._backup_names()
+        removed = names[:-self.keep] if self.keep > 0 else []
+        for name in removed:
+            shutil.rmtree(os.path.join(self.backup_dir, name))
+            self.logger.info(f"Backup {name} removed by rotation")
+        return removed
+
+    # Helpers
+    def _new_backup_dir(self) -> Tuple[str, str]:
+        """
+        Create the directory of a new backup
+
+        Names are the creation time to the millisecond, with a counter
+        added if another process created a backup in the same millisecond,
+        so names sort by age (also among older names without milliseconds).
+        """
+        now = datetime.now()
+        base = f"{now:%Y%m%d_%H%M%S}_{now.microsecond // 1000:03d}"
+        name, attempt = base, 0
+        while True:
+            target_dir = os.path.join(self.backup_dir, name)
+            try:
+                os.makedirs(target_dir, exist_ok=False)
+                return name, target_dir
+            except FileExistsError:
+                attempt += 1
+                name = f"{base}-{attempt}"
+
+    def _backup_names(self) -> List[str]:
+        """Get names of complete backups, oldest first"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.backup_dir)
+            if os.path.exists(os.path.join(self.backup_dir, name, MANIFEST_NAME))
+        )
+
+    def _backup_file(self, source: str, target_dir: str) -> dict:
+        """Copy one database file into a backup directory"""
+        file_name = os.path.basename(source)
+        copy_path = os.path.join(target_dir, file_name)
+        state = {'steps': 0, 'pages': 0, 'remaining': None, 'restarts': 0}
+
+        def progress(status, remaining, total):
+            if state['remaining'] is not None and remaining > state['remaining']:
+                state['restarts'] += 1
+                if state['restarts'] > self.max_restarts:
+                    raise _BackupRestarted()
+            state.update(steps=state['steps'] + 1, pages=total, remaining=remaining)
+            if remaining:
+                time.sleep(self.step_sleep)
+
+        source_connection = sqlite3.connect(source)
+        target_connection = sqlite3.connect(copy_path)
+        try:
+            try:
+                source_connection.backup(target_connection, pages=self.pages_per_step, progress=progress)
+            except _BackupRestarted:
+                self.logger.warning(f"Backup of {file_name} restarted by writes, copying in one step")
+                state['remaining'] = None
+                source_connection.backup(target_connection, pages=-1, progress=progress)
+            tables = _table_counts(target_connection)
+        finally:
+            target_connection.close()
+            source_connection.close()
+
+        database_bytes = os.path.getsize(copy_path)
+        if self.compress:
+            with open(copy_path, 'rb') as src, gzip.open(copy_path + '.gz', 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.remove(copy_path)
+            copy_path += '.gz'
+
+        return {
+            'source': file_name,
+            'file': os.path.basename(copy_path),
+            'pages': state['pages'],
+            'steps': state['steps'],
+            'restarts': state['restarts'],
+            'database_bytes': database_bytes,
+            'backup_bytes': os.path.getsize(copy_path),
+            'sha256': _sha256(copy_path),
+            'tables': tables,
+        }
+
+    @staticmethod
+    def _restore_file(backup_file: str, target: str):
+        """Write a database file from its backup copy"""
+        if backup_file.endswith('.gz'):
+            with gzip.open(backup_file, 'rb') as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+        else:
+            shutil.copyfile(backup_file, target)
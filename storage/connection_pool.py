@@ -0,0 +1,74 @@
+"""
+Worker thread connection pool for Employee Management System
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from storage.database import Database
+
+
+class ConnectionPool:
+    """
+    Bounded pool of worker threads, each with its own database connection
+
+    SQLite connections are not shared between threads, so every worker
+    opens one connection when it starts and keeps it for its lifetime.
+    Connections use WAL mode, letting readers run alongside a writer.
+    """
+
+    def __init__(self, db_path: str = "employee_management.db", size: int = 4,
+                 busy_timeout_ms: int = 5000):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to database file
+            size: Number of worker threads and connections
+            busy_timeout_ms: How long a writer waits for the write lock
+        """
+        self.db_path = db_path
+        self.size = size
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self._databases: List[Database] = []
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=size,
+            thread_name_prefix='db-worker',
+            initializer=self._open_connection
+        )
+
+    def _open_connection(self):
+        """Open the connection of the current worker thread"""
+        # Closed from the owning thread of the pool in close()
+        db = Database(self.db_path, check_same_thread=False)
+        db.connection.execute("PRAGMA journal_mode = WAL")
+        db.connection.execute("PRAGMA synchronous = NORMAL")
+        db.connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        self._local.db = db
+        with self._lock:
+            self._databases.append(db)
+
+    def _call(self, func: Callable, args: tuple):
+        """Run function with the connection of the current worker"""
+        return func(self._local.db, *args)
+
+    def submit(self, func: Callable, *args):
+        """Run func(db, *args) on a worker, returning a concurrent future"""
+        return self._executor.submit(self._call, func, args)
+
+    async def run(self, func: Callable, *args):
+        """Run func(db, *args) on a worker and await the result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, args)
+
+    def close(self):
+        """Wait for running calls and close all connections"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for db in self._databases:
+                db.close()
+            self._databases.clear()
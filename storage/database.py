@@ -3,11 +3,13 @@ Database management for Employee Management System
 """
 
 import sqlite3
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from datetime import datetime, date, timedelta
+from typing import List, Optional, Dict, Any, Iterable, NamedTuple, Set, Tuple
 import os
 from contextlib import contextmanager
 
+from storage.archive import ColdArchive, TIME_ENTRY_COLUMNS
+from storage.partitions import TimeEntryPartitions
 from models import (
     Employee, TimeEntry, LeaveRequest, Document,
     Notification, Department, Position,
@@ -15,22 +17,70 @@ from models import (
 )
 
 
+class ConflictError(Exception):
+    """Row was changed by someone else since it was read"""
+
+    def __init__(self, table: str, row_id: int):
+        super().__init__(f"{table} record {row_id} was modified by another user")
+        self.table = table
+        self.row_id = row_id
+
+
+class EmployeeName(NamedTuple):
+    """Employee ID and display name, for pickers"""
+    id: int
+    name: str
+
+
+class EmployeeListRow(NamedTuple):
+    """Employee fields shown in the employee list"""
+    id: int
+    name: str
+    pesel: str
+    position: str
+    department: str
+    contract_type: str
+    hire_date: Optional[date]
+    contract_end_date: Optional[date]
+
+
 class Database:
     """SQLite database manager"""
 
-    def __init__(self, db_path: str = "employee_management.db"):
+    # Tables whose changes are counted in table_versions
+    TRACKED_TABLES = ('employees', 'time_entries', 'leave_requests', 'documents',
+                      'notifications', 'time_entry_archive_summary')
+
+    # Work mode reported for archived entries without a work mode summary
+    ARCHIVED_WORK_MODE = '(archived)'
+
+    _INSERT_TIME_ENTRY = '''
+        INSERT INTO time_entries (
+            employee_id, date, check_in, check_out, work_mode, notes
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    '''
+
+    def __init__(self, db_path: str = "employee_management.db", check_same_thread: bool = True):
         self.db_path = db_path
+        self.check_same_thread = check_same_thread
         self.connection = None
+        self._transaction_depth = 0
+        self.partitions = TimeEntryPartitions(self)
+        self._archives: Dict[str, ColdArchive] = {}
         self.connect()
 
     def connect(self):
         """Establish database connection"""
-        self.connection = sqlite3.connect(self.db_path)
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=self.check_same_thread)
         self.connection.row_factory = sqlite3.Row
         self.connection.execute("PRAGMA foreign_keys = ON")
+        self.partitions.load()
 
     def close(self):
         """Close database connection"""
+        for archive in self._archives.values():
+            archive.close()
+        self._archives.clear()
         if self.connection:
             self.connection.close()
 
@@ -38,6 +88,14 @@ class Database:
     def get_cursor(self):
         """Context manager for database cursor"""
         cursor = self.connection.cursor()
+        if self._transaction_depth:
+            # Inside transaction(), which commits or rolls back as a whole
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
         try:
             yield cursor
             self.connection.commit()
@@ -47,6 +105,52 @@ class Database:
         finally:
             cursor.close()
 
+    @contextmanager
+    def transaction(self, immediate: bool = False):
+        """
+        Context manager grouping several operations into one transaction
+
+        Database calls made inside the block join the transaction instead of
+        committing on their own. Nested blocks use savepoints, so an error in
+        an inner block only undoes that block if the outer one handles it.
+
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE) so the
+                       transaction cannot fail later on a lock upgrade
+        """
+        if self._transaction_depth == 0:
+            if self.connection.in_transaction:
+                self.connection.commit()
+            self.connection.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+            self._transaction_depth = 1
+            try:
+                yield self
+                self.connection.commit()
+            except BaseException:
+                self.connection.rollback()
+                raise
+            finally:
+                self._transaction_depth = 0
+            return
+
+        savepoint = f'sp_{self._transaction_depth}'
+        self.connection.execute(f'SAVEPOINT {savepoint}')
+        self._transaction_depth += 1
+        try:
+            yield self
+            self.connection.execute(f'RELEASE SAVEPOINT {savepoint}')
+        except BaseException:
+            self.connection.execute(f'ROLLBACK TO SAVEPOINT {savepoint}')
+            self.connection.execute(f'RELEASE SAVEPOINT {savepoint}')
+            raise
+        finally:
+            self._transaction_depth -= 1
+
+    @property
+    def in_transaction(self) -> bool:
+        """Check if a transaction() block is active"""
+        return self._transaction_depth > 0
+
     def create_tables(self):
         """Create all database tables"""
         with self.get_cursor() as cursor:
@@ -71,6 +175,7 @@ class Database:
                     work_mode TEXT DEFAULT 'Office',
                     medical_exam_date DATE,
                     safety_training_date DATE,
+                    version INTEGER NOT NULL DEFAULT 1,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -104,6 +209,7 @@ class Database:
                     status TEXT DEFAULT 'Pending',
                     approved_by TEXT,
                     approved_date TIMESTAMP,
+                    version INTEGER NOT NULL DEFAULT 1,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (employee_id) REFERENCES employees (id)
                 )
@@ -117,7 +223,9 @@ class Database:
                     document_type TEXT NOT NULL,
                     document_name TEXT NOT NULL,
                     file_path TEXT,
+                    content_hash TEXT,
                     generated_date TIMESTAMP,
+                    version INTEGER NOT NULL DEFAULT 1,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     FOREIGN KEY (employee_id) REFERENCES employees (id)
                 )
@@ -164,10 +272,124 @@ class Database:
                 )
             ''')
 
+            # Progress of background jobs
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS job_state (
+                    job TEXT PRIMARY KEY,
+                    last_id INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Archive boundaries and summaries of archived rows
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS archive_state (
+                    kind TEXT PRIMARY KEY,
+                    archived_before DATE NOT NULL,
+                    archive_file TEXT NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS time_entry_archive_summary (
+                    employee_id INTEGER NOT NULL,
+                    month TEXT NOT NULL,
+                    entries INTEGER NOT NULL,
+                    hours REAL NOT NULL,
+                    PRIMARY KEY (employee_id, month)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS time_entry_archive_work_modes (
+                    month TEXT NOT NULL,
+                    work_mode TEXT NOT NULL,
+                    entries INTEGER NOT NULL,
+                    hours REAL NOT NULL,
+                    PRIMARY KEY (month, work_mode)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS notification_archive_summary (
+                    month TEXT NOT NULL,
+                    notification_type TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (month, notification_type)
+                )
+            ''')
+
+            # Leave entitlement, carry-over and usage per employee and year
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS leave_ledger (
+                    employee_id INTEGER NOT NULL,
+                    year INTEGER NOT NULL,
+                    entitlement INTEGER NOT NULL,
+                    carried_over INTEGER NOT NULL,
+                    used INTEGER NOT NULL,
+                    adjustment INTEGER NOT NULL DEFAULT 0,
+                    balance INTEGER NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (employee_id, year),
+                    FOREIGN KEY (employee_id) REFERENCES employees (id)
+                )
+            ''')
+
+            # Change counters used to invalidate cached aggregates
+            self._create_change_tracking(cursor, self.TRACKED_TABLES)
+
+            # Dashboard counters, kept current by triggers
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS kpi_counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0,
+                    as_of DATE,
+                    window_days INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS kpi_attendance (
+                    day DATE NOT NULL,
+                    employee_id INTEGER NOT NULL,
+                    PRIMARY KEY (day, employee_id)
+                )
+            ''')
+            self._create_kpi_triggers(cursor)
+
+            # Add columns missing from databases created by older versions
+            self._ensure_column(cursor, 'documents', 'content_hash', 'TEXT')
+            self._ensure_column(cursor, 'leave_requests', 'rejection_reason', 'TEXT')
+            self._ensure_column(cursor, 'leave_ledger', 'adjustment', 'INTEGER NOT NULL DEFAULT 0')
+            for table in ('employees', 'leave_requests', 'documents'):
+                self._ensure_column(cursor, table, 'version', 'INTEGER NOT NULL DEFAULT 1')
+
             # Create indexes
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_employee_pesel ON employees(pesel)')
+            # Covers get_employee_names and gives name order to the other employee reads
+            cursor.execute('DROP INDEX IF EXISTS idx_employees_list')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_employees_name ON employees(last_name, first_name, id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_time_entries_employee ON time_entries(employee_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_time_entries_employee_check_in ON time_entries(employee_id, check_in)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_time_entries_date ON time_entries(date)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_leave_requests_employee ON leave_requests(employee_id)')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_notifications_lookup
+                ON notifications(employee_id, notification_type, due_date)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_documents_employee_date
+                ON documents(employee_id, generated_date)
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_documents_type ON documents(document_type)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents(content_hash)')
+
+        # Year partitions created before change tracking existed
+        if self.partitions.enabled:
+            for table in self._time_entry_tables():
+                schema = table.split('.')[0]
+                with self.get_cursor() as cursor:
+                    cursor.execute(f"SELECT 1 FROM {schema}.sqlite_master WHERE name = 'table_versions'")
+                    if not cursor.fetchone():
+                        self._create_change_tracking(cursor, ('time_entries',), schema)
 
     # Employee operations
     def create_employee(self, employee: Employee) -> int:
@@ -201,15 +423,78 @@ class Database:
                 return self._row_to_employee(row)
             return None
 
-    def get_all_employees(self) -> List[Employee]:
+    def get_all_employees(self, limit: int = None, offset: int = 0) -> List[Employee]:
         """Get all employees"""
+        query = 'SELECT * FROM employees ORDER BY last_name, first_name, id'
+        params = []
+
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+
         with self.get_cursor() as cursor:
-            cursor.execute('SELECT * FROM employees ORDER BY last_name, first_name')
+            cursor.execute(query, params)
             return [self._row_to_employee(row) for row in cursor.fetchall()]
 
+    def get_employee_names(self) -> List[EmployeeName]:
+        """Get (id, name) of all employees ordered by name, read from an index only"""
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT id, first_name || ' ' || last_name FROM employees
+                ORDER BY last_name, first_name, id
+            ''')
+            return [EmployeeName._make(row) for row in cursor.fetchall()]
+
+    EMPLOYEE_COLUMNS = (
+        'id', 'first_name', 'last_name', 'pesel', 'address', 'phone', 'email', 'position',
+        'department', 'hire_date', 'contract_number', 'contract_type', 'contract_end_date',
+        'annual_leave_days', 'remaining_leave_days', 'work_mode', 'medical_exam_date',
+        'safety_training_date', 'version', 'created_at', 'updated_at',
+    )
+
+    def get_employee_columns(self, columns: Iterable[str], employee_ids: Iterable[int] = None) -> List[tuple]:
+        """
+        Get selected columns of employees as plain tuples, ordered by name
+
+        Reads only the requested columns instead of building full Employee
+        objects. Dates are returned as ISO strings, as stored.
+        """
+        columns = list(columns)
+        unknown = set(columns) - set(self.EMPLOYEE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown employee columns: {', '.join(sorted(unknown))}")
+        query = f'SELECT {", ".join(columns)} FROM employees'
+        rows = []
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            if employee_ids is None:
+                cursor.execute(query + ' ORDER BY last_name, first_name, id')
+                return cursor.fetchall()
+            employee_ids = list(employee_ids)
+            # Stay below SQLite's limit on query parameters
+            for start in range(0, len(employee_ids), 500):
+                chunk = employee_ids[start:start + 500]
+                cursor.execute(f'{query} WHERE id IN ({", ".join("?" * len(chunk))})', chunk)
+                rows.extend(cursor.fetchall())
+        return rows
+
     def update_employee(self, employee: Employee) -> bool:
-        """Update employee information"""
+        """
+        Update employee information
+
+        The update only applies if the row still has the version the
+        employee was read with. A changed remaining_leave_days is a manual
+        correction and is recorded as an adjustment in the current year's
+        leave ledger, so accrual keeps it.
+
+        Raises:
+            ConflictError: Employee was changed since it was read
+        """
         with self.get_cursor() as cursor:
+            cursor.execute('SELECT remaining_leave_days FROM employees WHERE id = ? AND version = ?',
+                           (employee.id, employee.version))
+            row = cursor.fetchone()
             cursor.execute('''
                 UPDATE employees SET
                     first_name = ?, last_name = ?, pesel = ?, address = ?,
@@ -218,8 +503,9 @@ class Database:
                     contract_end_date = ?, annual_leave_days = ?,
                     remaining_leave_days = ?, work_mode = ?,
                     medical_exam_date = ?, safety_training_date = ?,
+                    version = version + 1,
                     updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
+                WHERE id = ? AND version = ?
             ''', (
                 employee.first_name, employee.last_name, employee.pesel,
                 employee.address, employee.phone, employee.email,
@@ -228,47 +514,227 @@ class Database:
                 employee.contract_end_date, employee.annual_leave_days,
                 employee.remaining_leave_days, employee.work_mode.value,
                 employee.medical_exam_date, employee.safety_training_date,
-                employee.id
+                employee.id, employee.version
             ))
-            return cursor.rowcount > 0
+            updated = self._check_version(cursor, 'employees', employee)
+            if updated and row[0] != employee.remaining_leave_days:
+                cursor.execute('''
+                    UPDATE leave_ledger SET
+                        adjustment = adjustment + :change,
+                        balance = balance + :change,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE employee_id = :employee_id AND year = :year
+                ''', {'change': employee.remaining_leave_days - row[0],
+                      'employee_id': employee.id, 'year': date.today().year})
+            return updated
 
     def delete_employee(self, employee_id: int) -> bool:
         """Delete employee"""
         with self.get_cursor() as cursor:
+            # The ledger is derived data, it goes with the employee
+            cursor.execute('DELETE FROM leave_ledger WHERE employee_id = ?', (employee_id,))
             cursor.execute('DELETE FROM employees WHERE id = ?', (employee_id,))
             return cursor.rowcount > 0
 
     # Time entry operations
     def create_time_entry(self, entry: TimeEntry) -> int:
         """Create time entry"""
+        if self.partitions.enabled:
+            return self._insert_partitioned([entry])
+
         with self.get_cursor() as cursor:
-            cursor.execute('''
-                INSERT INTO time_entries (
-                    employee_id, date, check_in, check_out, work_mode, notes
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                entry.employee_id, entry.date, entry.check_in,
-                entry.check_out, entry.work_mode.value, entry.notes
-            ))
+            cursor.execute(self._INSERT_TIME_ENTRY, self._time_entry_params(entry))
+            self._record_attendance(cursor, [entry])
             return cursor.lastrowid
 
-    def get_time_entries(self, employee_id: int, start_date: date = None, end_date: date = None) -> List[TimeEntry]:
-        """Get time entries for employee"""
-        query = 'SELECT * FROM time_entries WHERE employee_id = ?'
+    def create_time_entries(self, entries: List[TimeEntry]) -> int:
+        """Create many time entries with a single commit"""
+        if self.partitions.enabled:
+            self._insert_partitioned(entries)
+            return len(entries)
+
+        with self.get_cursor() as cursor:
+            cursor.executemany(self._INSERT_TIME_ENTRY, [self._time_entry_params(e) for e in entries])
+            count = cursor.rowcount
+            self._record_attendance(cursor, entries)
+            return count
+
+    def get_time_entries(self, employee_id: int = None, start_date: date = None, end_date: date = None,
+                         limit: int = None, offset: int = 0) -> List[TimeEntry]:
+        """Get time entries for employee (all employees if no ID given)"""
+        where, params = self._time_entry_filters(employee_id, start_date, end_date)
+        entries = []
+        skip = offset
+
+        with self.get_cursor() as cursor:
+            # Partitions are visited newest first, so the overall order holds
+            for table in self._time_entry_tables(start_date, end_date, descending=True):
+                query = f'SELECT * FROM {table} WHERE {where} ORDER BY date DESC, id DESC'
+                if limit is None:
+                    cursor.execute(query, params)
+                else:
+                    remaining = limit - len(entries)
+                    if remaining <= 0:
+                        break
+                    cursor.execute(query + ' LIMIT ? OFFSET ?', params + [remaining, skip])
+
+                rows = cursor.fetchall()
+                if skip and not rows:
+                    # Offset lies beyond this partition
+                    cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE {where}', params)
+                    skip = max(0, skip - cursor.fetchone()[0])
+                else:
+                    skip = 0
+                entries.extend(self._row_to_time_entry(row) for row in rows)
+
+        archive, end_date = self._archive_for_range('time_entries', start_date, end_date)
+        if archive is None or (limit is not None and len(entries) >= limit):
+            return entries
+
+        # Archived entries are older than all entries still in the database
+        archived = archive.get_time_entries(employee_id, start_date, end_date)
+        if limit is None:
+            return entries + archived
+        # skip now holds the part of the offset beyond the database rows
+        return entries + archived[skip:skip + limit - len(entries)]
+
+    def count_time_entries(self, employee_id: int = None, start_date: date = None,
+                           end_date: date = None) -> int:
+        """Count time entries matching filters"""
+        where, params = self._time_entry_filters(employee_id, start_date, end_date)
+        total = 0
+        with self.get_cursor() as cursor:
+            for table in self._time_entry_tables(start_date, end_date):
+                cursor.execute(f'SELECT COUNT(*) FROM {table} WHERE {where}', params)
+                total += cursor.fetchone()[0]
+        return total
+
+    def get_time_entry_epochs(self, start_date: date = None, end_date: date = None,
+                              employee_id: int = None) -> List[tuple]:
+        """
+        Get time entries as numeric tuples for bulk analytics
+
+        Returns:
+            List of (employee_id, day, check_in, check_out) tuples where day is
+            days since 1970-01-01 and check times are Unix seconds (-1 if missing)
+        """
+        if sqlite3.sqlite_version_info >= (3, 38, 0):
+            columns = '''
+                employee_id, unixepoch(date) / 86400,
+                COALESCE(unixepoch(check_in), -1),
+                COALESCE(unixepoch(check_out), -1)
+            '''
+        else:
+            columns = '''
+                employee_id,
+                CAST(julianday(date) - 2440587.5 AS INTEGER),
+                COALESCE(CAST(strftime('%s', check_in) AS INTEGER), -1),
+                COALESCE(CAST(strftime('%s', check_out) AS INTEGER), -1)
+            '''
+        where, params = self._time_entry_filters(employee_id, start_date, end_date)
+        rows = []
+
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None  # Plain tuples convert to arrays faster
+            for table in self._time_entry_tables(start_date, end_date):
+                cursor.execute(f'SELECT {columns} FROM {table} WHERE {where}', params)
+                rows.extend(cursor.fetchall())
+
+        archive, end_date = self._archive_for_range('time_entries', start_date, end_date)
+        if archive is not None:
+            epoch = datetime(1970, 1, 1)
+            for row in archive.get_time_entry_rows(employee_id, start_date, end_date):
+                rows.append((
+                    row[1],
+                    (date.fromisoformat(row[2]) - epoch.date()).days,
+                    int((datetime.fromisoformat(row[3]) - epoch).total_seconds()) if row[3] else -1,
+                    int((datetime.fromisoformat(row[4]) - epoch).total_seconds()) if row[4] else -1,
+                ))
+        return rows
+
+    def get_time_entry_rows(self, start_date: date, end_date: date) -> List[tuple]:
+        """Get stored time entry rows in a date range with all columns"""
+        where, params = self._time_entry_filters(None, start_date, end_date)
+        rows = []
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            for table in self._time_entry_tables(start_date, end_date):
+                cursor.execute(f'SELECT {", ".join(TIME_ENTRY_COLUMNS)} FROM {table} WHERE {where}', params)
+                rows.extend(cursor.fetchall())
+        return rows
+
+    def get_time_entry_months(self, before: date) -> List[date]:
+        """Get first days of months with time entries dated before a date"""
+        months = set()
+        with self.get_cursor() as cursor:
+            for table in self._time_entry_tables(None, before - timedelta(days=1)):
+                cursor.execute(f"SELECT DISTINCT substr(date, 1, 7) FROM {table} WHERE date < ?", (before,))
+                months.update(date.fromisoformat(row[0] + '-01') for row in cursor.fetchall())
+        return sorted(months)
+
+    def delete_time_entries(self, entries: Iterable[Tuple[int, Any]]) -> int:
+        """
+        Delete time entries
+
+        Args:
+            entries: (id, date) pairs, the date selects the year partition
+
+        Returns:
+            Number of deleted entries
+        """
+        by_year: Dict[int, list] = {}
+        for entry_id, entry_date in entries:
+            by_year.setdefault(int(str(entry_date)[:4]), []).append((entry_id,))
+
+        deleted = 0
+        with self.get_cursor() as cursor:
+            for year, ids in by_year.items():
+                for table in self._time_entry_tables(date(year, 1, 1), date(year, 12, 31)):
+                    cursor.executemany(f'DELETE FROM {table} WHERE id = ?', ids)
+                    deleted += cursor.rowcount
+        return deleted
+
+    def get_changed_time_entry_ranges(self, after_id: int) -> List[tuple]:
+        """
+        Get employees with time entries added after an entry ID
+
+        Returns:
+            List of (employee_id, earliest date, highest entry ID) tuples
+        """
+        changes: Dict[int, list] = {}
+        with self.get_cursor() as cursor:
+            for table in self._time_entry_tables():
+                cursor.execute(f'''
+                    SELECT employee_id, MIN(date) AS first_date, MAX(id) AS last_id
+                    FROM {table}
+                    WHERE id > ?
+                    GROUP BY employee_id
+                ''', (after_id,))
+                for row in cursor.fetchall():
+                    first_date = date.fromisoformat(row['first_date'])
+                    change = changes.get(row['employee_id'])
+                    if change is None:
+                        changes[row['employee_id']] = [first_date, row['last_id']]
+                    else:
+                        change[0] = min(change[0], first_date)
+                        change[1] = max(change[1], row['last_id'])
+        return [(employee_id, first, last) for employee_id, (first, last) in changes.items()]
+
+    def get_shifts(self, employee_id: int, start_date: date = None) -> List[TimeEntry]:
+        """Get completed time entries for employee ordered by check in"""
+        query_filter = 'employee_id = ? AND check_in IS NOT NULL AND check_out IS NOT NULL'
         params = [employee_id]
 
         if start_date:
-            query += ' AND date >= ?'
-            params.append(start_date)
-        if end_date:
-            query += ' AND date <= ?'
-            params.append(end_date)
-
-        query += ' ORDER BY date DESC'
+            query_filter += ' AND check_in >= ?'
+            params.append(start_date.strftime('%Y-%m-%d'))
 
+        shifts = []
         with self.get_cursor() as cursor:
-            cursor.execute(query, params)
-            return [self._row_to_time_entry(row) for row in cursor.fetchall()]
+            for table in self._time_entry_tables(start_date):
+                cursor.execute(f'SELECT * FROM {table} WHERE {query_filter} ORDER BY check_in', params)
+                shifts.extend(self._row_to_time_entry(row) for row in cursor.fetchall())
+        return shifts
 
     # Leave request operations
     def create_leave_request(self, request: LeaveRequest) -> int:
@@ -286,7 +752,8 @@ class Database:
             ))
             return cursor.lastrowid
 
-    def get_leave_requests(self, employee_id: int = None, status: str = None) -> List[LeaveRequest]:
+    def get_leave_requests(self, employee_id: int = None, status: str = None,
+                           limit: int = None, offset: int = 0) -> List[LeaveRequest]:
         """Get leave requests"""
         query = 'SELECT * FROM leave_requests WHERE 1=1'
         params = []
@@ -298,38 +765,321 @@ class Database:
             query += ' AND status = ?'
             params.append(status)
 
-        query += ' ORDER BY created_at DESC'
+        query += ' ORDER BY created_at DESC, id DESC'
+
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
 
         with self.get_cursor() as cursor:
             cursor.execute(query, params)
             return [self._row_to_leave_request(row) for row in cursor.fetchall()]
 
-    def approve_leave_request(self, request_id: int, approved_by: str) -> bool:
-        """Approve leave request"""
+    def get_leave_requests_by_ids(self, request_ids: Iterable[int]) -> List[LeaveRequest]:
+        """Get leave requests by ID, newest first"""
+        request_ids = list(request_ids)
+        rows = []
+        with self.get_cursor() as cursor:
+            # Stay below SQLite's limit on query parameters
+            for start in range(0, len(request_ids), 500):
+                chunk = request_ids[start:start + 500]
+                cursor.execute(
+                    f'SELECT * FROM leave_requests WHERE id IN ({", ".join("?" * len(chunk))})', chunk
+                )
+                rows.extend(cursor.fetchall())
+        rows.sort(key=lambda row: (row['created_at'], row['id']), reverse=True)
+        return [self._row_to_leave_request(row) for row in rows]
+
+    def get_leave_intervals(self) -> List[tuple]:
+        """Get (id, employee_id, department, start_date, end_date, status) of all leave requests"""
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT lr.id, lr.employee_id, e.department, lr.start_date, lr.end_date, lr.status
+                FROM leave_requests lr
+                LEFT JOIN employees e ON e.id = lr.employee_id
+            ''')
+            return [
+                (row[0], row[1], row[2] or '', date.fromisoformat(row[3]), date.fromisoformat(row[4]), row[5])
+                for row in cursor.fetchall()
+            ]
+
+    def get_overlapping_leave_requests(self, employee_id: int, start_date: date, end_date: date,
+                                       exclude_id: int = None) -> List[LeaveRequest]:
+        """Get an employee's pending or approved requests overlapping a range"""
         with self.get_cursor() as cursor:
             cursor.execute('''
-                UPDATE leave_requests SET
-                    status = 'Approved',
-                    approved_by = ?,
-                    approved_date = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (approved_by, request_id))
+                SELECT * FROM leave_requests
+                WHERE employee_id = ? AND status IN ('Pending', 'Approved')
+                  AND start_date <= ? AND end_date >= ? AND id IS NOT ?
+                ORDER BY start_date
+            ''', (employee_id, end_date.isoformat(), start_date.isoformat(), exclude_id))
+            return [self._row_to_leave_request(row) for row in cursor.fetchall()]
+
+    def get_leave_request(self, request_id: int) -> Optional[LeaveRequest]:
+        """Get leave request by ID"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT * FROM leave_requests WHERE id = ?', (request_id,))
+            row = cursor.fetchone()
+            if row:
+                return self._row_to_leave_request(row)
+            return None
+
+    def approve_leave_request(self, request_id: int, approved_by: str) -> bool:
+        """
+        Approve leave request
+
+        Only a pending request is approved, so approving twice (for example
+        by two users at once) deducts leave days only once.
 
-            if cursor.rowcount > 0:
-                # Update remaining leave days
+        Returns:
+            False if the request does not exist or is no longer pending
+        """
+        return self.approve_leave_requests([request_id], approved_by)[request_id] == 'approved'
+
+    def approve_leave_requests(self, request_ids: Iterable[int], approved_by: str) -> Dict[int, str]:
+        """
+        Approve several leave requests in one transaction
+
+        The leave days are deducted from each employee's balance and the
+        statuses changed with one statement each for the whole batch. Only
+        pending requests are approved, so days are deducted only once. A
+        request overlapping the employee's approved leave, or an earlier
+        request approved in the same batch, stays pending.
+
+        Returns:
+            Outcome per request ID: 'approved', 'overlaps', 'not_pending' or 'not_found'
+        """
+        return self._decide_leave_requests(request_ids, 'Approved', approved_by)
+
+    def reject_leave_requests(self, request_ids: Iterable[int], rejected_by: str,
+                              reason: str = None) -> Dict[int, str]:
+        """
+        Reject several pending leave requests in one transaction
+
+        Returns:
+            Outcome per request ID: 'rejected', 'not_pending' or 'not_found'
+        """
+        return self._decide_leave_requests(request_ids, 'Rejected', rejected_by, reason)
+
+    def delete_leave_requests(self, request_ids: Iterable[int]) -> Dict[int, str]:
+        """
+        Delete several leave requests in one transaction
+
+        Days of approved requests are returned to the employees' balances.
+
+        Returns:
+            Outcome per request ID: 'deleted' or 'not_found'
+        """
+        request_ids = list(dict.fromkeys(request_ids))
+        with self.transaction(immediate=True):
+            with self.get_cursor() as cursor:
+                self._stage_request_ids(cursor, request_ids)
+                cursor.execute('SELECT id FROM leave_requests WHERE id IN (SELECT id FROM bulk_request_ids)')
+                found = {row[0] for row in cursor.fetchall()}
                 cursor.execute('''
-                    SELECT employee_id, days_count FROM leave_requests WHERE id = ?
-                ''', (request_id,))
-                row = cursor.fetchone()
-                if row:
+                    UPDATE employees SET
+                        remaining_leave_days = remaining_leave_days + (
+                            SELECT SUM(days_count) FROM leave_requests
+                            WHERE employee_id = employees.id AND status = 'Approved'
+                              AND id IN (SELECT id FROM bulk_request_ids)
+                        ),
+                        version = version + 1
+                    WHERE id IN (
+                        SELECT employee_id FROM leave_requests
+                        WHERE status = 'Approved' AND id IN (SELECT id FROM bulk_request_ids)
+                    )
+                ''')
+                cursor.execute('DELETE FROM leave_requests WHERE id IN (SELECT id FROM bulk_request_ids)')
+        return {request_id: 'deleted' if request_id in found else 'not_found' for request_id in request_ids}
+
+    def _decide_leave_requests(self, request_ids: Iterable[int], status: str, decided_by: str,
+                               reason: str = None) -> Dict[int, str]:
+        """Move pending requests to Approved or Rejected, deducting leave days on approval"""
+        request_ids = list(dict.fromkeys(request_ids))
+        with self.transaction(immediate=True):
+            with self.get_cursor() as cursor:
+                self._stage_request_ids(cursor, request_ids)
+                cursor.execute('SELECT id, status FROM leave_requests WHERE id IN (SELECT id FROM bulk_request_ids)')
+                found = {row[0]: row[1] for row in cursor.fetchall()}
+
+                overlaps = set()
+                if status == 'Approved':
+                    overlaps = self._find_approval_overlaps(cursor)
+                    cursor.executemany('DELETE FROM bulk_request_ids WHERE id = ?', [(i,) for i in overlaps])
+
+                    # Deduct before the status changes, relative to the current balance
                     cursor.execute('''
                         UPDATE employees SET
-                            remaining_leave_days = remaining_leave_days - ?
-                        WHERE id = ?
-                    ''', (row['days_count'], row['employee_id']))
+                            remaining_leave_days = remaining_leave_days - (
+                                SELECT SUM(days_count) FROM leave_requests
+                                WHERE employee_id = employees.id AND status = 'Pending'
+                                  AND id IN (SELECT id FROM bulk_request_ids)
+                            ),
+                            version = version + 1
+                        WHERE id IN (
+                            SELECT employee_id FROM leave_requests
+                            WHERE status = 'Pending' AND id IN (SELECT id FROM bulk_request_ids)
+                        )
+                    ''')
+
+                cursor.execute('''
+                    UPDATE leave_requests SET
+                        status = ?,
+                        approved_by = ?,
+                        approved_date = CURRENT_TIMESTAMP,
+                        rejection_reason = ?,
+                        version = version + 1
+                    WHERE status = 'Pending' AND id IN (SELECT id FROM bulk_request_ids)
+                ''', (status, decided_by, reason))
+
+        outcome = status.lower()
+        return {
+            request_id: 'not_found' if request_id not in found
+            else 'overlaps' if request_id in overlaps
+            else outcome if found[request_id] == 'Pending' else 'not_pending'
+            for request_id in request_ids
+        }
+
+    @staticmethod
+    def _find_approval_overlaps(cursor) -> Set[int]:
+        """Get staged pending requests that would overlap approved leave of the same employee"""
+        cursor.execute('''
+            SELECT id, employee_id, start_date, end_date, status
+            FROM leave_requests
+            WHERE employee_id IN (
+                SELECT employee_id FROM leave_requests
+                WHERE status = 'Pending' AND id IN (SELECT id FROM bulk_request_ids)
+            ) AND (status = 'Approved' OR (status = 'Pending' AND id IN (SELECT id FROM bulk_request_ids)))
+            ORDER BY status = 'Pending', id
+        ''')
+        approved: Dict[int, List[Tuple[str, str]]] = {}
+        overlaps = set()
+        # Approved leave first, then the batch in ID order, so earlier requests win
+        for request_id, employee_id, start, end, status in cursor.fetchall():
+            ranges = approved.setdefault(employee_id, [])
+            if status == 'Pending' and any(start <= other_end and end >= other_start
+                                           for other_start, other_end in ranges):
+                overlaps.add(request_id)
+            else:
+                ranges.append((start, end))
+        return overlaps
+
+    def _stage_request_ids(self, cursor, request_ids: List[int]):
+        """Load request IDs into a temporary table for set-based updates"""
+        cursor.execute('CREATE TEMP TABLE IF NOT EXISTS bulk_request_ids (id INTEGER PRIMARY KEY)')
+        cursor.execute('DELETE FROM bulk_request_ids')
+        cursor.executemany('INSERT INTO bulk_request_ids (id) VALUES (?)', [(i,) for i in request_ids])
+
+    # Document operations
+    def create_document(self, document: Document) -> int:
+        """Create document record"""
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                INSERT INTO documents (
+                    employee_id, document_type, document_name, file_path,
+                    content_hash, generated_date
+                ) VALUES (?, ?, ?, ?, ?, ?)
+            ''', (
+                document.employee_id, document.document_type,
+                document.document_name, document.file_path,
+                document.content_hash,
+                document.generated_date.strftime('%Y-%m-%d %H:%M:%S') if document.generated_date else None
+            ))
+            return cursor.lastrowid
+
+    def get_document(self, document_id: int) -> Optional[Document]:
+        """Get document by ID"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT * FROM documents WHERE id = ?', (document_id,))
+            row = cursor.fetchone()
+            if row:
+                return self._row_to_document(row)
+            return None
+
+    def get_documents(self, employee_id: int = None, document_type: str = None,
+                      search: str = None, start_date: date = None, end_date: date = None,
+                      limit: int = None, offset: int = 0) -> List[Document]:
+        """Get documents matching filters, newest first"""
+        where, params = self._document_filters(employee_id, document_type, search, start_date, end_date)
+        query = f'SELECT * FROM documents WHERE {where} ORDER BY generated_date DESC, id DESC'
+
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return [self._row_to_document(row) for row in cursor.fetchall()]
 
+    def count_documents(self, employee_id: int = None, document_type: str = None,
+                        search: str = None, start_date: date = None, end_date: date = None) -> int:
+        """Count documents matching filters"""
+        where, params = self._document_filters(employee_id, document_type, search, start_date, end_date)
+        with self.get_cursor() as cursor:
+            cursor.execute(f'SELECT COUNT(*) FROM documents WHERE {where}', params)
+            return cursor.fetchone()[0]
+
+    def get_document_paths(self) -> set:
+        """Get file paths of all indexed documents"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT file_path FROM documents WHERE file_path IS NOT NULL')
+            return {row['file_path'] for row in cursor.fetchall()}
+
+    def count_documents_with_hash(self, content_hash: str) -> int:
+        """Count documents that reference stored content"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT COUNT(*) FROM documents WHERE content_hash = ?', (content_hash,))
+            return cursor.fetchone()[0]
+
+    def update_document(self, document: Document) -> bool:
+        """
+        Update document information
+
+        Raises:
+            ConflictError: Document was changed since it was read
+        """
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                UPDATE documents SET
+                    employee_id = ?, document_type = ?, document_name = ?,
+                    file_path = ?, content_hash = ?, version = version + 1
+                WHERE id = ? AND version = ?
+            ''', (
+                document.employee_id, document.document_type, document.document_name,
+                document.file_path, document.content_hash, document.id, document.version
+            ))
+            return self._check_version(cursor, 'documents', document)
+
+    def delete_document(self, document_id: int) -> bool:
+        """Delete document record"""
+        with self.get_cursor() as cursor:
+            cursor.execute('DELETE FROM documents WHERE id = ?', (document_id,))
             return cursor.rowcount > 0
 
+    def _document_filters(self, employee_id, document_type, search, start_date, end_date):
+        """Build WHERE clause for document queries"""
+        clauses = ['1=1']
+        params = []
+
+        if employee_id:
+            clauses.append('employee_id = ?')
+            params.append(employee_id)
+        if document_type:
+            clauses.append('document_type = ?')
+            params.append(document_type)
+        if start_date:
+            clauses.append('generated_date >= ?')
+            params.append(start_date.strftime('%Y-%m-%d'))
+        if end_date:
+            clauses.append('generated_date < ?')
+            params.append((end_date + timedelta(days=1)).strftime('%Y-%m-%d'))
+        if search:
+            clauses.append('(document_type LIKE ? OR document_name LIKE ?)')
+            params.extend([f'%{search}%', f'%{search}%'])
+
+        return ' AND '.join(clauses), params
+
     # Notification operations
     def create_notification(self, notification: Notification) -> int:
         """Create notification"""
@@ -354,7 +1104,784 @@ class Database:
             ''')
             return [self._row_to_notification(row) for row in cursor.fetchall()]
 
+    def get_notifications(self, employee_id: int = None, unread_only: bool = False,
+                          limit: int = None, offset: int = 0) -> List[Notification]:
+        """Get notifications, earliest due first"""
+        query = 'SELECT * FROM notifications WHERE 1=1'
+        params = []
+
+        if employee_id:
+            query += ' AND employee_id = ?'
+            params.append(employee_id)
+        if unread_only:
+            query += ' AND is_read = 0'
+
+        query += ' ORDER BY due_date ASC, id ASC'
+
+        if limit is not None:
+            query += ' LIMIT ? OFFSET ?'
+            params.extend([limit, offset])
+
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return [self._row_to_notification(row) for row in cursor.fetchall()]
+
+    def get_notification(self, notification_id: int) -> Optional[Notification]:
+        """Get notification by ID"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT * FROM notifications WHERE id = ?', (notification_id,))
+            row = cursor.fetchone()
+            if row:
+                return self._row_to_notification(row)
+            return None
+
+    def mark_notification_read(self, notification_id: int, is_read: bool = True) -> bool:
+        """Mark notification as read or unread"""
+        with self.get_cursor() as cursor:
+            cursor.execute('UPDATE notifications SET is_read = ? WHERE id = ?',
+                           (int(is_read), notification_id))
+            return cursor.rowcount > 0
+
+    def get_archivable_notification_rows(self, before: date, limit: int) -> List[tuple]:
+        """Get read notifications created before a date with all columns"""
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT id, employee_id, notification_type, title, message,
+                       due_date, is_read, created_at
+                FROM notifications
+                WHERE is_read = 1 AND created_at < ?
+                ORDER BY id
+                LIMIT ?
+            ''', (before.isoformat(), limit))
+            return cursor.fetchall()
+
+    def delete_notifications(self, notification_ids: Iterable[int]) -> int:
+        """Delete notifications"""
+        with self.get_cursor() as cursor:
+            cursor.executemany('DELETE FROM notifications WHERE id = ?', [(i,) for i in notification_ids])
+            return cursor.rowcount
+
+    def notification_exists(self, employee_id: Optional[int], notification_type: str,
+                            due_date: Optional[date]) -> bool:
+        """Check if a notification was already created"""
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                SELECT 1 FROM notifications
+                WHERE employee_id IS ? AND notification_type = ? AND due_date IS ?
+                LIMIT 1
+            ''', (employee_id, notification_type, due_date))
+            return cursor.fetchone() is not None
+
+    # Job state operations
+    def get_job_state(self, job: str) -> int:
+        """Get last processed ID of a background job"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT last_id FROM job_state WHERE job = ?', (job,))
+            row = cursor.fetchone()
+            return row['last_id'] if row else 0
+
+    def set_job_state(self, job: str, last_id: int):
+        """Store last processed ID of a background job"""
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                INSERT INTO job_state (job, last_id, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(job) DO UPDATE SET
+                    last_id = excluded.last_id,
+                    updated_at = excluded.updated_at
+            ''', (job, last_id))
+
+    # Archive operations
+    def get_archive_boundary(self, kind: str) -> Optional[Tuple[date, str]]:
+        """Get date before which rows are archived and the archive file"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT archived_before, archive_file FROM archive_state WHERE kind = ?', (kind,))
+            row = cursor.fetchone()
+            return (date.fromisoformat(row[0]), row[1]) if row else None
+
+    def set_archive_boundary(self, kind: str, archived_before: date, archive_file: str):
+        """Record archive boundary, never moving it back"""
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                INSERT INTO archive_state (kind, archived_before, archive_file, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(kind) DO UPDATE SET
+                    archived_before = MAX(archived_before, excluded.archived_before),
+                    archive_file = excluded.archive_file,
+                    updated_at = excluded.updated_at
+            ''', (kind, archived_before.isoformat(), archive_file))
+
+    def add_time_entry_archive_summary(self, rows: List[tuple]):
+        """Add (employee_id, month, entries, hours) totals of archived entries"""
+        with self.get_cursor() as cursor:
+            cursor.executemany('''
+                INSERT INTO time_entry_archive_summary (employee_id, month, entries, hours)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(employee_id, month) DO UPDATE SET
+                    entries = entries + excluded.entries,
+                    hours = hours + excluded.hours
+            ''', rows)
+
+    def add_time_entry_archive_work_modes(self, rows: List[tuple]):
+        """Add (month, work_mode, entries, hours) totals of archived entries"""
+        with self.get_cursor() as cursor:
+            cursor.executemany('''
+                INSERT INTO time_entry_archive_work_modes (month, work_mode, entries, hours)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(month, work_mode) DO UPDATE SET
+                    entries = entries + excluded.entries,
+                    hours = hours + excluded.hours
+            ''', rows)
+
+    def add_notification_archive_summary(self, rows: List[tuple]):
+        """Add (month, notification_type, count) totals of archived notifications"""
+        with self.get_cursor() as cursor:
+            cursor.executemany('''
+                INSERT INTO notification_archive_summary (month, notification_type, count)
+                VALUES (?, ?, ?)
+                ON CONFLICT(month, notification_type) DO UPDATE SET
+                    count = count + excluded.count
+            ''', rows)
+
+    def get_time_entry_archive_summary(self, employee_id: int = None, start_date: date = None,
+                                       end_date: date = None) -> List[sqlite3.Row]:
+        """Get monthly entry counts and hours of archived time entries"""
+        query = 'SELECT employee_id, month, entries, hours FROM time_entry_archive_summary WHERE 1=1'
+        params = []
+
+        if employee_id:
+            query += ' AND employee_id = ?'
+            params.append(employee_id)
+        if start_date:
+            query += ' AND month >= ?'
+            params.append(start_date.strftime('%Y-%m'))
+        if end_date:
+            query += ' AND month <= ?'
+            params.append(end_date.strftime('%Y-%m'))
+
+        query += ' ORDER BY month, employee_id'
+
+        with self.get_cursor() as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    # Reporting aggregates
+    def get_table_versions(self, tables: Iterable[str]) -> Dict[str, int]:
+        """
+        Get change counters of tables
+
+        A counter grows with every inserted, updated or deleted row, so an
+        unchanged value means the table content is unchanged. Time entries
+        count changes in all active year partitions.
+        """
+        tables = list(tables)
+        with self.get_cursor() as cursor:
+            cursor.execute(
+                f'SELECT name, version FROM table_versions WHERE name IN ({", ".join("?" * len(tables))})',
+                tables
+            )
+            versions = {row['name']: row['version'] for row in cursor.fetchall()}
+            if 'time_entries' in versions and self.partitions.enabled:
+                for table in self._time_entry_tables():
+                    schema = table.split('.')[0]
+                    cursor.execute(f"SELECT version FROM {schema}.table_versions WHERE name = 'time_entries'")
+                    row = cursor.fetchone()
+                    versions['time_entries'] += row[0] if row else 0
+        return versions
+
+    def get_headcount_by_department(self) -> List[tuple]:
+        """Get (department, employees, remote, hybrid, office) counts"""
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT COALESCE(NULLIF(department, ''), '(none)') AS dept,
+                       COUNT(*),
+                       SUM(work_mode = 'Remote'),
+                       SUM(work_mode = 'Hybrid'),
+                       SUM(work_mode = 'Office')
+                FROM employees
+                GROUP BY dept
+                ORDER BY COUNT(*) DESC, dept
+            ''')
+            return cursor.fetchall()
+
+    def get_contract_type_counts(self, on_date: date = None) -> List[tuple]:
+        """Get (contract type, employees, fixed term, expired) counts"""
+        on_date = on_date or date.today()
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT COALESCE(contract_type, '(none)') AS type,
+                       COUNT(*),
+                       SUM(contract_end_date IS NOT NULL),
+                       COALESCE(SUM(contract_end_date < ?), 0)
+                FROM employees
+                GROUP BY type
+                ORDER BY COUNT(*) DESC, type
+            ''', (on_date.isoformat(),))
+            return cursor.fetchall()
+
+    def get_leave_usage(self, start_date: date = None, end_date: date = None) -> List[tuple]:
+        """Get (department, leave type, requests, days) of approved leave starting in a range"""
+        query = '''
+            SELECT COALESCE(NULLIF(e.department, ''), '(none)') AS dept,
+                   lr.leave_type, COUNT(*), SUM(lr.days_count)
+            FROM leave_requests lr
+            JOIN employees e ON e.id = lr.employee_id
+            WHERE lr.status = 'Approved'
+        '''
+        params = []
+        if start_date:
+            query += ' AND lr.start_date >= ?'
+            params.append(start_date.isoformat())
+        if end_date:
+            query += ' AND lr.start_date <= ?'
+            params.append(end_date.isoformat())
+        query += ' GROUP BY dept, lr.leave_type ORDER BY dept, SUM(lr.days_count) DESC'
+
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(query, params)
+            return cursor.fetchall()
+
+    def get_approved_leave_ranges(self, start_date: date, end_date: date,
+                                  department: str = None) -> List[tuple]:
+        """
+        Get (department, employee_id, start_date, end_date) of approved leave overlapping a range
+
+        Rows are ordered by employee and start date.
+        """
+        query = '''
+            SELECT COALESCE(NULLIF(e.department, ''), '(none)') AS dept, lr.employee_id,
+                   lr.start_date, lr.end_date
+            FROM leave_requests lr
+            JOIN employees e ON e.id = lr.employee_id
+            WHERE lr.status = 'Approved' AND lr.start_date <= ? AND lr.end_date >= ?
+        '''
+        params = [end_date.isoformat(), start_date.isoformat()]
+        if department is not None:
+            query += " AND COALESCE(NULLIF(e.department, ''), '(none)') = ?"
+            params.append(department)
+
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(query + ' ORDER BY lr.employee_id, lr.start_date', params)
+            return cursor.fetchall()
+
+    def get_time_entry_totals(self, group_by: str, start_date: date = None,
+                              end_date: date = None) -> List[tuple]:
+        """
+        Get entry counts and hours of time entries grouped by a column
+
+        Args:
+            group_by: 'month' or 'work_mode'
+
+        Returns:
+            List of (group, entries, hours) tuples ordered by group, including
+            archived entries. Entries archived before work modes were
+            summarized are grouped under ARCHIVED_WORK_MODE.
+        """
+        expression = {'month': 'substr(date, 1, 7)', 'work_mode': 'work_mode'}[group_by]
+        where, params = self._time_entry_filters(None, start_date, end_date)
+        totals: Dict[str, list] = {}
+
+        def add(key, entries, hours):
+            total = totals.setdefault(key, [0, 0.0])
+            total[0] += entries
+            total[1] += hours or 0.0
+
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            for table in self._time_entry_tables(start_date, end_date):
+                cursor.execute(f'''
+                    SELECT {expression} AS grp, COUNT(*),
+                           SUM((julianday(check_out) - julianday(check_in)) * 24)
+                    FROM {table}
+                    WHERE {where}
+                    GROUP BY grp
+                ''', params)
+                for row in cursor.fetchall():
+                    add(*row)
+
+            months, params = '1=1', []
+            if start_date:
+                months += ' AND month >= ?'
+                params.append(start_date.strftime('%Y-%m'))
+            if end_date:
+                months += ' AND month <= ?'
+                params.append(end_date.strftime('%Y-%m'))
+
+            if group_by == 'month':
+                cursor.execute(f'''
+                    SELECT month, SUM(entries), SUM(hours) FROM time_entry_archive_summary
+                    WHERE {months} GROUP BY month
+                ''', params)
+                for row in cursor.fetchall():
+                    add(*row)
+            else:
+                cursor.execute(f'''
+                    SELECT work_mode, SUM(entries), SUM(hours) FROM time_entry_archive_work_modes
+                    WHERE {months} GROUP BY work_mode
+                ''', params)
+                for row in cursor.fetchall():
+                    add(*row)
+                # Archived entries whose work mode was not summarized
+                cursor.execute(f'''
+                    SELECT (SELECT COALESCE(SUM(entries), 0) FROM time_entry_archive_summary WHERE {months})
+                         - (SELECT COALESCE(SUM(entries), 0) FROM time_entry_archive_work_modes WHERE {months}),
+                           (SELECT COALESCE(SUM(hours), 0) FROM time_entry_archive_summary WHERE {months})
+                         - (SELECT COALESCE(SUM(hours), 0) FROM time_entry_archive_work_modes WHERE {months})
+                ''', params * 4)
+                entries, hours = cursor.fetchone()
+                if entries > 0:
+                    add(self.ARCHIVED_WORK_MODE, entries, hours)
+
+        return [(key, entries, round(hours, 2)) for key, (entries, hours) in sorted(totals.items())]
+
+    # Leave accrual
+    def accrue_leave(self, year: int, carry_over_cap: int = None, update_balances: bool = False) -> int:
+        """
+        Write the leave ledger for a year, optionally rewriting balances from it
+
+        Entitlement is annual_leave_days, pro-rated by whole months for
+        employees hired during the year (rounded up) and zero for those
+        hired later. The carry-over is the previous year's ledger balance,
+        capped at carry_over_cap, after refreshing that year's usage from
+        approved requests. Employees without a previous ledger row who
+        were added this year, or every employee when the ledger has no
+        previous year at all, keep their current balance: the carry-over
+        is inferred from remaining_leave_days. Other employees without a
+        row carry remaining_leave_days over as last year's leftover.
+        Manual adjustments already in the year's ledger are kept.
+
+        The ledger starts in the current year, since only then does
+        remaining_leave_days describe the year being accrued, and after
+        that only its newest year or the one following can be accrued,
+        so a later year is never left built on an outdated one.
+
+        Only the previous year's ledger and this year's requests are read,
+        and each step is one statement for all employees.
+
+        Args:
+            year: Year to accrue
+            carry_over_cap: Most days carried into the year (None for no cap)
+            update_balances: Set remaining_leave_days to the year's balance;
+                only allowed for the current year
+
+        Returns:
+            Number of employees in the year's ledger
+
+        Raises:
+            ValueError: update_balances is set for a year other than the current
+                one, or the year cannot be accrued from the ledger
+        """
+        if update_balances and year != date.today().year:
+            raise ValueError(f"Balances can only be updated from the current year's ledger, not {year}")
+        years = self.get_ledger_years()
+        if not years and year != date.today().year:
+            raise ValueError(f"The leave ledger starts in the current year, cannot accrue {year}")
+        if years and not years[-1] <= year <= years[-1] + 1:
+            raise ValueError(f"Only {years[-1]} or {years[-1] + 1} can be accrued, not {year}")
+
+        params = {
+            'year': year,
+            'first_day': date(year, 1, 1).isoformat(),
+            'last_day': date(year, 12, 31).isoformat(),
+            'previous_first_day': date(year - 1, 1, 1).isoformat(),
+            'previous_last_day': date(year - 1, 12, 31).isoformat(),
+            'cap': carry_over_cap,
+        }
+
+        with self.transaction(immediate=True):
+            with self.get_cursor() as cursor:
+                # Bring last year's usage up to date before carrying its balance over
+                cursor.execute('''
+                    UPDATE leave_ledger SET
+                        used = COALESCE((
+                            SELECT SUM(days_count) FROM leave_requests
+                            WHERE employee_id = leave_ledger.employee_id AND status = 'Approved'
+                              AND start_date BETWEEN :previous_first_day AND :previous_last_day
+                        ), 0),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE year = :year - 1
+                ''', params)
+                cursor.execute('''
+                    UPDATE leave_ledger SET balance = entitlement + carried_over + adjustment - used
+                    WHERE year = :year - 1
+                ''', params)
+
+                cursor.execute('''
+                    WITH entitlements AS (
+                        SELECT id AS employee_id, remaining_leave_days,
+                               strftime('%Y', created_at) >= CAST(:year AS TEXT) AS added_this_year,
+                               CASE
+                                   WHEN hire_date IS NULL OR hire_date < :first_day THEN annual_leave_days
+                                   WHEN hire_date > :last_day THEN 0
+                                   ELSE (annual_leave_days * (13 - CAST(strftime('%m', hire_date) AS INTEGER)) + 11) / 12
+                               END AS entitlement
+                        FROM employees
+                    ),
+                    usage AS (
+                        SELECT employee_id, SUM(days_count) AS used
+                        FROM leave_requests
+                        WHERE status = 'Approved' AND start_date BETWEEN :first_day AND :last_day
+                        GROUP BY employee_id
+                    ),
+                    carry AS (
+                        SELECT en.employee_id, en.entitlement, COALESCE(u.used, 0) AS used,
+                               COALESCE(c.adjustment, 0) AS adjustment,
+                               CASE
+                                   WHEN p.balance IS NOT NULL
+                                       THEN MIN(MAX(p.balance, 0), COALESCE(:cap, MAX(p.balance, 0)))
+                                   WHEN en.added_this_year
+                                        OR NOT EXISTS (SELECT 1 FROM leave_ledger WHERE year = :year - 1)
+                                       THEN en.remaining_leave_days + COALESCE(u.used, 0) - en.entitlement
+                                            - COALESCE(c.adjustment, 0)
+                                   ELSE MIN(MAX(en.remaining_leave_days, 0),
+                                            COALESCE(:cap, MAX(en.remaining_leave_days, 0)))
+                               END AS carried_over
+                        FROM entitlements en
+                        LEFT JOIN usage u ON u.employee_id = en.employee_id
+                        LEFT JOIN leave_ledger p ON p.employee_id = en.employee_id AND p.year = :year - 1
+                        LEFT JOIN leave_ledger c ON c.employee_id = en.employee_id AND c.year = :year
+                    )
+                    INSERT OR REPLACE INTO leave_ledger (
+                        employee_id, year, entitlement, carried_over, used, adjustment, balance, updated_at
+                    )
+                    SELECT employee_id, :year, entitlement, carried_over, used, adjustment,
+                           entitlement + carried_over + adjustment - used, CURRENT_TIMESTAMP
+                    FROM carry
+                ''', params)
+                cursor.execute('SELECT changes()')
+                count = cursor.fetchone()[0]
+
+                if update_balances:
+                    cursor.execute('''
+                        UPDATE employees SET
+                            remaining_leave_days = (
+                                SELECT balance FROM leave_ledger
+                                WHERE employee_id = employees.id AND year = :year
+                            ),
+                            version = version + 1
+                        WHERE id IN (SELECT employee_id FROM leave_ledger WHERE year = :year)
+                          AND remaining_leave_days != (
+                              SELECT balance FROM leave_ledger
+                              WHERE employee_id = employees.id AND year = :year
+                          )
+                    ''', params)
+        return count
+
+    def get_leave_ledger(self, year: int = None, employee_id: int = None) -> List[tuple]:
+        """Get (employee_id, year, entitlement, carried_over, used, adjustment, balance) ledger rows"""
+        query = ('SELECT employee_id, year, entitlement, carried_over, used, adjustment, balance '
+                 'FROM leave_ledger WHERE 1=1')
+        params = []
+        if year is not None:
+            query += ' AND year = ?'
+            params.append(year)
+        if employee_id is not None:
+            query += ' AND employee_id = ?'
+            params.append(employee_id)
+
+        with self.get_cursor() as cursor:
+            cursor.row_factory = None
+            cursor.execute(query + ' ORDER BY year, employee_id', params)
+            return cursor.fetchall()
+
+    def get_ledger_years(self) -> List[int]:
+        """Get years present in the leave ledger"""
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT DISTINCT year FROM leave_ledger ORDER BY year')
+            return [row[0] for row in cursor.fetchall()]
+
+    # Dashboard counters
+    def get_kpis(self) -> Dict[str, Any]:
+        """
+        Get dashboard counters
+
+        Returns:
+            Dictionary of counter values plus 'as_of', the day the
+            date-dependent counters refer to (None before reconciliation)
+        """
+        with self.get_cursor() as cursor:
+            cursor.execute('SELECT name, value, as_of FROM kpi_counters')
+            rows = cursor.fetchall()
+        kpis: Dict[str, Any] = {row['name']: row['value'] for row in rows}
+        days = {row['as_of'] for row in rows}
+        kpis['as_of'] = date.fromisoformat(days.pop()) if len(days) == 1 and None not in days else None
+        return kpis
+
+    def reconcile_kpis(self, as_of: date = None, window_days: int = 30) -> Dict[str, tuple]:
+        """
+        Recompute dashboard counters from the tables
+
+        Args:
+            as_of: Day for attendance, leave and contract counters
+            window_days: Days ahead in which a contract counts as expiring
+
+        Returns:
+            Counters that had drifted, as {name: (stored, actual)}
+        """
+        as_of = as_of or date.today()
+        day = as_of.isoformat()
+
+        # Read attendance before the transaction, the partition may need attaching
+        present = set()
+        with self.get_cursor() as cursor:
+            for table in self._time_entry_tables(as_of, as_of):
+                cursor.execute(f'SELECT DISTINCT employee_id FROM {table} WHERE date = ?', (day,))
+                present.update(row[0] for row in cursor.fetchall())
+
+        with self.transaction(immediate=True):
+            with self.get_cursor() as cursor:
+                cursor.execute('SELECT name, value, as_of, window_days FROM kpi_counters')
+                stored = {row['name']: row for row in cursor.fetchall()}
+
+                cursor.execute('SELECT COUNT(*) FROM employees')
+                headcount = cursor.fetchone()[0]
+                cursor.execute('''
+                    SELECT COUNT(DISTINCT employee_id) FROM leave_requests
+                    WHERE status = 'Approved' AND start_date <= ? AND end_date >= ?
+                ''', (day, day))
+                on_leave = cursor.fetchone()[0]
+                cursor.execute('''
+                    SELECT COUNT(*) FROM employees
+                    WHERE contract_end_date BETWEEN ? AND date(?, '+' || ? || ' days')
+                ''', (day, day, window_days))
+                expiring = cursor.fetchone()[0]
+
+                cursor.execute('DELETE FROM kpi_attendance')
+                cursor.executemany('INSERT INTO kpi_attendance (day, employee_id) VALUES (?, ?)',
+                                   [(day, employee_id) for employee_id in present])
+
+                actual = {
+                    'headcount': headcount,
+                    'attendance_today': len(present),
+                    'on_leave': on_leave,
+                    'expiring_contracts': expiring,
+                }
+                cursor.executemany('''
+                    UPDATE kpi_counters
+                    SET value = ?, as_of = ?, window_days = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE name = ?
+                ''', [(value, day, window_days, name) for name, value in actual.items()])
+
+        # Counters kept for another day or window are expected to differ
+        return {
+            name: (stored[name]['value'], value) for name, value in actual.items()
+            if name in stored and stored[name]['value'] != value
+            and stored[name]['as_of'] == day and stored[name]['window_days'] == window_days
+        }
+
+    # Statistics
+    def get_statistics(self) -> Dict[str, int]:
+        """Get record counts for an overview"""
+        with self.get_cursor() as cursor:
+            cursor.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM employees) AS employees,
+                    (SELECT COUNT(*) FROM leave_requests WHERE status = 'Pending') AS pending_leave_requests,
+                    (SELECT COUNT(*) FROM leave_requests WHERE status = 'Approved') AS approved_leave_requests,
+                    (SELECT COUNT(*) FROM leave_requests WHERE status = 'Rejected') AS rejected_leave_requests,
+                    (SELECT COUNT(*) FROM notifications WHERE is_read = 0) AS unread_notifications,
+                    (SELECT COUNT(*) FROM documents) AS documents,
+                    (SELECT COALESCE(SUM(entries), 0) FROM time_entry_archive_summary) AS archived_time_entries
+            ''')
+            statistics = dict(cursor.fetchone())
+        statistics['time_entries'] = self.count_time_entries()
+        return statistics
+
     # Helper methods
+    def _time_entry_tables(self, start_date: date = None, end_date: date = None,
+                           descending: bool = False):
+        """Tables holding time entries for a date range, in date order"""
+        if not self.partitions.enabled:
+            return ['time_entries']
+        return self.partitions.tables(start_date, end_date, descending)
+
+    @staticmethod
+    def _create_change_tracking(cursor, tables, schema: str = 'main'):
+        """Create table_versions and triggers counting changes of tables in a schema"""
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {schema}.table_versions (
+                name TEXT PRIMARY KEY,
+                version INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        for table in tables:
+            cursor.execute(f'INSERT OR IGNORE INTO {schema}.table_versions (name) VALUES (?)', (table,))
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS {schema}.trg_{table}_{event.lower()}_version
+                    AFTER {event} ON {table}
+                    BEGIN
+                        UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+                    END
+                ''')
+
+    def _archive_for_range(self, kind: str, start_date: Optional[date],
+                           end_date: Optional[date]) -> Tuple[Optional[ColdArchive], Optional[date]]:
+        """
+        Get archive holding part of a date range
+
+        Returns:
+            Archive (None if the range has no archived part) and the end
+            of the archived part of the range
+        """
+        boundary = self.get_archive_boundary(kind)
+        if not boundary or (start_date and start_date >= boundary[0]):
+            return None, end_date
+
+        archived_before, archive_file = boundary
+        archive = self._archives.get(archive_file)
+        if archive is None:
+            archive = self._archives[archive_file] = ColdArchive(self, archive_file)
+
+        last_archived = archived_before - timedelta(days=1)
+        return archive, min(end_date, last_archived) if end_date else last_archived
+
+    def _time_entry_filters(self, employee_id, start_date, end_date):
+        """Build WHERE clause for time entry queries"""
+        clauses = ['1=1']
+        params = []
+
+        if employee_id:
+            clauses.append('employee_id = ?')
+            params.append(employee_id)
+        if start_date:
+            clauses.append('date >= ?')
+            params.append(start_date)
+        if end_date:
+            clauses.append('date <= ?')
+            params.append(end_date)
+
+        return ' AND '.join(clauses), params
+
+    def _insert_partitioned(self, entries: List[TimeEntry]) -> Optional[int]:
+        """
+        Insert entries into their year partitions in one transaction
+
+        Returns:
+            ID of the last inserted entry
+        """
+        by_year: Dict[int, list] = {}
+        for entry in entries:
+            by_year.setdefault(entry.date.year, []).append(entry)
+        if len(by_year) > self.partitions.MAX_ATTACHED:
+            raise ValueError(f"Cannot insert entries for more than {self.partitions.MAX_ATTACHED} years at once")
+
+        # Attach before the transaction starts
+        tables = {year: self.partitions.ensure(year) for year in by_year}
+
+        with self.get_cursor() as cursor:
+            next_id = self.partitions.allocate_ids(len(entries))
+            for year, year_entries in by_year.items():
+                params = []
+                for entry in year_entries:
+                    params.append((next_id,) + self._time_entry_params(entry))
+                    next_id += 1
+                cursor.executemany(f'''
+                    INSERT INTO {tables[year]} (
+                        id, employee_id, date, check_in, check_out, work_mode, notes
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', params)
+            self._record_attendance(cursor, entries)
+        return next_id - 1
+
+    def _record_attendance(self, cursor, entries: List[TimeEntry]):
+        """Add employees with entries dated today to the attendance counter"""
+        today = date.today()
+        present = {(today.isoformat(), entry.employee_id) for entry in entries if entry.date == today}
+        if present:
+            cursor.executemany('INSERT OR IGNORE INTO kpi_attendance (day, employee_id) VALUES (?, ?)', present)
+
+    @staticmethod
+    def _create_kpi_triggers(cursor):
+        """Create triggers applying row changes to the dashboard counters"""
+        for name in ('headcount', 'attendance_today', 'on_leave', 'expiring_contracts'):
+            cursor.execute('INSERT OR IGNORE INTO kpi_counters (name) VALUES (?)', (name,))
+
+        # 1 if an employee row counts as an expiring contract on the counter's day
+        def expiring(row):
+            return (f"COALESCE({row}.contract_end_date BETWEEN as_of "
+                    f"AND date(as_of, '+' || window_days || ' days'), 0)")
+
+        # 1 if a leave request row makes its employee absent on the counter's day,
+        # counting each employee once however many approved requests overlap
+        def on_leave(row):
+            return (f"COALESCE({row}.status = 'Approved' AND as_of BETWEEN {row}.start_date AND {row}.end_date "
+                    f"AND NOT EXISTS (SELECT 1 FROM leave_requests other "
+                    f"WHERE other.employee_id = {row}.employee_id AND other.id != {row}.id "
+                    f"AND other.status = 'Approved' AND as_of BETWEEN other.start_date AND other.end_date), 0)")
+
+        triggers = {
+            'trg_employees_insert_kpi': ('AFTER INSERT ON employees', f'''
+                UPDATE kpi_counters SET value = value + 1 WHERE name = 'headcount';
+                UPDATE kpi_counters SET value = value + {expiring('NEW')} WHERE name = 'expiring_contracts';
+            '''),
+            'trg_employees_delete_kpi': ('AFTER DELETE ON employees', f'''
+                UPDATE kpi_counters SET value = value - 1 WHERE name = 'headcount';
+                UPDATE kpi_counters SET value = value - {expiring('OLD')} WHERE name = 'expiring_contracts';
+            '''),
+            'trg_employees_contract_kpi': ('AFTER UPDATE OF contract_end_date ON employees', f'''
+                UPDATE kpi_counters SET value = value + {expiring('NEW')} - {expiring('OLD')}
+                WHERE name = 'expiring_contracts';
+            '''),
+            'trg_leave_requests_insert_kpi': ('AFTER INSERT ON leave_requests', f'''
+                UPDATE kpi_counters SET value = value + {on_leave('NEW')} WHERE name = 'on_leave';
+            '''),
+            'trg_leave_requests_delete_kpi': ('AFTER DELETE ON leave_requests', f'''
+                UPDATE kpi_counters SET value = value - {on_leave('OLD')} WHERE name = 'on_leave';
+            '''),
+            'trg_leave_requests_update_kpi': ('AFTER UPDATE OF employee_id, status, start_date, end_date ON leave_requests', f'''
+                UPDATE kpi_counters SET value = value + {on_leave('NEW')} - {on_leave('OLD')} WHERE name = 'on_leave';
+            '''),
+            'trg_kpi_attendance_insert': ('AFTER INSERT ON kpi_attendance', '''
+                UPDATE kpi_counters SET value = value + 1 WHERE name = 'attendance_today' AND as_of = NEW.day;
+            '''),
+        }
+        for name, (event, body) in triggers.items():
+            sql = f'CREATE TRIGGER {name} {event} BEGIN {body} END'
+            # Replace triggers created by older versions with a different definition
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,))
+            row = cursor.fetchone()
+            if row and row[0] == sql:
+                continue
+            cursor.execute(f'DROP TRIGGER IF EXISTS {name}')
+            cursor.execute(sql)
+
+    def _time_entry_params(self, entry: TimeEntry) -> tuple:
+        """Get insert parameters for a time entry"""
+        return (
+            entry.employee_id, entry.date, entry.check_in,
+            entry.check_out, entry.work_mode.value, entry.notes
+        )
+
+    def _check_version(self, cursor, table: str, record) -> bool:
+        """
+        Check result of a versioned update and advance the record version
+
+        Returns:
+            True if updated, False if the row does not exist
+
+        Raises:
+            ConflictError: The row exists with another version
+        """
+        if cursor.rowcount > 0:
+            record.version += 1
+            return True
+        cursor.execute(f'SELECT 1 FROM {table} WHERE id = ?', (record.id,))
+        if cursor.fetchone():
+            raise ConflictError(table, record.id)
+        return False
+
+    def _ensure_column(self, cursor, table: str, column: str, definition: str):
+        """Add column to table if it does not exist yet"""
+        cursor.execute(f'PRAGMA table_info({table})')
+        if column not in {row['name'] for row in cursor.fetchall()}:
+            cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} {definition}')
+
     def _row_to_employee(self, row) -> Employee:
         """Convert database row to Employee object"""
         return Employee(
@@ -367,18 +1894,19 @@ class Database:
             email=row['email'],
             position=row['position'],
             department=row['department'],
-            hire_date=datetime.strptime(row['hire_date'], '%Y-%m-%d').date() if row['hire_date'] else None,
+            hire_date=date.fromisoformat(row['hire_date']) if row['hire_date'] else None,
             contract_number=row['contract_number'],
             contract_type=ContractType(row['contract_type']),
-            contract_end_date=datetime.strptime(row['contract_end_date'], '%Y-%m-%d').date() if row[
+            contract_end_date=date.fromisoformat(row['contract_end_date']) if row[
                 'contract_end_date'] else None,
             annual_leave_days=row['annual_leave_days'],
             remaining_leave_days=row['remaining_leave_days'],
             work_mode=WorkMode(row['work_mode']),
-            medical_exam_date=datetime.strptime(row['medical_exam_date'], '%Y-%m-%d').date() if row[
+            medical_exam_date=date.fromisoformat(row['medical_exam_date']) if row[
                 'medical_exam_date'] else None,
-            safety_training_date=datetime.strptime(row['safety_training_date'], '%Y-%m-%d').date() if row[
-                'safety_training_date'] else None
+            safety_training_date=date.fromisoformat(row['safety_training_date']) if row[
+                'safety_training_date'] else None,
+            version=row['version']
         )
 
     def _row_to_time_entry(self, row) -> TimeEntry:
@@ -386,9 +1914,9 @@ class Database:
         return TimeEntry(
             id=row['id'],
             employee_id=row['employee_id'],
-            date=datetime.strptime(row['date'], '%Y-%m-%d').date(),
-            check_in=datetime.strptime(row['check_in'], '%Y-%m-%d %H:%M:%S') if row['check_in'] else None,
-            check_out=datetime.strptime(row['check_out'], '%Y-%m-%d %H:%M:%S') if row['check_out'] else None,
+            date=date.fromisoformat(row['date']),
+            check_in=datetime.fromisoformat(row['check_in']) if row['check_in'] else None,
+            check_out=datetime.fromisoformat(row['check_out']) if row['check_out'] else None,
             work_mode=WorkMode(row['work_mode']),
             notes=row['notes']
         )
@@ -399,13 +1927,28 @@ class Database:
             id=row['id'],
             employee_id=row['employee_id'],
             leave_type=LeaveType(row['leave_type']),
-            start_date=datetime.strptime(row['start_date'], '%Y-%m-%d').date(),
-            end_date=datetime.strptime(row['end_date'], '%Y-%m-%d').date(),
+            start_date=date.fromisoformat(row['start_date']),
+            end_date=date.fromisoformat(row['end_date']),
             days_count=row['days_count'],
             reason=row['reason'],
             status=row['status'],
             approved_by=row['approved_by'],
-            approved_date=datetime.strptime(row['approved_date'], '%Y-%m-%d %H:%M:%S') if row['approved_date'] else None
+            approved_date=datetime.fromisoformat(row['approved_date']) if row['approved_date'] else None,
+            rejection_reason=row['rejection_reason'],
+            version=row['version']
+        )
+
+    def _row_to_document(self, row) -> Document:
+        """Convert database row to Document object"""
+        return Document(
+            id=row['id'],
+            employee_id=row['employee_id'],
+            document_type=row['document_type'],
+            document_name=row['document_name'],
+            file_path=row['file_path'],
+            content_hash=row['content_hash'],
+            generated_date=datetime.fromisoformat(row['generated_date'][:19]) if row['generated_date'] else None,
+            version=row['version']
         )
 
     def _row_to_notification(self, row) -> Notification:
@@ -416,6 +1959,6 @@ class Database:
             notification_type=row['notification_type'],
             title=row['title'],
             message=row['message'],
-            due_date=datetime.strptime(row['due_date'], '%Y-%m-%d').date() if row['due_date'] else None,
+            due_date=date.fromisoformat(row['due_date']) if row['due_date'] else None,
             is_read=bool(row['is_read'])
         )
\ No newline at end of file
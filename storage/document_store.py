@@ -0,0 +1,211 @@
+"""
+Content-addressed document storage for Employee Management System
+"""
+
+import hashlib
+import lzma
+import os
+import re
+import tempfile
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+from models import Document
+
+
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_LZMA = "lzma"
+
+_LZMA_MAGIC = b'\xfd7zXZ\x00'
+
+DOCUMENT_TYPES = [
+    'Employment Contract',
+    'Service Contract',
+    'Work Contract',
+    'Employment Certificate',
+    'Salary Certificate',
+    'Leave Confirmation',
+    'Termination Letter',
+    'Reference Letter'
+]
+
+# <Document_Type>_<First>_<Last>_<YYYYmmdd>_<HHMMSS>[_suffix].txt
+_FILENAME_PATTERN = re.compile(r'^(?P<stem>.+)_(?P<date>\d{8})_(?P<time>\d{6})(?:_[0-9a-f]+)?\.txt$')
+
+# job_state entry marking the loose file import as done
+_IMPORT_JOB = 'document_file_import'
+
+
+class DocumentStore:
+    """
+    Compressed document store keyed by content hash
+
+    Each distinct document body is stored once as a compressed blob in a
+    sharded layout (``<root>/ab/cd/<sha256>``). Storing content that is
+    already present only costs a hash and a stat.
+    """
+
+    def __init__(self, root_dir: str = os.path.join("documents", "store"),
+                 compression: str = COMPRESSION_ZLIB, level: Optional[int] = None):
+        if compression not in (COMPRESSION_ZLIB, COMPRESSION_LZMA):
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.root_dir = root_dir
+        self.compression = compression
+        self.level = level
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """Get hash identifying document content"""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def blob_path(self, content_hash: str) -> str:
+        """Get path of the blob for a content hash"""
+        return os.path.join(self.root_dir, content_hash[:2], content_hash[2:4], content_hash)
+
+    def exists(self, content_hash: str) -> bool:
+        """Check if content is stored"""
+        return os.path.exists(self.blob_path(content_hash))
+
+    def put(self, content: str) -> str:
+        """
+        Store document content
+
+        Returns:
+            Content hash used as the document key
+        """
+        data = content.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(content_hash)
+        if os.path.exists(path):
+            return content_hash
+
+        shard_dir = os.path.dirname(path)
+        Path(shard_dir).mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and move it into place so readers never
+        # see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=shard_dir, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(self._compress(data))
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        return content_hash
+
+    def get(self, content_hash: str) -> str:
+        """Read and decompress document content"""
+        with open(self.blob_path(content_hash), 'rb') as f:
+            data = f.read()
+        return self._decompress(data).decode('utf-8')
+
+    def delete(self, content_hash: str) -> bool:
+        """Delete stored content"""
+        try:
+            os.unlink(self.blob_path(content_hash))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def export(self, content_hash: str, path: str) -> str:
+        """Write decompressed content to a regular file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.get(content_hash))
+        return path
+
+    def save_document(self, database, employee_id: int, document_type: str,
+                      document_name: str, content: str) -> Document:
+        """Store content and record the generated document in the database"""
+        content_hash = self.put(content)
+        document = Document(
+            employee_id=employee_id,
+            document_type=document_type,
+            document_name=document_name,
+            file_path=self.blob_path(content_hash),
+            content_hash=content_hash,
+            generated_date=datetime.now()
+        )
+        document.id = database.create_document(document)
+        return document
+
+    def _compress(self, data: bytes) -> bytes:
+        """Compress blob data"""
+        if self.compression == COMPRESSION_LZMA:
+            return lzma.compress(data, preset=self.level if self.level is not None else 6)
+        return zlib.compress(data, self.level if self.level is not None else 6)
+
+    @staticmethod
+    def _decompress(data: bytes) -> bytes:
+        """Decompress blob data, detecting the format from its header"""
+        if data.startswith(_LZMA_MAGIC):
+            return lzma.decompress(data)
+        return zlib.decompress(data)
+
+
+def import_document_files(database, directory: str = "documents", once: bool = False) -> Tuple[int, int]:
+    """
+    Index loose document files generated by earlier versions
+
+    Files are matched to employees and document types by their name.
+    Files that are already indexed are skipped, so running the import
+    again only adds new files. Completion is recorded in job_state.
+
+    Args:
+        database: Database instance
+        directory: Directory with the loose files
+        once: Skip the import if it has completed before
+
+    Returns:
+        Tuple of imported and skipped file counts
+    """
+    if once and database.get_job_state(_IMPORT_JOB):
+        return 0, 0
+    if not os.path.isdir(directory):
+        database.set_job_state(_IMPORT_JOB, 1)
+        return 0, 0
+
+    known_paths = database.get_document_paths()
+    employees = {emp.name.replace(' ', '_'): emp.id for emp in database.get_employee_names()}
+    type_prefixes = [(doc_type.replace(' ', '_') + '_', doc_type) for doc_type in DOCUMENT_TYPES]
+
+    imported = 0
+    skipped = 0
+    with database.transaction(), os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.path in known_paths:
+                continue
+
+            match = _FILENAME_PATTERN.match(entry.name)
+            if not match:
+                skipped += 1
+                continue
+
+            stem = match.group('stem')
+            document_type = None
+            employee_id = None
+            for prefix, doc_type in type_prefixes:
+                if stem.startswith(prefix):
+                    document_type = doc_type
+                    employee_id = employees.get(stem[len(prefix):])
+                    break
+
+            if not document_type or not employee_id:
+                skipped += 1
+                continue
+
+            database.create_document(Document(
+                employee_id=employee_id,
+                document_type=document_type,
+                document_name=entry.name,
+                file_path=entry.path,
+                generated_date=datetime.strptime(match.group('date') + match.group('time'), '%Y%m%d%H%M%S')
+            ))
+            imported += 1
+        database.set_job_state(_IMPORT_JOB, 1)
+
+    return imported, skipped
@@ -0,0 +1,277 @@
+"""
+Year partitions of the time_entries table
+"""
+
+import os
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+
+class TimeEntryPartitions:
+    """
+    Route time entries to one attached SQLite file per year
+
+    Partitioning is enabled once per database with enable(), which moves
+    existing entries out of the main file. The registry of partitions is
+    kept in the main database, so every connection picks it up. Entry IDs
+    stay unique across years through a sequence in the main database.
+
+    SQLite limits the number of attached databases and cannot attach or
+    detach inside a transaction. The most recent years are attached when
+    connecting; older ones are attached on demand and the least recently
+    used partition is detached to make room.
+    """
+
+    MAX_ATTACHED = 8
+
+    def __init__(self, database):
+        self.db = database
+        self.years: Dict[int, dict] = {}
+        self._attached: 'OrderedDict[int, None]' = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if time entries are stored in year partitions"""
+        return bool(self.years)
+
+    @staticmethod
+    def schema(year: int) -> str:
+        """Get schema name of an attached partition"""
+        return f'te_{year}'
+
+    def file_name(self, year: int) -> str:
+        """Get file name of a partition"""
+        stem = os.path.splitext(os.path.basename(self.db.db_path))[0]
+        return f'{stem}_time_entries_{year}.db'
+
+    def file_path(self, year: int) -> str:
+        """Get path of a partition file next to the main database"""
+        info = self.years.get(year)
+        name = info['file_name'] if info else self.file_name(year)
+        return os.path.join(os.path.dirname(os.path.abspath(self.db.db_path)), name)
+
+    def load(self):
+        """Read partition registry and attach the most recent years"""
+        self.years = {}
+        self._attached.clear()
+        connection = self.db.connection
+        exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'time_entry_partitions'"
+        ).fetchone()
+        if not exists:
+            return
+
+        for year, file_name, detached in connection.execute(
+                'SELECT year, file_name, detached FROM time_entry_partitions'):
+            self.years[year] = {'file_name': file_name, 'detached': bool(detached)}
+
+        for year in self.active_years(descending=True)[:self.MAX_ATTACHED]:
+            self.attach(year)
+        self._reconcile_sequence()
+
+        # Have the current year ready for inserts made inside transactions
+        if date.today().year not in self.years:
+            self.ensure(date.today().year)
+
+    def enable(self) -> Dict[int, int]:
+        """
+        Turn on partitioning, moving existing entries to year files
+
+        Each year is moved in its own transaction so the write lock is
+        released between years.
+
+        Returns:
+            Number of entries moved per year
+        """
+        connection = self.db.connection
+        with self.db.get_cursor() as cursor:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS time_entry_partitions (
+                    year INTEGER PRIMARY KEY,
+                    file_name TEXT NOT NULL,
+                    detached INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS sequences (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            ''')
+            # Continue after the highest ID ever used by the main table
+            cursor.execute('''
+                INSERT OR IGNORE INTO sequences (name, value)
+                SELECT 'time_entries', MAX(
+                    COALESCE((SELECT MAX(id) FROM time_entries), 0),
+                    COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'time_entries'), 0)
+                )
+            ''')
+            cursor.execute("SELECT DISTINCT substr(date, 1, 4) FROM time_entries")
+            years = sorted(int(row[0]) for row in cursor.fetchall())
+
+        moved = {}
+        for year in years or [date.today().year]:
+            self.ensure(year)
+            with self.db.transaction(immediate=True):
+                params = (f'{year}-01-01', f'{year + 1}-01-01')
+                cursor = connection.execute(f'''
+                    INSERT INTO {self.schema(year)}.time_entries
+                    SELECT id, employee_id, date, check_in, check_out, work_mode, notes, created_at
+                    FROM main.time_entries WHERE date >= ? AND date < ?
+                ''', params)
+                moved[year] = cursor.rowcount
+                connection.execute('DELETE FROM main.time_entries WHERE date >= ? AND date < ?', params)
+        return moved
+
+    def active_years(self, descending: bool = False) -> List[int]:
+        """Get years whose partitions are in use"""
+        return sorted((year for year, info in self.years.items() if not info['detached']),
+                      reverse=descending)
+
+    def overlapping(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                    descending: bool = False) -> List[int]:
+        """Get active partition years overlapping a date range"""
+        first = start_date.year if start_date else None
+        last = end_date.year if end_date else None
+        return [
+            year for year in self.active_years(descending)
+            if (first is None or year >= first) and (last is None or year <= last)
+        ]
+
+    def tables(self, start_date: Optional[date] = None, end_date: Optional[date] = None,
+               descending: bool = False) -> Iterator[str]:
+        """
+        Yield qualified table names of partitions overlapping a range
+
+        Partitions are attached one at a time as the caller iterates, so
+        each query must finish before the next table is requested.
+        """
+        for year in self.overlapping(start_date, end_date, descending):
+            self.attach(year)
+            yield f'{self.schema(year)}.time_entries'
+
+    def ensure(self, year: int) -> str:
+        """Create partition for a year if needed and attach it"""
+        if year not in self.years:
+            self.attach(year)
+            self.years[year] = {'file_name': self.file_name(year), 'detached': False}
+            schema = self.schema(year)
+            connection = self.db.connection
+            journal_mode = connection.execute('PRAGMA main.journal_mode').fetchone()[0]
+            connection.execute(f'PRAGMA {schema}.journal_mode = {journal_mode}')
+            with self.db.get_cursor() as cursor:
+                cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {schema}.time_entries (
+                        id INTEGER PRIMARY KEY,
+                        employee_id INTEGER NOT NULL,
+                        date DATE NOT NULL,
+                        check_in TIMESTAMP,
+                        check_out TIMESTAMP,
+                        work_mode TEXT DEFAULT 'Office',
+                        notes TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                cursor.execute(f'''
+                    CREATE INDEX IF NOT EXISTS {schema}.idx_time_entries_employee_check_in
+                    ON time_entries(employee_id, check_in)
+                ''')
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS {schema}.idx_time_entries_date ON time_entries(date)')
+                self.db._create_change_tracking(cursor, ('time_entries',), schema)
+                cursor.execute('''
+                    INSERT OR IGNORE INTO time_entry_partitions (year, file_name) VALUES (?, ?)
+                ''', (year, self.years[year]['file_name']))
+        elif self.years[year]['detached']:
+            raise ValueError(f"Time entry partition {year} is detached")
+        else:
+            self.attach(year)
+        return f'{self.schema(year)}.time_entries'
+
+    def attach(self, year: int):
+        """Attach partition file, detaching the least recently used one if needed"""
+        if year in self._attached:
+            self._attached.move_to_end(year)
+            return
+
+        connection = self.db.connection
+        if connection.in_transaction:
+            raise RuntimeError(
+                f"Time entry partition {year} is not attached and cannot be attached inside a transaction"
+            )
+        while len(self._attached) >= self.MAX_ATTACHED:
+            oldest, _ = self._attached.popitem(last=False)
+            connection.execute(f'DETACH DATABASE {self.schema(oldest)}')
+        connection.execute(f'ATTACH DATABASE ? AS {self.schema(year)}', (self.file_path(year),))
+        self._attached[year] = None
+
+    def detach(self, year: int):
+        """
+        Take a partition out of use
+
+        The file stays on disk and can be archived, moved or brought back
+        with reattach(). Its entries are no longer returned by queries.
+        """
+        if year not in self.years:
+            raise ValueError(f"No time entry partition for {year}")
+        with self.db.get_cursor() as cursor:
+            cursor.execute('UPDATE time_entry_partitions SET detached = 1 WHERE year = ?', (year,))
+        self.years[year]['detached'] = True
+        if year in self._attached:
+            del self._attached[year]
+            self.db.connection.execute(f'DETACH DATABASE {self.schema(year)}')
+
+    def reattach(self, year: int):
+        """Bring a detached partition back into use"""
+        if year not in self.years:
+            raise ValueError(f"No time entry partition for {year}")
+        if not os.path.exists(self.file_path(year)):
+            raise FileNotFoundError(self.file_path(year))
+        with self.db.get_cursor() as cursor:
+            cursor.execute('UPDATE time_entry_partitions SET detached = 0 WHERE year = ?', (year,))
+        self.years[year]['detached'] = False
+        self.attach(year)
+
+    def allocate_ids(self, count: int) -> int:
+        """
+        Reserve IDs for new entries
+
+        Must be called inside the transaction that inserts the entries.
+
+        Returns:
+            First reserved ID
+        """
+        connection = self.db.connection
+        connection.execute("UPDATE sequences SET value = value + ? WHERE name = 'time_entries'", (count,))
+        last = connection.execute("SELECT value FROM sequences WHERE name = 'time_entries'").fetchone()[0]
+        return last - count + 1
+
+    def info(self) -> List[dict]:
+        """Get year, file, state and size of each partition"""
+        result = []
+        for year in sorted(self.years):
+            path = self.file_path(year)
+            result.append({
+                'year': year,
+                'file_path': path,
+                'detached': self.years[year]['detached'],
+                'attached': year in self._attached,
+                'size_bytes': os.path.getsize(path) if os.path.exists(path) else 0,
+            })
+        return result
+
+    def _reconcile_sequence(self):
+        """Move the ID sequence past IDs found in partitions"""
+        # Partition files commit separately in WAL mode, so a crash can
+        # leave rows whose IDs the sequence has not recorded yet
+        highest = 0
+        for year in list(self._attached):
+            row = self.db.connection.execute(
+                f'SELECT MAX(id) FROM {self.schema(year)}.time_entries'
+            ).fetchone()
+            highest = max(highest, row[0] or 0)
+        self.db.connection.execute(
+            "UPDATE sequences SET value = ? WHERE name = 'time_entries' AND value < ?", (highest, highest)
+        )
+        self.db.connection.commit()
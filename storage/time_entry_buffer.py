@@ -0,0 +1,283 @@
+"""
+Write-behind buffer for time entry ingestion
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from models import TimeEntry, Employee
+from storage.database import Database
+from utils.logger import get_logger
+
+
+# Durability modes mapped to SQLite synchronous settings
+DURABILITY_MODES = {
+    "full": "FULL",      # fsync on every commit
+    "normal": "NORMAL",  # fsync less often than FULL, the journal mode is left as is
+    "off": "OFF",        # leave flushing to the operating system
+}
+
+
+class TimeEntryBuffer:
+    """
+    Batch time entry inserts and commit them as a group
+
+    Entries added with add() are queued and written by a background
+    thread with a single executemany and commit, either when batch_size
+    entries are waiting or flush_interval_ms has passed since the oldest
+    one was queued.
+
+    If a batch breaks a constraint, its entries are written one by one and
+    the entries that fail are set aside in rejected instead of blocking
+    the queue. Other errors put the batch back for a retry, up to
+    max_retries times in a row, after which it is rejected as well.
+    """
+
+    def __init__(self, db_path: str = "employee_management.db",
+                 batch_size: int = 200,
+                 flush_interval_ms: int = 250,
+                 durability: str = "normal",
+                 max_retries: int = 5):
+        """
+        Initialize buffer
+
+        Args:
+            db_path: Path to database file
+            batch_size: Number of queued entries that triggers a commit
+            flush_interval_ms: Maximum time an entry waits before commit
+            durability: 'full', 'normal' or 'off'
+            max_retries: Failed attempts at a batch before it is rejected
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.durability = durability
+        self.max_retries = max_retries
+        self.logger = get_logger()
+
+        # Own connection, used only while holding the write lock
+        self.db = Database(db_path, check_same_thread=False)
+        self.db.connection.execute(f"PRAGMA synchronous = {DURABILITY_MODES[durability]}")
+
+        self._pending = deque()
+        self._oldest = None
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closed = False
+        self._failures = 0  # Failed attempts in a row
+        self.rejected: List[TimeEntry] = []  # Entries given up on
+
+        self.stats = {
+            'rows_written': 0,
+            'batches': 0,
+            'write_seconds': 0.0,
+            'errors': 0,
+            'rejected': 0,
+        }
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def add(self, entry: TimeEntry):
+        """Queue time entry for writing"""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Time entry buffer is closed")
+            if not self._pending:
+                self._oldest = time.monotonic()
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def add_many(self, entries: List[TimeEntry]):
+        """Queue several time entries"""
+        for entry in entries:
+            self.add(entry)
+
+    @property
+    def pending(self) -> int:
+        """Number of entries waiting to be written"""
+        return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write all queued entries now
+
+        Returns:
+            Number of entries written
+        """
+        written = 0
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return written
+            written += self._write(batch)
+
+    def close(self):
+        """Flush queued entries and stop the background writer"""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        try:
+            self.flush()
+        finally:
+            if self._pending:
+                self.logger.error(f"Time entry buffer closed with {len(self._pending)} entries not written")
+            self.db.close()
+
+    def throughput(self) -> float:
+        """Rows written per second of database time"""
+        if not self.stats['write_seconds']:
+            return 0.0
+        return self.stats['rows_written'] / self.stats['write_seconds']
+
+    def _run(self):
+        """Background writer loop"""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if len(self._pending) >= self.batch_size:
+                        break
+                    if self._pending:
+                        remaining = self._oldest + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+                if self._closed:
+                    return
+
+            batch = self._take_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                except Exception:
+                    # Entries were requeued, back off before retrying
+                    time.sleep(self.flush_interval * self._failures)
+
+    def _take_batch(self) -> List[TimeEntry]:
+        """Remove up to batch_size entries from the queue"""
+        with self._condition:
+            count = min(len(self._pending), self.batch_size)
+            batch = [self._pending.popleft() for _ in range(count)]
+            self._oldest = time.monotonic() if self._pending else None
+            return batch
+
+    def _write(self, batch: List[TimeEntry]) -> int:
+        """Insert a batch in one transaction"""
+        with self._write_lock:
+            started = time.perf_counter()
+            remaining = deque(batch)
+            try:
+                try:
+                    self.db.create_time_entries(batch)
+                    written = len(batch)
+                except sqlite3.IntegrityError as e:
+                    self.stats['errors'] += 1
+                    self.logger.warning(f"Time entry batch of {len(batch)} rejected ({e}), "
+                                        f"writing entries one by one")
+                    written = self._write_each(remaining)
+            except Exception as e:
+                self.stats['errors'] += 1
+                self._failures += 1
+                if self._failures >= self.max_retries:
+                    self.logger.error(f"Giving up on {len(remaining)} time entries after "
+                                      f"{self._failures} failed attempts: {e}")
+                    self._reject(remaining)
+                    self._failures = 0
+                    return 0
+                self.logger.error(f"Failed to write {len(remaining)} time entries: {e}")
+                # Put entries back so the next flush retries them
+                with self._condition:
+                    self._pending.extendleft(reversed(remaining))
+                    if self._oldest is None:
+                        self._oldest = time.monotonic()
+                raise
+            self._failures = 0
+            self.stats['write_seconds'] += time.perf_counter() - started
+            self.stats['rows_written'] += written
+            self.stats['batches'] += 1
+            return written
+
+    def _write_each(self, entries: deque) -> int:
+        """Insert entries one at a time, rejecting those that break a constraint"""
+        written = 0
+        while entries:
+            entry = entries[0]
+            try:
+                self.db.create_time_entries([entry])
+                written += 1
+            except sqlite3.IntegrityError as e:
+                self.logger.error(f"Rejected time entry for employee {entry.employee_id} "
+                                  f"on {entry.date}: {e}")
+                self._reject([entry])
+            # Only entries that were handled leave the queue
+            entries.popleft()
+        return written
+
+    def _reject(self, entries):
+        """Set entries aside instead of retrying them"""
+        self.rejected.extend(entries)
+        self.stats['rejected'] += len(entries)
+
+
+def benchmark(rows: int = 2000, durability: str = "full") -> Dict[str, float]:
+    """
+    Compare per-row commits with buffered group commits
+
+    Returns:
+        Rows per second for both methods and the speedup
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "benchmark.db")
+        db = Database(db_path)
+        db.create_tables()
+        db.connection.execute(f"PRAGMA synchronous = {DURABILITY_MODES[durability]}")
+        employee_id = db.create_employee(Employee(first_name="Bench", last_name="Mark", pesel="00000000000"))
+
+        start = datetime(2025, 1, 6, 8, 0)
+        entries = [
+            TimeEntry(employee_id=employee_id, date=start.date(),
+                      check_in=start + timedelta(seconds=i), check_out=start + timedelta(hours=8))
+            for i in range(rows)
+        ]
+
+        started = time.perf_counter()
+        for entry in entries:
+            db.create_time_entry(entry)
+        per_row = rows / (time.perf_counter() - started)
+        db.close()
+
+        started = time.perf_counter()
+        with TimeEntryBuffer(db_path, durability=durability) as buffer:
+            buffer.add_many(entries)
+        buffered = rows / (time.perf_counter() - started)
+
+    return {
+        'per_row_commit_rows_per_second': round(per_row, 1),
+        'buffered_rows_per_second': round(buffered, 1),
+        'speedup': round(buffered / per_row, 1),
+    }
+
+
+if __name__ == "__main__":
+    for mode in DURABILITY_MODES:
+        print(mode, benchmark(durability=mode))
@@ -0,0 +1,163 @@
+"""
+Vectorized time tracking analytics for Employee Management System
+"""
+
+import calendar
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, Optional
+
+import numpy as np
+
+from models import TimeEntry
+from storage.database import Database
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class TimeEntryArrays:
+    """Time entries as parallel NumPy arrays"""
+    employee_ids: np.ndarray     # Distinct employee IDs, sorted
+    employee_index: np.ndarray   # Per entry index into employee_ids
+    day: np.ndarray              # Per entry days since 1970-01-01
+    check_in: np.ndarray         # Per entry Unix seconds, -1 if missing
+    check_out: np.ndarray        # Per entry Unix seconds, -1 if missing
+
+    def __len__(self):
+        return len(self.day)
+
+    @classmethod
+    def from_rows(cls, rows) -> 'TimeEntryArrays':
+        """Build arrays from (employee_id, day, check_in, check_out) rows"""
+        data = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        employee_ids, employee_index = np.unique(data[:, 0], return_inverse=True)
+        return cls(
+            employee_ids=employee_ids,
+            employee_index=employee_index.astype(np.int32),
+            day=data[:, 1].astype(np.int32),
+            check_in=data[:, 2],
+            check_out=data[:, 3]
+        )
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[TimeEntry]) -> 'TimeEntryArrays':
+        """Build arrays from TimeEntry objects already loaded"""
+        return cls.from_rows([
+            (entry.employee_id, entry.date.toordinal() - _EPOCH_ORDINAL,
+             calendar.timegm(entry.check_in.timetuple()) if entry.check_in else -1,
+             calendar.timegm(entry.check_out.timetuple()) if entry.check_out else -1)
+            for entry in entries
+        ])
+
+    @property
+    def hours(self) -> np.ndarray:
+        """Hours worked per entry, 0 for incomplete entries"""
+        complete = (self.check_in >= 0) & (self.check_out >= 0)
+        return np.where(complete, (self.check_out - self.check_in) / 3600.0, 0.0)
+
+
+@dataclass
+class HoursSummary:
+    """Aggregated hours for a date range"""
+    employee_ids: np.ndarray       # Distinct employee IDs
+    total_hours: np.ndarray        # Hours per employee
+    distinct_days: np.ndarray      # Days with entries per employee
+    average_hours: np.ndarray      # Hours per worked day per employee
+    entry_counts: np.ndarray       # Entries per employee
+    days: np.ndarray               # datetime64[D] for each day in range
+    hours_per_day: np.ndarray      # Hours per day, all employees
+    entries_per_day: np.ndarray    # Entries per day, all employees
+    months: np.ndarray             # datetime64[M] for each month in range
+    hours_per_month: np.ndarray    # Hours per employee per month (employees x months)
+
+    @property
+    def grand_total(self) -> float:
+        """Total hours of all employees"""
+        return float(self.total_hours.sum())
+
+    @property
+    def total_distinct_days(self) -> int:
+        """Number of days with at least one entry"""
+        return int(np.count_nonzero(self.entries_per_day))
+
+    def for_employee(self, employee_id: int) -> Optional[int]:
+        """Get row index of an employee, None if the employee has no entries"""
+        position = int(np.searchsorted(self.employee_ids, employee_id))
+        if position < len(self.employee_ids) and self.employee_ids[position] == employee_id:
+            return position
+        return None
+
+
+def load_time_entries(db: Database, start_date: date = None, end_date: date = None,
+                      employee_id: int = None) -> TimeEntryArrays:
+    """Load time entries for a range into arrays"""
+    return TimeEntryArrays.from_rows(db.get_time_entry_epochs(start_date, end_date, employee_id))
+
+
+def summarize_hours(entries: TimeEntryArrays) -> HoursSummary:
+    """Aggregate hours per employee, day and month"""
+    entry_ids = entries.employee_ids
+    n_employees = len(entry_ids)
+    hours = entries.hours
+
+    if len(entries) == 0:
+        empty = np.zeros(0)
+        return HoursSummary(
+            employee_ids=entry_ids, total_hours=empty, distinct_days=empty.astype(np.int64),
+            average_hours=empty, entry_counts=empty.astype(np.int64),
+            days=np.array([], dtype='datetime64[D]'), hours_per_day=empty,
+            entries_per_day=empty.astype(np.int64),
+            months=np.array([], dtype='datetime64[M]'), hours_per_month=np.zeros((0, 0))
+        )
+
+    emp = entries.employee_index
+
+    # Per employee
+    total_hours = np.bincount(emp, weights=hours, minlength=n_employees)
+    entry_counts = np.bincount(emp, minlength=n_employees)
+
+    # Per day
+    first_day = int(entries.day.min())
+    day_offset = entries.day - first_day
+    n_days = int(day_offset.max()) + 1
+    hours_per_day = np.bincount(day_offset, weights=hours, minlength=n_days)
+    entries_per_day = np.bincount(day_offset, minlength=n_days)
+    days = np.datetime64('1970-01-01', 'D') + first_day + np.arange(n_days)
+
+    # Distinct days per employee from unique (employee, day) pairs
+    pairs = np.unique(emp.astype(np.int64) * n_days + day_offset)
+    distinct_days = np.bincount(pairs // n_days, minlength=n_employees)
+    average_hours = np.divide(total_hours, distinct_days,
+                              out=np.zeros(n_employees), where=distinct_days > 0)
+
+    # Per employee per month
+    month = entries.day.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    first_month = int(month.min())
+    month_offset = month - first_month
+    n_months = int(month_offset.max()) + 1
+    hours_per_month = np.bincount(
+        emp.astype(np.int64) * n_months + month_offset,
+        weights=hours,
+        minlength=n_employees * n_months
+    ).reshape(n_employees, n_months)
+    months = np.datetime64('1970-01', 'M') + first_month + np.arange(n_months)
+
+    return HoursSummary(
+        employee_ids=entry_ids,
+        total_hours=total_hours,
+        distinct_days=distinct_days,
+        average_hours=average_hours,
+        entry_counts=entry_counts,
+        days=days,
+        hours_per_day=hours_per_day,
+        entries_per_day=entries_per_day,
+        months=months,
+        hours_per_month=hours_per_month
+    )
+
+
+def hours_summary(db: Database, start_date: date = None, end_date: date = None,
+                  employee_id: int = None) -> HoursSummary:
+    """Load and aggregate time entries for a range"""
+    return summarize_hours(load_time_entries(db, start_date, end_date, employee_id))
@@ -0,0 +1,185 @@
+"""
+Department availability from approved leave for Employee Management System
+"""
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from storage.database import Database
+from utils.business_calendar import is_business_day
+
+
+def absence_counts(starts: np.ndarray, ends: np.ndarray, first_day: date, last_day: date) -> np.ndarray:
+    """
+    Count overlapping leave ranges on each day of a period
+
+    Every range adds +1 on its first day and -1 after its last day in a
+    difference array, and a prefix sum turns that into daily counts, so
+    the cost is O(ranges + days) instead of O(ranges * days).
+
+    Args:
+        starts: datetime64[D] first days of leave
+        ends: datetime64[D] last days of leave
+        first_day: First day of the period
+        last_day: Last day of the period
+
+    Returns:
+        Number of ranges covering each day of the period
+    """
+    days = (last_day - first_day).days + 1
+    origin = np.datetime64(first_day, 'D')
+    first = np.clip((starts - origin).astype(np.int64), 0, days)
+    after_last = np.clip((ends - origin).astype(np.int64) + 1, 0, days)
+    difference = np.bincount(first, minlength=days + 1) - np.bincount(after_last, minlength=days + 1)
+    return np.cumsum(difference[:days]).astype(np.int32)
+
+
+def merge_ranges(ranges: List[tuple]) -> List[Tuple[str, str]]:
+    """
+    Merge overlapping leave of the same employee
+
+    Args:
+        ranges: (department, employee_id, start_date, end_date) rows
+            ordered by employee and start date, dates as ISO strings
+
+    Returns:
+        (start_date, end_date) ranges, each employee's days covered once
+    """
+    merged: List[list] = []
+    last_employee = None
+    for _, employee_id, start, end in ranges:
+        if employee_id == last_employee and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+            last_employee = employee_id
+    return [(start, end) for start, end in merged]
+
+
+@dataclass
+class DepartmentAvailability:
+    """Daily absence counts of one department"""
+    department: str
+    first_day: date
+    absent: np.ndarray  # People on approved leave per day
+    headcount: int
+
+    @property
+    def days(self) -> np.ndarray:
+        """datetime64[D] for each day of the period"""
+        return np.datetime64(self.first_day, 'D') + np.arange(len(self.absent))
+
+    @property
+    def available(self) -> np.ndarray:
+        """People not on leave per day"""
+        return self.headcount - self.absent
+
+    def day(self, index: int) -> date:
+        """Get date of a day in the period"""
+        return self.first_day + timedelta(days=index)
+
+
+class AvailabilityEngine:
+    """
+    Compute and cache per-department absence counts
+
+    Results are cached per (department, range) and reused while the
+    leave_requests and employees change counters are unchanged.
+    """
+
+    TABLES = ('leave_requests', 'employees')
+    MAX_CACHED = 128
+
+    def __init__(self, database: Database):
+        self.db = database
+        self._cache: 'OrderedDict[tuple, DepartmentAvailability]' = OrderedDict()
+        self._versions: Optional[Dict[str, int]] = None
+
+    def department(self, department: str, start_date: date, end_date: date) -> DepartmentAvailability:
+        """Get availability of one department"""
+        self._check_versions()
+        key = (department, start_date, end_date)
+        if key not in self._cache:
+            headcounts = self._headcounts()
+            ranges = self.db.get_approved_leave_ranges(start_date, end_date, department)
+            self._store(key, self._build(department, ranges, start_date, end_date, headcounts.get(department, 0)))
+        self._cache.move_to_end(key)
+        return self._cache[key]
+
+    def all_departments(self, start_date: date, end_date: date) -> Dict[str, DepartmentAvailability]:
+        """Get availability of every department, loading missing ones with one query"""
+        self._check_versions()
+        headcounts = self._headcounts()
+        missing = [name for name in headcounts if (name, start_date, end_date) not in self._cache]
+        if missing:
+            by_department: Dict[str, list] = {name: [] for name in missing}
+            for row in self.db.get_approved_leave_ranges(start_date, end_date):
+                if row[0] in by_department:
+                    by_department[row[0]].append(row)
+            for name, ranges in by_department.items():
+                self._store((name, start_date, end_date),
+                            self._build(name, ranges, start_date, end_date, headcounts[name]))
+        return {name: self._cache[(name, start_date, end_date)] for name in sorted(headcounts)}
+
+    def staffing_warnings(self, start_date: date, end_date: date, minimum_ratio: float,
+                          minimums: Dict[str, int] = None,
+                          department: str = None, extra_absent: int = 0) -> List[Tuple[str, date, int, int]]:
+        """
+        Find business days where a department is below minimum staffing
+
+        Args:
+            minimum_ratio: Share of the department that must be present
+            minimums: Minimum people present per department, overriding the ratio
+            department: Check only this department
+            extra_absent: Additional people assumed absent (e.g. a new request)
+
+        Returns:
+            List of (department, day, available, required) tuples
+        """
+        minimums = minimums or {}
+        if department is None:
+            departments = self.all_departments(start_date, end_date).values()
+        else:
+            departments = [self.department(department, start_date, end_date)]
+
+        warnings = []
+        for availability in departments:
+            required = minimums.get(availability.department,
+                                    math.ceil(minimum_ratio * availability.headcount))
+            available = availability.available - extra_absent
+            for index in np.flatnonzero(available < required):
+                day = availability.day(int(index))
+                if is_business_day(day):
+                    warnings.append((availability.department, day, int(available[index]), required))
+        return warnings
+
+    # Helpers
+    def _check_versions(self):
+        """Drop cached results if leave requests or employees changed"""
+        versions = self.db.get_table_versions(self.TABLES)
+        if versions != self._versions:
+            self._cache.clear()
+            self._versions = versions
+
+    def _headcounts(self) -> Dict[str, int]:
+        return {row[0]: row[1] for row in self.db.get_headcount_by_department()}
+
+    def _store(self, key: tuple, availability: DepartmentAvailability):
+        self._cache[key] = availability
+        while len(self._cache) > self.MAX_CACHED:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _build(department: str, ranges: List[tuple], start_date: date, end_date: date,
+               headcount: int) -> DepartmentAvailability:
+        # Overlapping requests of one employee are still one absence
+        merged = merge_ranges(ranges)
+        starts = np.array([start for start, _ in merged], dtype='datetime64[D]')
+        ends = np.array([end for _, end in merged], dtype='datetime64[D]')
+        return DepartmentAvailability(department, start_date,
+                                      absence_counts(starts, ends, start_date, end_date), headcount)
@@ -0,0 +1,85 @@
+"""
+Backup scheduler for Employee Management System
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from storage.backup import BackupManager
+from utils.logger import get_logger
+
+
+class BackupScheduler:
+    """Background scheduler for online backups"""
+
+    def __init__(self, manager: BackupManager, interval_hours: float = 24, verify: bool = True):
+        """
+        Initialize backup scheduler
+
+        Args:
+            manager: Backup manager
+            interval_hours: Hours between backups
+            verify: Verify each backup after creating it
+        """
+        self.manager = manager
+        self.interval = interval_hours * 3600
+        self.verify = verify
+        self.logger = get_logger()
+        self.last_report: Optional[dict] = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start backup scheduler"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+            self.logger.info("Backup scheduler started")
+
+    def stop(self):
+        """Stop backup scheduler, letting a running backup finish"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        self.logger.info("Backup scheduler stopped")
+
+    def run_backup(self) -> dict:
+        """Create, verify and rotate backups once"""
+        report = self.manager.create_backup()
+        if self.verify:
+            report['verified'], report['problems'] = self.manager.verify_backup(report['name'])
+        self.manager.rotate()
+        self.last_report = report
+        return report
+
+    def seconds_until_due(self) -> float:
+        """Seconds until the next backup, counted from the newest one"""
+        latest = self.manager.latest_backup()
+        if latest is None:
+            return 0.0
+        try:
+            # Names start with the creation time, milliseconds and a counter may follow
+            created = datetime.strptime(latest[:15], '%Y%m%d_%H%M%S')
+        except ValueError:
+            return 0.0
+        return max(0.0, self.interval - (datetime.now() - created).total_seconds())
+
+    def _run(self):
+        """Run backup scheduler"""
+        # Let the application finish starting before the first backup
+        if self._stop_event.wait(max(60.0, self.seconds_until_due())):
+            return
+
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.run_backup()
+            except Exception as e:
+                self.logger.error(f"Error creating backup of {os.path.basename(self.manager.db_path)}: {e}")
+
+            # Wait for next backup
+            self._stop_event.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -0,0 +1,96 @@
+"""
+Business day calendar for Employee Management System
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple
+
+
+@lru_cache(maxsize=None)
+def easter_sunday(year: int) -> date:
+    """Get Easter Sunday for a year (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=None)
+def polish_holidays(year: int) -> FrozenSet[date]:
+    """Get Polish public holidays for a year"""
+    easter = easter_sunday(year)
+    holidays = {
+        date(year, 1, 1),     # New Year's Day
+        date(year, 5, 1),     # Labour Day
+        date(year, 5, 3),     # Constitution Day
+        date(year, 8, 15),    # Assumption of Mary
+        date(year, 11, 1),    # All Saints' Day
+        date(year, 11, 11),   # Independence Day
+        date(year, 12, 25),   # Christmas Day
+        date(year, 12, 26),   # Second Day of Christmas
+        easter,                           # Easter Sunday
+        easter + timedelta(days=1),       # Easter Monday
+        easter + timedelta(days=49),      # Pentecost
+        easter + timedelta(days=60),      # Corpus Christi
+    }
+    if year >= 2011:
+        holidays.add(date(year, 1, 6))    # Epiphany
+    if year >= 2025:
+        holidays.add(date(year, 12, 24))  # Christmas Eve
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=None)
+def _weekday_holiday_ordinals(year: int) -> Tuple[int, ...]:
+    """Sorted ordinals of holidays that fall on Monday to Friday"""
+    return tuple(sorted(d.toordinal() for d in polish_holidays(year) if d.weekday() < 5))
+
+
+def _weekdays_before(ordinal: int) -> int:
+    """Count Monday-Friday days with ordinal below the given one"""
+    # Ordinal 1 (0001-01-01) is a Monday, so weeks align with ordinal - 1
+    weeks, remainder = divmod(ordinal - 1, 7)
+    return weeks * 5 + min(remainder, 5)
+
+
+def count_weekdays(start: date, end: date) -> int:
+    """Count Monday-Friday days between start and end (inclusive)"""
+    if end < start:
+        return 0
+    return _weekdays_before(end.toordinal() + 1) - _weekdays_before(start.toordinal())
+
+
+def count_holidays(start: date, end: date) -> int:
+    """Count holidays falling on weekdays between start and end (inclusive)"""
+    if end < start:
+        return 0
+    first, last = start.toordinal(), end.toordinal()
+    total = 0
+    for year in range(start.year, end.year + 1):
+        ordinals = _weekday_holiday_ordinals(year)
+        total += bisect_right(ordinals, last) - bisect_left(ordinals, first)
+    return total
+
+
+def is_business_day(day: date) -> bool:
+    """Check if date is a working day"""
+    return day.weekday() < 5 and day not in polish_holidays(day.year)
+
+
+def business_days(start: date, end: date) -> int:
+    """Count working days between start and end (inclusive)"""
+    return count_weekdays(start, end) - count_holidays(start, end)
+
+
+def business_days_bulk(ranges: Iterable[Tuple[date, date]]) -> List[int]:
+    """Count working days for many (start, end) ranges"""
+    return [business_days(start, end) for start, end in ranges]
@@ -21,16 +21,51 @@ class Config:
         "version": "1.0.0",
         "database_name": "employee_management.db",
         "log_file": "employee_management.log",
+        "log_json": False,  # Write the log file as JSON lines
+        "log_sampling": {},  # Module name -> share of debug/info records kept
+        "log_queue_size": 10000,
         "date_format": "%Y-%m-%d",
         "datetime_format": "%Y-%m-%d %H:%M:%S",
         "annual_leave_days_default": 26,
+        "leave_carry_over_cap": 26,  # Most unused days carried into a new year, null for no cap
         "notification_check_interval": 3600,  # seconds
         "contract_expiry_warning_days": 30,
+        "kpi_reconcile_interval": 900,  # seconds
+        "minimum_staffing_ratio": 0.5,  # Share of a department that must be present
+        "minimum_staffing": {},  # Department name -> minimum people present
         "medical_exam_warning_days": 30,
         "safety_training_warning_days": 30,
+        "daily_working_hours": 8,
+        "weekly_working_hours": 40,
+        "daily_rest_hours": 11,
+        "weekly_rest_hours": 35,
         "document_templates_dir": "templates",
         "generated_documents_dir": "documents",
-        "export_dir": "exports"
+        "document_store_dir": "documents/store",
+        "document_compression": "zlib",
+        "export_dir": "exports",
+        "api_host": "127.0.0.1",
+        "api_port": 8080,
+        "api_workers": 4,
+        "archive_file": "",
+        "archive_time_entries_after_days": 730,
+        "archive_notifications_after_days": 180,
+        "archive_batch_rows": 5000,
+        "backup_dir": "backups",
+        "backup_interval_hours": 24,  # 0 disables scheduled backups
+        "backup_keep": 7,
+        "backup_compress": True,
+        "backup_verify": True,
+        "backup_pages_per_step": 256,
+        "backup_step_sleep_ms": 5,
+        "company_info": {
+            "name": "ABC Company Ltd.",
+            "address": "123 Business Street, Warsaw, Poland",
+            "phone": "+48 123 456 789",
+            "email": "hr@abccompany.pl",
+            "ceo": "John Smith",
+            "hr_manager": "Jane Doe"
+        }
     }
 
     def __init__(self, config_file: str = "config.json"):
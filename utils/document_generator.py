@@ -2,83 +2,230 @@
 Document generator utility for Employee Management System
 """
 
+import hashlib
 import os
+import tempfile
+import threading
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 from models import Employee, LeaveRequest
+from utils.config import Config
+from utils.templates import TemplateEngine
+
+
+class FilenameAllocator:
+    """
+    Allocate collision-free file names
+
+    Names are claimed atomically with an exclusive create, so concurrent
+    writers never get the same file. The next free suffix is remembered
+    per base name, which keeps allocation constant-time no matter how many
+    documents the directory already holds.
+    """
+
+    def __init__(self):
+        self._next_suffix: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, filename: str, output_dir: str) -> Tuple[str, int]:
+        """
+        Claim a free file name
+
+        Returns:
+            Tuple of claimed path and an open write-only file descriptor
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        base, ext = os.path.splitext(filename)
+        key = os.path.join(os.path.abspath(output_dir), filename)
+
+        with self._lock:
+            counter = self._next_suffix.get(key, 0)
+            while True:
+                name = f"{base}_{counter}{ext}" if counter else filename
+                filepath = os.path.join(output_dir, name)
+                try:
+                    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                except FileExistsError:
+                    counter += 1
+                    continue
+                self._next_suffix[key] = counter + 1
+                return filepath, fd
+
+    def save_content_addressed(self, content: str, filename: str, output_dir: str) -> str:
+        """
+        Save content under a name derived from its hash
+
+        Identical content maps to the same file, so a duplicate is not
+        written again.
+        """
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        data = content.encode('utf-8')
+        base, ext = os.path.splitext(filename)
+        digest = hashlib.sha256(data).hexdigest()[:16]
+        filepath = os.path.join(output_dir, f"{base}_{digest}{ext}")
+
+        if os.path.exists(filepath):
+            return filepath
+
+        # Write to a temporary name and link it into place, so readers never
+        # see a partially written file and a concurrent writer simply loses
+        fd, tmp_path = tempfile.mkstemp(dir=output_dir, prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            try:
+                os.link(tmp_path, filepath)
+            except FileExistsError:
+                pass
+        finally:
+            os.unlink(tmp_path)
+        return filepath
+
+    def reset(self):
+        """Forget cached suffixes"""
+        with self._lock:
+            self._next_suffix.clear()
+
+
+# Shared by all generators so suffix caches stay consistent within a process
+filename_allocator = FilenameAllocator()
 
 
 class DocumentGenerator:
     """Generate various documents for employees"""
 
-    def __init__(self, templates_dir: str = "templates"):
+    def __init__(self, templates_dir: str = "templates", config: Optional[Config] = None):
         self.templates_dir = templates_dir
+        self.config = config
+        self.engine = TemplateEngine(templates_dir)
+        self._company_info = None
         self.ensure_templates_exist()
 
     def ensure_templates_exist(self):
-        """Ensure template directory exists"""
-        Path(self.templates_dir).mkdir(exist_ok=True)
+        """Ensure template directory and default templates exist"""
+        self.engine.ensure_defaults()
 
     def generate_employment_certificate(self,
                                         employee: Employee,
                                         purpose: str = "",
                                         additional_notes: str = "") -> str:
         """Generate employment certificate"""
-        template = """
-{company_name}
-{company_address}
-{company_phone}
-{company_email}
-
-CERTIFICATE OF EMPLOYMENT
-
-Date: {current_date}
-
-TO WHOM IT MAY CONCERN:
-
-This is to certify that {employee_name} (PESEL: {pesel}) has been employed with {company_name} 
-since {hire_date}.
+        return self.engine.render(
+            'employment_certificate',
+            self._certificate_context(employee, purpose, additional_notes)
+        )
 
-Employment Details:
-- Position: {position}
-- Department: {department}
-- Employment Type: {contract_type}
-- Current Status: {status}
+    def generate_leave_confirmation(self,
+                                    employee: Employee,
+                                    leave_request: LeaveRequest,
+                                    additional_notes: str = "") -> str:
+        """Generate leave confirmation letter"""
+        return self.engine.render(
+            'leave_confirmation',
+            self._leave_confirmation_context(employee, leave_request, additional_notes)
+        )
 
-{employee_pronoun} has been a valuable member of our organization and continues to contribute 
-to our team's success.
+    def generate_contract(self,
+                          employee: Employee,
+                          salary: str = "",
+                          benefits: str = "",
+                          additional_terms: str = "") -> str:
+        """Generate employment contract"""
+        return self.engine.render(
+            'employment_contract',
+            self._contract_context(employee, salary, benefits, additional_terms)
+        )
 
-This certificate is issued upon request for {purpose}.
+    def generate_generic_document(self,
+                                  employee: Employee,
+                                  document_type: str,
+                                  additional_notes: str = "") -> str:
+        """Generate generic document with employee information"""
+        return self.engine.render(
+            'generic_document',
+            self._generic_context(employee, document_type, additional_notes)
+        )
 
-{additional_notes}
+    def generate_certificates(self,
+                              employees: Iterable[Employee],
+                              purpose: str = "",
+                              additional_notes: str = "") -> List[str]:
+        """Generate employment certificates for many employees"""
+        return self.engine.render_many(
+            'employment_certificate',
+            (self._certificate_context(emp, purpose, additional_notes) for emp in employees)
+        )
 
-Should you require any additional information, please do not hesitate to contact our 
-Human Resources Department.
+    def generate_contracts(self,
+                           employees: Iterable[Employee],
+                           salary: str = "",
+                           benefits: str = "",
+                           additional_terms: str = "") -> List[str]:
+        """Generate employment contracts for many employees"""
+        return self.engine.render_many(
+            'employment_contract',
+            (self._contract_context(emp, salary, benefits, additional_terms) for emp in employees)
+        )
 
-Sincerely,
+    def get_company_info(self) -> Dict[str, str]:
+        """Get company information from configuration (resolved once)"""
+        if self._company_info is None:
+            company_info = dict(Config.DEFAULT_CONFIG['company_info'])
+            if self.config:
+                company_info.update(self.config.get('company_info') or {})
+            self._company_info = company_info
+        return self._company_info
+
+    def save_document(self, content: str, filename: str, output_dir: str = "documents",
+                      naming: str = "sequence") -> str:
+        """
+        Save document to file
+
+        Args:
+            content: Document content
+            filename: Requested file name
+            output_dir: Directory for generated documents
+            naming: 'sequence' appends _1, _2, ... on collision,
+                    'content' appends a hash of the content
+
+        Returns:
+            Path of the saved document
+        """
+        if naming == "content":
+            return filename_allocator.save_content_addressed(content, filename, output_dir)
+
+        filepath, fd = filename_allocator.claim(filename, output_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
 
-_______________________
-{hr_manager_name}
-Human Resources Manager
-{company_name}
+        return filepath
 
-This is a computer-generated document and is valid without signature.
-"""
+    # Template contexts
+    def _base_context(self) -> Dict[str, Any]:
+        """Context values shared by all templates"""
+        company = self.get_company_info()
+        return {
+            'company_name': company['name'],
+            'company_address': company['address'],
+            'company_phone': company['phone'],
+            'company_email': company['email'],
+            'company_representative': company['ceo'],
+            'hr_manager_name': company['hr_manager'],
+            'current_date': date.today().strftime('%B %d, %Y'),
+        }
 
+    def _certificate_context(self, employee: Employee, purpose: str,
+                             additional_notes: str) -> Dict[str, Any]:
+        """Build employment certificate context"""
         # Determine status
         status = "Active Employee"
         if employee.contract_end_date and employee.contract_end_date < date.today():
             status = f"Employment ended on {employee.contract_end_date.strftime('%B %d, %Y')}"
 
-        # Format the certificate
-        return template.format(
-            company_name=self.get_company_info()['name'],
-            company_address=self.get_company_info()['address'],
-            company_phone=self.get_company_info()['phone'],
-            company_email=self.get_company_info()['email'],
-            current_date=date.today().strftime('%B %d, %Y'),
+        context = self._base_context()
+        context.update(
             employee_name=employee.full_name,
             pesel=employee.pesel,
             hire_date=employee.hire_date.strftime('%B %d, %Y') if employee.hire_date else 'N/A',
@@ -88,53 +235,13 @@ This is a computer-generated document and is valid without signature.
             status=status,
             employee_pronoun="He/She",
             purpose=purpose or "official purposes",
-            additional_notes=f"\n{additional_notes}\n" if additional_notes else "",
-            hr_manager_name=self.get_company_info()['hr_manager']
+            additional_notes=f"\n{additional_notes}\n" if additional_notes else ""
         )
+        return context
 
-    def generate_leave_confirmation(self,
-                                    employee: Employee,
-                                    leave_request: LeaveRequest,
-                                    additional_notes: str = "") -> str:
-        """Generate leave confirmation letter"""
-        template = """
-{company_name}
-{company_address}
-
-LEAVE CONFIRMATION LETTER
-
-Date: {current_date}
-
-Dear {employee_name},
-
-This letter confirms that your leave request has been {status}.
-
-Leave Details:
-- Leave Type: {leave_type}
-- Start Date: {start_date}
-- End Date: {end_date}
-- Total Days: {total_days}
-- Remaining Balance: {remaining_balance} days
-
-Reason: {reason}
-
-{status_message}
-
-{additional_notes}
-
-Please ensure all your responsibilities are properly handed over before your leave begins.
-
-If you have any questions, please contact the Human Resources Department.
-
-Best regards,
-
-_______________________
-{hr_manager_name}
-Human Resources Department
-{company_name}
-"""
-
-        status_message = ""
+    def _leave_confirmation_context(self, employee: Employee, leave_request: LeaveRequest,
+                                    additional_notes: str) -> Dict[str, Any]:
+        """Build leave confirmation context"""
         if leave_request.status == "Approved":
             status_message = "Your leave has been approved. Please ensure a smooth handover of your duties."
         elif leave_request.status == "Rejected":
@@ -142,10 +249,8 @@ Human Resources Department
         else:
             status_message = "Your leave request is pending review."
 
-        return template.format(
-            company_name=self.get_company_info()['name'],
-            company_address=self.get_company_info()['address'],
-            current_date=date.today().strftime('%B %d, %Y'),
+        context = self._base_context()
+        context.update(
             employee_name=employee.full_name,
             status=leave_request.status.lower(),
             leave_type=leave_request.leave_type.value,
@@ -155,107 +260,26 @@ Human Resources Department
             remaining_balance=employee.remaining_leave_days,
             reason=leave_request.reason,
             status_message=status_message,
-            additional_notes=f"\n{additional_notes}\n" if additional_notes else "",
-            hr_manager_name=self.get_company_info()['hr_manager']
+            additional_notes=f"\n{additional_notes}\n" if additional_notes else ""
         )
+        return context
 
-    def generate_contract(self,
-                          employee: Employee,
-                          salary: str = "",
-                          benefits: str = "",
-                          additional_terms: str = "") -> str:
-        """Generate employment contract"""
-        template = """
-EMPLOYMENT CONTRACT
-
-This Employment Contract ("Contract") is entered into on {current_date}, between:
-
-EMPLOYER:
-{company_name}
-{company_address}
-(hereinafter referred to as "Employer")
-
-AND
-
-EMPLOYEE:
-Name: {employee_name}
-PESEL: {pesel}
-Address: {employee_address}
-(hereinafter referred to as "Employee")
-
-WHEREAS, the Employer desires to employ the Employee, and the Employee desires to be employed 
-by the Employer, on the terms and conditions set forth herein.
-
-NOW, THEREFORE, in consideration of the mutual covenants and agreements contained herein, 
-the parties agree as follows:
-
-1. POSITION AND DUTIES
-   The Employee shall serve as {position} in the {department} department. The Employee shall 
-   perform such duties as are customarily associated with such position and such other duties 
-   as may be assigned by the Employer.
-
-2. TERM OF EMPLOYMENT
-   Employment shall commence on {start_date} and shall be {contract_type}.
-   {contract_end_clause}
-
-3. COMPENSATION
-   {salary_clause}
-
-4. BENEFITS
-   {benefits_clause}
-
-5. WORKING HOURS
-   The Employee's regular working hours shall be Monday through Friday, from 8:00 AM to 5:00 PM, 
-   with one hour for lunch. The Employee's work mode shall be {work_mode}.
-
-6. ANNUAL LEAVE
-   The Employee shall be entitled to {annual_leave_days} days of paid annual leave per year.
-
-7. CONFIDENTIALITY
-   The Employee agrees to maintain the confidentiality of all proprietary information of the 
-   Employer during and after the term of employment.
-
-8. TERMINATION
-   This Contract may be terminated by either party with appropriate notice as per applicable 
-   labor laws.
-
-9. GOVERNING LAW
-   This Contract shall be governed by the laws of the jurisdiction in which the Employer operates.
-
-{additional_terms}
-
-IN WITNESS WHEREOF, the parties have executed this Contract as of the date first above written.
-
-EMPLOYER:                              EMPLOYEE:
-
-_______________________               _______________________
-{company_representative}               {employee_name}
-{company_name}                        
-Date: _____________                   Date: _____________
-"""
-
+    def _contract_context(self, employee: Employee, salary: str, benefits: str,
+                          additional_terms: str) -> Dict[str, Any]:
+        """Build employment contract context"""
         # Prepare contract end clause
-        contract_end_clause = ""
         if employee.contract_end_date:
             contract_end_clause = f"This contract shall end on {employee.contract_end_date.strftime('%B %d, %Y')}."
         else:
             contract_end_clause = "This is a permanent employment contract with no fixed end date."
 
-        # Prepare salary clause
-        salary_clause = salary if salary else "As mutually agreed and documented separately."
-
-        # Prepare benefits clause
-        benefits_clause = benefits if benefits else "As per company policy and applicable regulations."
-
         # Additional terms section
         additional_terms_section = ""
         if additional_terms:
             additional_terms_section = f"\n10. ADDITIONAL TERMS\n{additional_terms}\n"
 
-        return template.format(
-            current_date=date.today().strftime('%B %d, %Y'),
-            company_name=self.get_company_info()['name'],
-            company_address=self.get_company_info()['address'],
+        context = self._base_context()
+        context.update(
             employee_name=employee.full_name,
             pesel=employee.pesel,
             employee_address=employee.address or '[To be provided]',
@@ -264,42 +288,24 @@ Date: _____________                   Date: _____________
             start_date=employee.hire_date.strftime('%B %d, %Y') if employee.hire_date else '[To be determined]',
             contract_type=employee.contract_type.value.lower(),
             contract_end_clause=contract_end_clause,
-            salary_clause=salary_clause,
-            benefits_clause=benefits_clause,
+            salary_clause=salary if salary else "As mutually agreed and documented separately.",
+            benefits_clause=benefits if benefits else "As per company policy and applicable regulations.",
             work_mode=employee.work_mode.value,
             annual_leave_days=employee.annual_leave_days,
-            additional_terms=additional_terms_section,
-            company_representative=self.get_company_info()['ceo']
+            additional_terms=additional_terms_section
         )
-
-    def get_company_info(self) -> Dict[str, str]:
-        """Get company information (should be configurable)"""
-        return {
-            'name': 'ABC Company Ltd.',
-            'address': '123 Business Street, Warsaw, Poland',
-            'phone': '+48 123 456 789',
-            'email': 'hr@abccompany.pl',
-            'ceo': 'John Smith',
-            'hr_manager': 'Jane Doe'
-        }
-
-    def save_document(self, content: str, filename: str, output_dir: str = "documents") -> str:
-        """Save document to file"""
-        # Ensure output directory exists
-        Path(output_dir).mkdir(exist_ok=True)
-
-        # Generate unique filename if exists
-        filepath = os.path.join(output_dir, filename)
-        if os.path.exists(filepath):
-            base, ext = os.path.splitext(filename)
-            counter = 1
-            while os.path.exists(filepath):
-                filename = f"{base}_{counter}{ext}"
-                filepath = os.path.join(output_dir, filename)
-                counter += 1
-
-        # Save document
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        return filepath
\ No newline at end of file
+        return context
+
+    def _generic_context(self, employee: Employee, document_type: str,
+                         additional_notes: str) -> Dict[str, Any]:
+        """Build generic document context"""
+        context = self._base_context()
+        context.update(
+            document_title=document_type.upper(),
+            employee_name=employee.full_name,
+            pesel=employee.pesel,
+            position=employee.position or 'N/A',
+            department=employee.department or 'N/A',
+            additional_notes=additional_notes
+        )
+        return context
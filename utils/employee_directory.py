@@ -0,0 +1,294 @@
+"""
+Columnar employee directory for Employee Management System
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models import Employee
+from storage.database import Database, EmployeeListRow
+
+
+class Categorical:
+    """Strings stored as small integer codes into a list of distinct values"""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """Get code of a value, adding it to the dictionary if new"""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Get code of a value, or -1 if it does not occur"""
+        return self._codes.get(value, -1)
+
+
+class EmployeeDirectory:
+    """
+    Employees held as columns instead of Employee objects
+
+    Ids, leave balances and dates are NumPy arrays, and department,
+    position, contract type and work mode are dictionary-encoded into
+    int32 codes. Filters are computed as boolean masks over whole columns
+    and group-bys with bincount, without building a Python object per
+    employee. The directory is loaded once and patched in place by
+    upsert() and remove(); writes made elsewhere change the employees
+    change counter, which makes the next refresh() reload it.
+    """
+
+    TABLES = ('employees',)
+    CATEGORICAL = ('department', 'position', 'contract_type', 'work_mode')
+    DATES = ('hire_date', 'contract_end_date')
+    NUMBERS = ('annual_leave_days', 'remaining_leave_days')
+    TEXT = ('first_name', 'last_name', 'pesel')
+    COLUMNS = ('id',) + TEXT + CATEGORICAL + DATES + NUMBERS
+
+    def __init__(self, database: Database):
+        self.db = database
+        self._versions: Optional[Dict[str, int]] = None
+        self._clear()
+
+    def __len__(self):
+        return self._size
+
+    def refresh(self):
+        """Reload if employees changed outside this directory"""
+        if self._versions != self.db.get_table_versions(self.TABLES):
+            self.load()
+
+    def load(self):
+        """Load all employees"""
+        self._versions = self.db.get_table_versions(self.TABLES)
+        self._clear()
+        rows = self.db.get_employee_columns(self.COLUMNS)
+        if not rows:
+            return
+
+        # Build each column in one pass over the rows
+        values = dict(zip(self.COLUMNS, zip(*rows)))
+        self._columns['id'] = np.array(values['id'], dtype=np.int64)
+        for name in self.TEXT:
+            self._text[name] = [value or '' for value in values[name]]
+        for name in self.CATEGORICAL:
+            encode = self._categories[name].encode
+            self._columns[name] = np.array([encode(value or '') for value in values[name]], dtype=np.int32)
+        for name in self.DATES:
+            self._columns[name] = np.array([value or 'NaT' for value in values[name]], dtype='datetime64[D]')
+        for name in self.NUMBERS:
+            self._columns[name] = np.array([value or 0 for value in values[name]], dtype=np.int32)
+        self._size = len(rows)
+        self._row_of = {employee_id: row for row, employee_id in enumerate(values['id'])}
+        # Rows arrive ordered by name
+        self._rank = np.arange(self._size)
+
+    # Incremental updates
+    def upsert(self, employee: Employee):
+        """Add or update an employee just written to the database"""
+        if self._versions is None:
+            self.load()
+            return
+        row = self._row_of.get(employee.id)
+        if row is None:
+            self._reserve(self._size + 1)
+            row = self._size
+            self._size += 1
+        self._set_row(row, (
+            employee.id, employee.first_name, employee.last_name, employee.pesel,
+            employee.department or '', employee.position or '',
+            employee.contract_type.value, employee.work_mode.value,
+            employee.hire_date, employee.contract_end_date,
+            employee.annual_leave_days, employee.remaining_leave_days
+        ))
+        self._versions = self.db.get_table_versions(self.TABLES)
+
+    def remove(self, employee_id: int):
+        """Drop an employee just deleted from the database"""
+        row = self._row_of.pop(employee_id, None)
+        if row is not None:
+            # Move the last row into the gap
+            last = self._size - 1
+            if row != last:
+                for name, column in self._columns.items():
+                    column[row] = column[last]
+                for values in self._text.values():
+                    values[row] = values[last]
+                self._row_of[int(self._columns['id'][row])] = row
+            for values in self._text.values():
+                values.pop()
+            self._size = last
+            self._search = None
+            self._rank = None
+        self._versions = self.db.get_table_versions(self.TABLES)
+
+    # Queries
+    def column(self, name: str) -> np.ndarray:
+        """Get a numeric or date column, or the codes of a categorical column"""
+        return self._columns[name][:self._size]
+
+    def categories(self, name: str) -> List[str]:
+        """Get the distinct values of a categorical column that occur, sorted"""
+        counts = np.bincount(self.column(name), minlength=len(self._categories[name].values))
+        return sorted(value for value, count in zip(self._categories[name].values, counts) if count)
+
+    def mask(self, search: str = None, contract_ends_before: date = None, **equals) -> np.ndarray:
+        """
+        Select employees matching all given conditions
+
+        Args:
+            search: Text contained in the name, PESEL or position (case-insensitive)
+            contract_ends_before: Contract ends on or before this day
+            **equals: Categorical column values, e.g. department='IT'
+
+        Returns:
+            Boolean mask over the rows
+        """
+        mask = np.ones(self._size, dtype=bool)
+        for name, value in equals.items():
+            if name not in self._categories:
+                raise ValueError(f"Not a categorical column: {name}")
+            mask &= self.column(name) == self._categories[name].lookup(value)
+        if contract_ends_before is not None:
+            mask &= self.column('contract_end_date') <= np.datetime64(contract_ends_before, 'D')
+        if search:
+            mask &= np.char.find(self._search_keys(), search.lower()) >= 0
+        return mask
+
+    def ids(self, mask: np.ndarray = None) -> np.ndarray:
+        """Get employee IDs of the selected rows"""
+        ids = self.column('id')
+        return ids if mask is None else ids[mask]
+
+    def rows(self, mask: np.ndarray = None) -> List[int]:
+        """Get selected row numbers ordered by last name, first name and ID"""
+        selected = np.arange(self._size) if mask is None else np.flatnonzero(mask)
+        return selected[np.argsort(self._name_rank()[selected], kind='stable')].tolist()
+
+    def record(self, row: int) -> Dict[str, object]:
+        """Decode one row into a dictionary of column values"""
+        record = {'id': int(self._columns['id'][row])}
+        for name, values in self._text.items():
+            record[name] = values[row]
+        for name, categorical in self._categories.items():
+            record[name] = categorical.values[self._columns[name][row]]
+        for name in self.DATES:
+            value = self._columns[name][row]
+            record[name] = None if np.isnat(value) else value.astype(date)
+        for name in self.NUMBERS:
+            record[name] = int(self._columns[name][row])
+        return record
+
+    def list_row(self, row: int) -> EmployeeListRow:
+        """Decode the employee list columns of one row"""
+        dates = [self._columns[name][row] for name in self.DATES]
+        hire_date, contract_end_date = (None if np.isnat(value) else value.astype(date) for value in dates)
+        return EmployeeListRow(
+            int(self._columns['id'][row]),
+            f"{self._text['first_name'][row]} {self._text['last_name'][row]}",
+            self._text['pesel'][row],
+            self._categories['position'].values[self._columns['position'][row]],
+            self._categories['department'].values[self._columns['department'][row]],
+            self._categories['contract_type'].values[self._columns['contract_type'][row]],
+            hire_date,
+            contract_end_date
+        )
+
+    def counts(self, by: str, mask: np.ndarray = None) -> Dict[str, int]:
+        """Count selected employees per value of a categorical column"""
+        codes = self.column(by) if mask is None else self.column(by)[mask]
+        counts = np.bincount(codes, minlength=len(self._categories[by].values))
+        return {value: int(count) for value, count in zip(self._categories[by].values, counts) if count}
+
+    def sums(self, by: str, column: str, mask: np.ndarray = None) -> Dict[str, int]:
+        """Sum a numeric column per value of a categorical column"""
+        codes, weights = self.column(by), self.column(column)
+        if mask is not None:
+            codes, weights = codes[mask], weights[mask]
+        totals = np.bincount(codes, weights=weights, minlength=len(self._categories[by].values))
+        counts = np.bincount(codes, minlength=len(self._categories[by].values))
+        return {value: int(total) for value, total, count
+                in zip(self._categories[by].values, totals, counts) if count}
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the NumPy columns"""
+        return sum(column.nbytes for column in self._columns.values())
+
+    # Helpers
+    def _clear(self):
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {'id': np.zeros(0, dtype=np.int64)}
+        self._columns.update({name: np.zeros(0, dtype=np.int32) for name in self.CATEGORICAL + self.NUMBERS})
+        self._columns.update({name: np.zeros(0, dtype='datetime64[D]') for name in self.DATES})
+        self._categories = {name: Categorical() for name in self.CATEGORICAL}
+        self._text: Dict[str, List[str]] = {name: [] for name in self.TEXT}
+        self._row_of: Dict[int, int] = {}
+        self._search: Optional[np.ndarray] = None
+        self._rank: Optional[np.ndarray] = None
+
+    def _reserve(self, size: int):
+        """Grow the columns geometrically so appends are amortized O(1)"""
+        capacity = len(self._columns['id'])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 64)
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            if name in self.DATES:
+                grown[:] = np.datetime64('NaT')
+            grown[:len(column)] = column
+            self._columns[name] = grown
+
+    def _set_row(self, row: int, values: Tuple):
+        """Write one row in COLUMNS order"""
+        employee_id = values[0]
+        self._columns['id'][row] = employee_id
+        self._row_of[employee_id] = row
+        position = 1
+        for name in self.TEXT:
+            value = values[position] or ''
+            if row < len(self._text[name]):
+                self._text[name][row] = value
+            else:
+                self._text[name].append(value)
+            position += 1
+        for name in self.CATEGORICAL:
+            self._columns[name][row] = self._categories[name].encode(values[position] or '')
+            position += 1
+        for name in self.DATES:
+            self._columns[name][row] = np.datetime64(values[position] or 'NaT', 'D')
+            position += 1
+        for name in self.NUMBERS:
+            self._columns[name][row] = values[position] or 0
+            position += 1
+        self._search = None
+        self._rank = None
+
+    def _name_rank(self) -> np.ndarray:
+        """Position of each row in name order, recomputed after updates"""
+        if self._rank is None:
+            last_names, first_names = self._text['last_name'], self._text['first_name']
+            ids = self.column('id').tolist()
+            order = sorted(range(self._size), key=lambda row: (last_names[row], first_names[row], ids[row]))
+            self._rank = np.empty(self._size, dtype=np.int64)
+            self._rank[order] = np.arange(self._size)
+        return self._rank
+
+    def _search_keys(self) -> np.ndarray:
+        """Lower-case name, PESEL and position per row, built when first searched"""
+        if self._search is None:
+            positions = self._categories['position'].values
+            codes = self.column('position')
+            self._search = np.array([
+                f"{first}\t{last}\t{pesel}\t{positions[code]}".lower()
+                for first, last, pesel, code in zip(self._text['first_name'], self._text['last_name'],
+                                                    self._text['pesel'], codes)
+            ], dtype=str)
+        return self._search
@@ -0,0 +1,57 @@
+"""
+Dashboard KPI service for Employee Management System
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from storage.database import Database
+from utils.logger import get_logger
+
+
+class KpiService:
+    """
+    Read and reconcile dashboard counters
+
+    Headcount, today's attendance, people on leave and expiring contracts
+    are kept in the kpi_counters table. Triggers and time entry inserts
+    update them as rows change, so reading them is a single small query.
+    reconcile() recomputes them from the tables, correcting drift from
+    writes the triggers do not see (such as deleted time entries), and
+    moves the date-dependent counters to a new day.
+    """
+
+    def __init__(self, database: Database, warning_days: int = 30):
+        """
+        Initialize KPI service
+
+        Args:
+            database: Database instance
+            warning_days: Days ahead in which a contract counts as expiring
+        """
+        self.db = database
+        self.warning_days = warning_days
+        self.logger = get_logger()
+        self.last_reconciled: Optional[datetime] = None
+
+    def current(self) -> Dict[str, Any]:
+        """Get counters, reconciling first if they refer to another day"""
+        kpis = self.db.get_kpis()
+        if kpis['as_of'] != date.today():
+            self.reconcile()
+            kpis = self.db.get_kpis()
+        return kpis
+
+    def reconcile(self) -> Dict[str, tuple]:
+        """
+        Recompute counters for today
+
+        Returns:
+            Counters that had drifted, as {name: (stored, actual)}
+        """
+        drift = self.db.reconcile_kpis(date.today(), self.warning_days)
+        self.last_reconciled = datetime.now()
+        if drift:
+            details = ', '.join(f"{name} {stored} -> {actual}" for name, (stored, actual) in drift.items())
+            self.logger.warning(f"KPI counters corrected: {details}")
+        return drift
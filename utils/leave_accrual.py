@@ -0,0 +1,62 @@
+"""
+Yearly leave accrual for Employee Management System
+"""
+
+from datetime import date
+from typing import Optional
+
+from storage.database import Database
+from utils.logger import get_logger
+
+
+class LeaveAccrual:
+    """
+    Open each year's leave balances
+
+    Every employee gets a row in the leave_ledger table per year with the
+    entitlement, the days carried over from the previous year, the days
+    used and the resulting balance. A new year is computed from the
+    previous year's row, so history is never replayed. Balances only move
+    to a new year when accrual runs for it; the application does this on
+    start and checks hourly whether the year has turned, and the CLI can
+    run it for any year.
+    """
+
+    def __init__(self, database: Database, carry_over_cap: Optional[int] = 26):
+        """
+        Initialize leave accrual
+
+        Args:
+            database: Database instance
+            carry_over_cap: Most unused days carried into a new year (None for no cap)
+        """
+        self.db = database
+        self.carry_over_cap = carry_over_cap
+        self.logger = get_logger()
+
+    def run(self, year: int = None) -> int:
+        """
+        Accrue leave for a year
+
+        Balances (remaining_leave_days) are rewritten only for the current
+        year, so accruing the next year ahead leaves them alone.
+
+        Returns:
+            Number of employees accrued
+        """
+        year = year or date.today().year
+        count = self.db.accrue_leave(year, self.carry_over_cap,
+                                     update_balances=year == date.today().year)
+        self.logger.info(f"Accrued {year} leave for {count} employees")
+        return count
+
+    def ensure_current_year(self) -> bool:
+        """Accrue the current year if it has not been accrued yet"""
+        year = date.today().year
+        years = self.db.get_ledger_years()
+        if year in years:
+            return False
+        # Catch up on years the application was not started in
+        for missing in range(years[-1] + 1 if years else year, year + 1):
+            self.run(missing)
+        return True
@@ -0,0 +1,263 @@
+"""
+Interval index over leave requests for Employee Management System
+"""
+
+import random
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from models import LeaveRequest
+from storage.database import Database
+
+
+ACTIVE_STATUSES = ('Pending', 'Approved')
+
+
+class _Node:
+    """Treap node holding one interval"""
+    __slots__ = ('key', 'start', 'end', 'value', 'priority', 'left', 'right', 'max_end')
+
+    def __init__(self, start, end, value):
+        self.key = (start, end, value)
+        self.start = start
+        self.end = end
+        self.value = value
+        self.priority = random.random()
+        self.left = None
+        self.right = None
+        self.max_end = end
+
+    def update(self):
+        """Recompute the largest end in this subtree"""
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+
+
+class IntervalTree:
+    """
+    Closed intervals in a treap ordered by start, augmented with the
+    largest end of each subtree
+
+    Insert and remove take O(log n) expected time. Finding the k intervals
+    that overlap a range takes O(log n + k), because subtrees that end
+    before the range or start after it are skipped.
+    """
+
+    def __init__(self):
+        self._root: Optional[_Node] = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def insert(self, start, end, value):
+        """Add interval [start, end] carrying a value"""
+        self._root = self._insert(self._root, _Node(start, end, value))
+        self._size += 1
+
+    def remove(self, start, end, value) -> bool:
+        """Remove an interval, returning False if it was not present"""
+        size = self._size
+        self._root = self._remove(self._root, (start, end, value))
+        return self._size < size
+
+    def overlapping(self, start, end) -> List[Tuple]:
+        """Get (start, end, value) of intervals overlapping [start, end], ordered by start"""
+        result = []
+        self._collect(self._root, start, end, result)
+        return result
+
+    def __iter__(self) -> Iterator[Tuple]:
+        stack, node = [], self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    # Treap operations
+    @staticmethod
+    def _rotate_right(node: _Node) -> _Node:
+        left = node.left
+        node.left = left.right
+        left.right = node
+        node.update()
+        left.update()
+        return left
+
+    @staticmethod
+    def _rotate_left(node: _Node) -> _Node:
+        right = node.right
+        node.right = right.left
+        right.left = node
+        node.update()
+        right.update()
+        return right
+
+    def _insert(self, node: Optional[_Node], new: _Node) -> _Node:
+        if node is None:
+            return new
+        if new.key < node.key:
+            node.left = self._insert(node.left, new)
+            if node.left.priority > node.priority:
+                return self._rotate_right(node)
+        else:
+            node.right = self._insert(node.right, new)
+            if node.right.priority > node.priority:
+                return self._rotate_left(node)
+        node.update()
+        return node
+
+    def _remove(self, node: Optional[_Node], key: tuple) -> Optional[_Node]:
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        elif key > node.key:
+            node.right = self._remove(node.right, key)
+        else:
+            if node.left is None or node.right is None:
+                self._size -= 1
+                return node.left if node.left is not None else node.right
+            # Rotate the node down towards a leaf, then remove it there
+            if node.left.priority > node.right.priority:
+                node = self._rotate_right(node)
+                node.right = self._remove(node.right, key)
+            else:
+                node = self._rotate_left(node)
+                node.left = self._remove(node.left, key)
+        node.update()
+        return node
+
+    def _collect(self, node: Optional[_Node], start, end, result: list):
+        while node is not None and node.max_end >= start:
+            self._collect(node.left, start, end, result)
+            if node.start > end:
+                return  # Everything to the right starts later still
+            if node.end >= start:
+                result.append(node.key)
+            node = node.right
+
+
+class LeaveIndex:
+    """
+    Leave requests indexed by date range, per employee and per department
+
+    The index is built from leave_requests and updated in place when the
+    application adds or approves a request. Writes made elsewhere (the API
+    or CLI) change the leave_requests and employees change counters, which
+    makes the next query rebuild the index.
+    """
+
+    TABLES = ('leave_requests', 'employees')
+
+    def __init__(self, database: Database):
+        self.db = database
+        self.requests: Dict[int, tuple] = {}  # id -> (employee_id, department, start, end, status)
+        self.by_employee: Dict[int, IntervalTree] = {}
+        self.by_department: Dict[str, IntervalTree] = {}
+        self.all_requests = IntervalTree()
+        self._versions: Optional[Dict[str, int]] = None
+
+    def rebuild(self):
+        """Load all leave requests"""
+        self._versions = self.db.get_table_versions(self.TABLES)
+        self.requests.clear()
+        self.by_employee.clear()
+        self.by_department.clear()
+        self.all_requests = IntervalTree()
+        for request_id, employee_id, department, start, end, status in self.db.get_leave_intervals():
+            self._add(request_id, employee_id, department, start, end, status)
+
+    def refresh(self):
+        """Rebuild if leave requests or employees changed outside this index"""
+        if self._versions != self.db.get_table_versions(self.TABLES):
+            self.rebuild()
+
+    def add_request(self, request: LeaveRequest, department: str = ''):
+        """Index a request just written to the database"""
+        if self._versions is None:
+            self.rebuild()
+        self.remove_request(request.id)
+        self._add(request.id, request.employee_id, department or '',
+                  request.start_date, request.end_date, request.status)
+        self._versions = self.db.get_table_versions(self.TABLES)
+
+    def set_status(self, request_id: int, status: str):
+        """Record a status change written to the database"""
+        if request_id in self.requests:
+            employee_id, department, start, end, _ = self.requests[request_id]
+            self.requests[request_id] = (employee_id, department, start, end, status)
+            self._versions = self.db.get_table_versions(self.TABLES)
+        else:
+            self.rebuild()
+
+    def remove_request(self, request_id: int):
+        """Drop a request from the index"""
+        indexed = self.requests.pop(request_id, None)
+        if indexed is None:
+            return
+        employee_id, department, start, end, _ = indexed
+        self.by_employee[employee_id].remove(start, end, request_id)
+        self.by_department[department].remove(start, end, request_id)
+        self.all_requests.remove(start, end, request_id)
+
+    # Queries
+    def overlapping(self, employee_id: int, start_date: date, end_date: date,
+                    statuses: Iterable[str] = ACTIVE_STATUSES, exclude_id: int = None) -> List[int]:
+        """Get IDs of an employee's requests overlapping a range"""
+        self.refresh()
+        tree = self.by_employee.get(employee_id)
+        return self._filter(tree, start_date, end_date, statuses, exclude_id)
+
+    def requests_in_range(self, start_date: date, end_date: date, employee_id: int = None,
+                          status: str = None) -> List[int]:
+        """Get IDs of requests overlapping a range, optionally for one employee or status"""
+        self.refresh()
+        tree = self.all_requests if employee_id is None else self.by_employee.get(employee_id)
+        return self._filter(tree, start_date, end_date, (status,) if status else None)
+
+    def employees_off(self, start_date: date, end_date: date, department: str = None) -> Set[int]:
+        """Get IDs of employees with approved leave during a range"""
+        self.refresh()
+        tree = self.all_requests if department is None else self.by_department.get(department)
+        return {self.requests[request_id][0]
+                for request_id in self._filter(tree, start_date, end_date, ('Approved',))}
+
+    # Helpers
+    def _add(self, request_id, employee_id, department, start, end, status):
+        self.requests[request_id] = (employee_id, department, start, end, status)
+        self.by_employee.setdefault(employee_id, IntervalTree()).insert(start, end, request_id)
+        self.by_department.setdefault(department, IntervalTree()).insert(start, end, request_id)
+        self.all_requests.insert(start, end, request_id)
+
+    def _filter(self, tree: Optional[IntervalTree], start_date: date, end_date: date,
+                statuses: Optional[Iterable[str]], exclude_id: int = None) -> List[int]:
+        if tree is None:
+            return []
+        statuses = set(statuses) if statuses else None
+        return [
+            request_id for _, _, request_id in tree.overlapping(start_date, end_date)
+            if request_id != exclude_id and (statuses is None or self.requests[request_id][4] in statuses)
+        ]
+
+
+def find_overlapping_requests(database: Database, employee_id: int, start_date: date, end_date: date,
+                              index: LeaveIndex = None, exclude_id: int = None) -> List[LeaveRequest]:
+    """
+    Get an employee's pending or approved requests overlapping a range
+
+    Used to validate new requests wherever they are created. With an
+    index the candidates come from its interval tree, otherwise from one
+    indexed query.
+    """
+    if index is None:
+        return database.get_overlapping_leave_requests(employee_id, start_date, end_date, exclude_id)
+    return database.get_leave_requests_by_ids(index.overlapping(employee_id, start_date, end_date,
+                                                                exclude_id=exclude_id))
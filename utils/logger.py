@@ -1,57 +1,240 @@
 """
 Logging configuration for Employee Management System
+
+Records are put on a queue by the calling thread and written by a
+QueueListener thread, so logging from the GUI or the notification checker
+never waits for file I/O, rotation or compression.
 """
 
+import atexit
+import copy
+import gzip
+import json
 import logging
 import os
+import queue
+import shutil
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+
+_listener: Optional[QueueListener] = None  # Writes queued records to the handlers
+_exception_formatter = logging.Formatter()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make a record safe to pass to the listener thread
+
+        Unlike QueueHandler.prepare the record is not formatted here: only
+        the message arguments are merged and the traceback is rendered to
+        exc_text, so the file formatter still sees the exception apart
+        from the message.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.dropped:
+                # Report the loss once the writer has caught up
+                self.queue.put_nowait(logging.makeLogRecord({
+                    'name': record.name, 'levelno': logging.WARNING, 'levelname': 'WARNING',
+                    'msg': f"Log queue full, dropped {self.dropped} records",
+                }))
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    """Queue listener whose stop waits for room in a full queue"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keep only a share of low-level records from chatty modules
+
+    Warnings and errors always pass. For other records from a module in
+    rates, one in every round(1 / rate) is kept, so a rate of 0.01 keeps
+    every hundredth debug message of that module.
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.intervals = {module: max(1, round(1 / rate)) if rate > 0 else 0
+                          for module, rate in rates.items()}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        interval = self.intervals.get(record.module)
+        if interval is None:
+            return True
+        if interval == 0:
+            return False
+        with self._lock:
+            count = self._counts.get(record.module, 0)
+            self._counts[record.module] = count + 1
+        return count % interval == 0
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'module': record.module,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        if record.stack_info:
+            entry['stack'] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that gzips rotated files in a background thread
+
+    Rotated files are named log_file.N.gz. The file is renamed right away
+    and compressed on a separate thread; the next rotation waits for the
+    previous compression so numbering stays consistent.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = lambda name: name + '.gz'
+        self.rotator = self._rotate
+        self._compressor: Optional[threading.Thread] = None
+
+    def doRollover(self):
+        self.wait_for_compression()
+        super().doRollover()
+
+    def wait_for_compression(self):
+        """Block until the last rotated file is compressed"""
+        if self._compressor is not None:
+            self._compressor.join()
+            self._compressor = None
+
+    def _rotate(self, source: str, dest: str):
+        if not os.path.exists(source):
+            return
+        pending = dest[:-len('.gz')]
+        os.replace(source, pending)
+        self._compressor = threading.Thread(target=self._compress, args=(pending, dest),
+                                            name='LogCompressor', daemon=True)
+        self._compressor.start()
+
+    @staticmethod
+    def _compress(source: str, dest: str):
+        try:
+            with open(source, 'rb') as f_in, gzip.open(dest + '.tmp', 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            os.replace(dest + '.tmp', dest)
+            os.remove(source)
+        except OSError:
+            pass  # Keep the uncompressed file
+
+    def close(self):
+        self.wait_for_compression()
+        super().close()
 
 
 def setup_logger(log_file: str = "employee_management.log",
-                 log_level: int = logging.INFO) -> logging.Logger:
+                 log_level: int = logging.INFO,
+                 json_lines: bool = False,
+                 sampling: Dict[str, float] = None,
+                 queue_size: int = 10000) -> logging.Logger:
     """
     Set up application logger
 
     Args:
         log_file: Path to log file
         log_level: Logging level
+        json_lines: Write the log file as JSON lines instead of text
+        sampling: Share of below-warning records kept per module, e.g. {'overtime_checker': 0.1}
+        queue_size: Records buffered for the writer thread; more are dropped
 
     Returns:
         Configured logger instance
     """
+    global _listener
+
     # Create logger
     logger = logging.getLogger('EmployeeManagement')
     logger.setLevel(log_level)
 
     # Remove existing handlers
+    shutdown_logger()
     logger.handlers.clear()
 
     # Create formatters
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if json_lines:
+        file_formatter = JsonLinesFormatter()
+    else:
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
 
     console_formatter = logging.Formatter(
         '%(levelname)s - %(message)s'
     )
 
     # File handler with rotation
-    file_handler = RotatingFileHandler(
+    file_handler = CompressingRotatingFileHandler(
         log_file,
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
 
     # Console handler for errors only
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.ERROR)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+
+    # Calling threads only enqueue, the listener thread writes
+    queue_handler = DroppingQueueHandler(queue.Queue(queue_size))
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    logger.addHandler(queue_handler)
+
+    _listener = _Listener(queue_handler.queue, file_handler, console_handler,
+                          respect_handler_level=True)
+    _listener.start()
 
     # Log startup
     logger.info("=" * 50)
@@ -61,6 +244,21 @@ def setup_logger(log_file: str = "employee_management.log",
     return logger
 
 
+def shutdown_logger():
+    """Write queued records and close the log handlers"""
+    global _listener
+
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
 def get_logger() -> logging.Logger:
     """Get the application logger"""
-    return logging.getLogger('EmployeeManagement')
\ No newline at end of file
+    return logging.getLogger('EmployeeManagement')
+
+
+atexit.register(shutdown_logger)
@@ -0,0 +1,90 @@
+"""
+Memory and construction benchmark for the data models
+
+Compares the slotted models with equivalent dataclasses that keep a
+per-instance __dict__, as the models were before.
+
+    python -m utils.model_benchmark --count 100000
+"""
+
+import argparse
+import dataclasses
+import gc
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+from models import Employee, TimeEntry, LeaveRequest, Notification, LeaveType
+
+
+def with_dict(model_class):
+    """Build a plain dataclass with the same fields as a slotted model"""
+    return dataclasses.make_dataclass(
+        model_class.__name__,
+        [(field.name, field.type, dataclasses.field(default=field.default))
+         for field in dataclasses.fields(model_class)]
+    )
+
+
+def _arguments(model_class, i: int) -> Dict:
+    """Typical field values for one instance"""
+    day = date(2025, 1, 1) + timedelta(days=i % 365)
+    check_in = datetime.combine(day, datetime.min.time()) + timedelta(hours=8)
+    return {
+        Employee: lambda: dict(id=i, first_name=f"First{i}", last_name=f"Last{i}", pesel=f"{i:011d}",
+                               email=f"user{i}@example.com", position="Developer",
+                               department=f"Dept{i % 8}", hire_date=day),
+        TimeEntry: lambda: dict(id=i, employee_id=i % 1000, date=day, check_in=check_in,
+                                check_out=check_in + timedelta(hours=8)),
+        LeaveRequest: lambda: dict(id=i, employee_id=i % 1000, leave_type=LeaveType.VACATION,
+                                   start_date=day, end_date=day + timedelta(days=2), days_count=3),
+        Notification: lambda: dict(id=i, employee_id=i % 1000, notification_type="Medical Exam",
+                                   title="Medical exam due", due_date=day),
+    }[model_class]()
+
+
+def measure(factory: Callable, arguments: List[Dict]) -> Tuple[float, float]:
+    """
+    Construct one instance per argument set
+
+    Returns:
+        (bytes per instance, microseconds per instance)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(**kwargs) for kwargs in arguments]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Memory of the instances alone, without the list holding them
+    allocated -= instances.__sizeof__()
+    del instances
+
+    gc.collect()
+    start = time.perf_counter()
+    instances = [factory(**kwargs) for kwargs in arguments]
+    elapsed = time.perf_counter() - start
+    del instances
+    return allocated / len(arguments), elapsed * 1e6 / len(arguments)
+
+
+def run_benchmark(count: int = 100000) -> str:
+    """Compare slotted and dict-based models, returning a report"""
+    lines = [f"{'Model':<14}{'dict B/obj':>12}{'slots B/obj':>13}{'saved':>8}"
+             f"{'dict us/obj':>13}{'slots us/obj':>14}"]
+    for model_class in (Employee, TimeEntry, LeaveRequest, Notification):
+        arguments = [_arguments(model_class, i) for i in range(count)]
+        # Field values are shared by both runs, only the instances are measured
+        dict_bytes, dict_time = measure(with_dict(model_class), arguments)
+        slot_bytes, slot_time = measure(model_class, arguments)
+        lines.append(f"{model_class.__name__:<14}{dict_bytes:>12.0f}{slot_bytes:>13.0f}"
+                     f"{1 - slot_bytes / dict_bytes:>8.0%}{dict_time:>13.2f}{slot_time:>14.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark model memory and construction time')
+    parser.add_argument('--count', type=int, default=100000, help='Instances per model')
+    args = parser.parse_args()
+    print(run_benchmark(args.count))
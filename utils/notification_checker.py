@@ -4,11 +4,13 @@ Notification checker for Employee Management System
 
 import threading
 from datetime import date, timedelta
-from typing import Callable
+from typing import Callable, List
 
 from storage.database import Database
 from models import Notification, Employee
+from utils.config import Config
 from utils.logger import get_logger
+from utils.overtime_checker import OvertimeChecker
 
 
 class NotificationChecker:
@@ -61,14 +63,22 @@ class NotificationChecker:
         """Check for and create notifications"""
         self.logger.debug("Checking notifications...")
 
-        # Check contract expiry
-        self._check_contract_expiry()
+        # Create all notifications of this sweep in one transaction
+        with self.db.transaction():
+            employees = self.db.get_all_employees()
 
-        # Check medical exams
-        self._check_medical_exams()
+            # Check contract expiry
+            self._check_contract_expiry(employees)
 
-        # Check safety training
-        self._check_safety_training()
+            # Check medical exams
+            self._check_medical_exams(employees)
+
+            # Check safety training
+            self._check_safety_training(employees)
+
+        # Check overtime and rest periods (commits on its own, and reading
+        # time entries may need to attach year partitions)
+        self._check_working_time()
 
         # Get pending notification count
         notifications = self.db.get_pending_notifications()
@@ -80,12 +90,18 @@ class NotificationChecker:
 
         self.logger.debug(f"Found {count} pending notifications")
 
-    def _check_contract_expiry(self):
+    def check_employee(self, employee: Employee):
+        """Create notifications due for a single employee"""
+        with self.db.transaction():
+            self._check_contract_expiry([employee])
+            self._check_medical_exams([employee])
+            self._check_safety_training([employee])
+
+    def _check_contract_expiry(self, employees: List[Employee]):
         """Check for expiring contracts"""
         warning_days = 30
         check_date = date.today() + timedelta(days=warning_days)
 
-        employees = self.db.get_all_employees()
         for employee in employees:
             if employee.contract_end_date:
                 days_until_expiry = (employee.contract_end_date - date.today()).days
@@ -109,11 +125,10 @@ class NotificationChecker:
                         self.db.create_notification(notification)
                         self.logger.info(f"Created contract expiry notification for {employee.full_name}")
 
-    def _check_medical_exams(self):
+    def _check_medical_exams(self, employees: List[Employee]):
         """Check for due medical exams"""
         warning_days = 30
 
-        employees = self.db.get_all_employees()
         for employee in employees:
             if employee.medical_exam_date:
                 # Assume medical exams are valid for 1 year
@@ -138,11 +153,10 @@ class NotificationChecker:
                         self.db.create_notification(notification)
                         self.logger.info(f"Created medical exam notification for {employee.full_name}")
 
-    def _check_safety_training(self):
+    def _check_safety_training(self, employees: List[Employee]):
         """Check for due safety training"""
         warning_days = 30
 
-        employees = self.db.get_all_employees()
         for employee in employees:
             if employee.safety_training_date:
                 # Assume safety training is valid for 1 year
@@ -167,6 +181,18 @@ class NotificationChecker:
                         self.db.create_notification(notification)
                         self.logger.info(f"Created safety training notification for {employee.full_name}")
 
+    def _check_working_time(self):
+        """Check recorded time entries for overtime and insufficient rest"""
+        config = Config()
+        checker = OvertimeChecker(
+            self.db,
+            daily_hours=config.get('daily_working_hours', 8),
+            weekly_hours=config.get('weekly_working_hours', 40),
+            daily_rest_hours=config.get('daily_rest_hours', 11),
+            weekly_rest_hours=config.get('weekly_rest_hours', 35)
+        )
+        checker.check()
+
     def _notification_exists(self, employee_id: int, notification_type: str, due_date: date) -> bool:
         """Check if notification already exists"""
         notifications = self.db.get_pending_notifications()
@@ -0,0 +1,212 @@
+"""
+Working time violation checker for Employee Management System
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from models import Notification, TimeEntry
+from storage.database import Database
+from utils.logger import get_logger
+
+
+DAILY_OVERTIME = "Daily Overtime"
+WEEKLY_OVERTIME = "Weekly Overtime"
+DAILY_REST = "Daily Rest"
+WEEKLY_REST = "Weekly Rest"
+
+
+@dataclass
+class Violation:
+    """Working time rule violation"""
+    employee_id: int
+    violation_type: str
+    day: date
+    hours: float
+    message: str
+
+
+def _week_start(day: date) -> date:
+    """Get Monday of the week containing a date"""
+    return day - timedelta(days=day.weekday())
+
+
+class OvertimeChecker:
+    """Detect overtime and insufficient rest in recorded time entries"""
+
+    JOB_NAME = "overtime_checker"
+
+    def __init__(self, database: Database,
+                 daily_hours: float = 8,
+                 weekly_hours: float = 40,
+                 daily_rest_hours: float = 11,
+                 weekly_rest_hours: float = 35):
+        """
+        Initialize overtime checker
+
+        Args:
+            database: Database instance
+            daily_hours: Working hours per day before overtime
+            weekly_hours: Working hours per week before overtime
+            daily_rest_hours: Minimum rest between shifts on different days
+            weekly_rest_hours: Minimum uninterrupted rest in each week
+        """
+        self.db = database
+        self.daily_hours = daily_hours
+        self.weekly_hours = weekly_hours
+        self.daily_rest_hours = daily_rest_hours
+        self.weekly_rest_hours = weekly_rest_hours
+        self.logger = get_logger()
+
+    def check(self) -> List[Violation]:
+        """
+        Check time entries added since the last run and create notifications
+
+        Only employees with new entries are rescanned, starting one week
+        before their earliest new entry so rest periods spanning the
+        boundary are still seen.
+
+        Returns:
+            Violations found in the scanned entries
+        """
+        last_id = self.db.get_job_state(self.JOB_NAME)
+        changes = self.db.get_changed_time_entry_ranges(last_id)
+        if not changes:
+            return []
+
+        violations = []
+        for employee_id, first_date, _ in changes:
+            scan_from = _week_start(first_date) - timedelta(days=7)
+            shifts = self.db.get_shifts(employee_id, scan_from)
+            violations.extend(self.scan(employee_id, shifts))
+
+        # Notifications and progress are committed together
+        with self.db.transaction():
+            created = self.notify(violations)
+            self.db.set_job_state(self.JOB_NAME, max(change[2] for change in changes))
+
+        self.logger.info(f"Overtime check: {len(violations)} violations, {created} new notifications")
+        return violations
+
+    def scan(self, employee_id: int, shifts: Iterable[TimeEntry],
+             now: Optional[datetime] = None) -> List[Violation]:
+        """
+        Find violations in one pass over shifts ordered by check in
+
+        Hours and the longest rest are accumulated for the current day and
+        week only; each window is evaluated when the scan moves past it.
+        """
+        now = now or datetime.now()
+        violations = []
+
+        current_day = None
+        day_hours = 0.0
+        current_week = None
+        week_hours = 0.0
+        week_longest_rest = 0.0
+        previous = None
+
+        for shift in shifts:
+            hours = shift.hours_worked
+            shift_week = _week_start(shift.date)
+
+            rest = None
+            if previous is not None:
+                rest = (shift.check_in - previous.check_out).total_seconds() / 3600
+                if previous.date != shift.date and rest < self.daily_rest_hours:
+                    violations.append(Violation(
+                        employee_id, DAILY_REST, shift.date, round(rest, 2),
+                        f"Only {rest:.1f}h rest before shift on {shift.date.strftime('%Y-%m-%d')} "
+                        f"(minimum {self.daily_rest_hours:g}h)"
+                    ))
+                # A rest period counts for every week it touches
+                week_longest_rest = max(week_longest_rest, rest)
+
+            # Close day window
+            if shift.date != current_day:
+                if current_day is not None:
+                    self._check_day(employee_id, current_day, day_hours, violations)
+                current_day = shift.date
+                day_hours = 0.0
+
+            # Close week window
+            if shift_week != current_week:
+                if current_week is not None:
+                    self._check_week(employee_id, current_week, week_hours, week_longest_rest, violations)
+                current_week = shift_week
+                week_hours = 0.0
+                week_longest_rest = rest if rest is not None and rest > 0 else 0.0
+                if previous is None:
+                    # No earlier shift in range, rest before this one is unknown
+                    week_longest_rest = self.weekly_rest_hours
+
+            day_hours += hours
+            week_hours += hours
+            previous = shift
+
+        if current_day is not None:
+            self._check_day(employee_id, current_day, day_hours, violations)
+
+        if current_week is not None:
+            week_end = datetime.combine(current_week + timedelta(days=7), datetime.min.time())
+            if now >= week_end:
+                # Week is over, rest after the last shift lasted at least until week end
+                trailing_rest = (week_end - previous.check_out).total_seconds() / 3600
+                week_longest_rest = max(week_longest_rest, trailing_rest)
+                self._check_week(employee_id, current_week, week_hours, week_longest_rest, violations)
+            elif week_hours > self.weekly_hours:
+                self._check_week(employee_id, current_week, week_hours, self.weekly_rest_hours, violations)
+
+        return violations
+
+    def notify(self, violations: List[Violation]) -> int:
+        """Create notifications for violations not reported yet"""
+        names: Dict[int, str] = {}
+        created = 0
+
+        for violation in violations:
+            if self.db.notification_exists(violation.employee_id, violation.violation_type, violation.day):
+                continue
+
+            if violation.employee_id not in names:
+                employee = self.db.get_employee(violation.employee_id)
+                names[violation.employee_id] = employee.full_name if employee else f"Employee #{violation.employee_id}"
+            name = names[violation.employee_id]
+
+            self.db.create_notification(Notification(
+                employee_id=violation.employee_id,
+                notification_type=violation.violation_type,
+                title=f"{violation.violation_type} - {name}",
+                message=f"{name}: {violation.message}",
+                due_date=violation.day
+            ))
+            created += 1
+
+        return created
+
+    def _check_day(self, employee_id: int, day: date, hours: float, violations: List[Violation]):
+        """Check daily overtime"""
+        if hours > self.daily_hours:
+            violations.append(Violation(
+                employee_id, DAILY_OVERTIME, day, round(hours, 2),
+                f"Worked {hours:.2f}h on {day.strftime('%Y-%m-%d')} "
+                f"({hours - self.daily_hours:.2f}h overtime)"
+            ))
+
+    def _check_week(self, employee_id: int, week: date, hours: float, longest_rest: float,
+                    violations: List[Violation]):
+        """Check weekly overtime and weekly rest"""
+        week_end = week + timedelta(days=6)
+        if hours > self.weekly_hours:
+            violations.append(Violation(
+                employee_id, WEEKLY_OVERTIME, week_end, round(hours, 2),
+                f"Worked {hours:.2f}h in week of {week.strftime('%Y-%m-%d')} "
+                f"({hours - self.weekly_hours:.2f}h overtime)"
+            ))
+        if longest_rest < self.weekly_rest_hours:
+            violations.append(Violation(
+                employee_id, WEEKLY_REST, week_end, round(longest_rest, 2),
+                f"Longest rest in week of {week.strftime('%Y-%m-%d')} was {longest_rest:.1f}h "
+                f"(minimum {self.weekly_rest_hours:g}h)"
+            ))
@@ -0,0 +1,168 @@
+"""
+Reporting engine for Employee Management System
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from storage.database import Database
+
+
+@dataclass(frozen=True)
+class ReportDefinition:
+    """Aggregate report computed by the database"""
+    key: str
+    title: str
+    columns: Tuple[str, ...]
+    tables: Tuple[str, ...]  # Tables whose changes invalidate cached results
+    query: Callable[[Database, Optional[date], Optional[date]], List[tuple]]
+    summed: Tuple[str, ...] = ()  # Columns added up in the totals row
+    uses_dates: bool = True
+    description: str = ""
+
+
+@dataclass
+class ReportResult:
+    """Rows of a report with the table versions they were computed from"""
+    definition: ReportDefinition
+    rows: List[tuple]
+    versions: Dict[str, int]
+    generated_at: datetime = field(default_factory=datetime.now)
+    cached: bool = False
+
+    @property
+    def totals(self) -> tuple:
+        """Totals row with sums of the summed columns"""
+        columns = self.definition.columns
+        return ('Total', *(
+            round(sum(row[index] or 0 for row in self.rows), 2) if columns[index] in self.definition.summed else ''
+            for index in range(1, len(columns))
+        ))
+
+
+REPORTS: 'OrderedDict[str, ReportDefinition]' = OrderedDict()
+
+
+def register_report(definition: ReportDefinition) -> ReportDefinition:
+    """Add a report to the registry"""
+    REPORTS[definition.key] = definition
+    return definition
+
+
+def _hours_per_month(db: Database, start_date: date, end_date: date) -> List[tuple]:
+    return [
+        (month, entries, hours, round(hours / entries, 2) if entries else 0.0)
+        for month, entries, hours in db.get_time_entry_totals('month', start_date, end_date)
+    ]
+
+
+def _work_mode_mix(db: Database, start_date: date, end_date: date) -> List[tuple]:
+    totals = db.get_time_entry_totals('work_mode', start_date, end_date)
+    all_entries = sum(row[1] for row in totals)
+    return [
+        (work_mode, entries, hours, round(100.0 * entries / all_entries, 1) if all_entries else 0.0)
+        for work_mode, entries, hours in totals
+    ]
+
+
+register_report(ReportDefinition(
+    key='headcount',
+    title='Headcount by Department',
+    columns=('Department', 'Employees', 'Remote', 'Hybrid', 'Office'),
+    tables=('employees',),
+    query=lambda db, start_date, end_date: db.get_headcount_by_department(),
+    summed=('Employees', 'Remote', 'Hybrid', 'Office'),
+    uses_dates=False,
+    description='Current employees per department and work mode'
+))
+
+register_report(ReportDefinition(
+    key='contract_types',
+    title='Contract Types',
+    columns=('Contract Type', 'Employees', 'Fixed Term', 'Expired'),
+    tables=('employees',),
+    query=lambda db, start_date, end_date: db.get_contract_type_counts(),
+    summed=('Employees', 'Fixed Term', 'Expired'),
+    uses_dates=False,
+    description='Employees per contract type'
+))
+
+register_report(ReportDefinition(
+    key='leave_usage',
+    title='Leave Usage',
+    columns=('Department', 'Leave Type', 'Requests', 'Days'),
+    tables=('employees', 'leave_requests'),
+    query=lambda db, start_date, end_date: db.get_leave_usage(start_date, end_date),
+    summed=('Requests', 'Days'),
+    description='Approved leave starting in the range'
+))
+
+register_report(ReportDefinition(
+    key='hours_per_month',
+    title='Hours per Month',
+    columns=('Month', 'Entries', 'Hours', 'Hours per Entry'),
+    tables=('time_entries', 'time_entry_archive_summary'),
+    query=_hours_per_month,
+    summed=('Entries', 'Hours'),
+    description='Recorded hours per month, including archived entries'
+))
+
+register_report(ReportDefinition(
+    key='work_mode_mix',
+    title='Work Mode Mix',
+    columns=('Work Mode', 'Entries', 'Hours', 'Share %'),
+    tables=('time_entries', 'time_entry_archive_summary'),
+    query=_work_mode_mix,
+    summed=('Entries', 'Hours', 'Share %'),
+    description='Time entries per work mode, including archived entries'
+))
+
+
+class ReportEngine:
+    """
+    Run registered reports and cache their results
+
+    A cached result is reused while the change counters of the tables the
+    report reads are unchanged, so showing a report again costs one small
+    query. Results also expire at midnight because some reports compare
+    with today's date.
+    """
+
+    MAX_CACHED = 64
+
+    def __init__(self, database: Database):
+        self.db = database
+        self._cache: 'OrderedDict[tuple, ReportResult]' = OrderedDict()
+
+    def run(self, key: str, start_date: date = None, end_date: date = None) -> ReportResult:
+        """
+        Get report result, computing it if the cached one is stale
+
+        Args:
+            key: Registered report key
+            start_date: Start of the range for reports that use dates
+            end_date: End of the range for reports that use dates
+        """
+        definition = REPORTS[key]
+        if not definition.uses_dates:
+            start_date = end_date = None
+        cache_key = (key, start_date, end_date, date.today())
+
+        versions = self.db.get_table_versions(definition.tables)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached.versions == versions:
+            self._cache.move_to_end(cache_key)
+            cached.cached = True
+            return cached
+
+        result = ReportResult(definition, definition.query(self.db, start_date, end_date), versions)
+        self._cache[cache_key] = result
+        while len(self._cache) > self.MAX_CACHED:
+            self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        """Drop all cached results"""
+        self._cache.clear()
@@ -0,0 +1,310 @@
+"""
+Document template engine for Employee Management System
+"""
+
+import os
+import threading
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Any, Iterable, List, Tuple
+
+
+# Built-in templates, written to the templates directory on first run so
+# they can be edited there. Placeholders use str.format syntax.
+DEFAULT_TEMPLATES = {
+    'employment_certificate': """
+{company_name}
+{company_address}
+{company_phone}
+{company_email}
+
+CERTIFICATE OF EMPLOYMENT
+
+Date: {current_date}
+
+TO WHOM IT MAY CONCERN:
+
+This is to certify that {employee_name} (PESEL: {pesel}) has been employed with {company_name}
+since {hire_date}.
+
+Employment Details:
+- Position: {position}
+- Department: {department}
+- Employment Type: {contract_type}
+- Current Status: {status}
+
+{employee_pronoun} has been a valuable member of our organization and continues to contribute
+to our team's success.
+
+This certificate is issued upon request for {purpose}.
+
+{additional_notes}
+
+Should you require any additional information, please do not hesitate to contact our
+Human Resources Department.
+
+Sincerely,
+
+_______________________
+{hr_manager_name}
+Human Resources Manager
+{company_name}
+
+This is a computer-generated document and is valid without signature.
+""",
+
+    'leave_confirmation': """
+{company_name}
+{company_address}
+
+LEAVE CONFIRMATION LETTER
+
+Date: {current_date}
+
+Dear {employee_name},
+
+This letter confirms that your leave request has been {status}.
+
+Leave Details:
+- Leave Type: {leave_type}
+- Start Date: {start_date}
+- End Date: {end_date}
+- Total Days: {total_days}
+- Remaining Balance: {remaining_balance} days
+
+Reason: {reason}
+
+{status_message}
+
+{additional_notes}
+
+Please ensure all your responsibilities are properly handed over before your leave begins.
+
+If you have any questions, please contact the Human Resources Department.
+
+Best regards,
+
+_______________________
+{hr_manager_name}
+Human Resources Department
+{company_name}
+""",
+
+    'employment_contract': """
+EMPLOYMENT CONTRACT
+
+This Employment Contract ("Contract") is entered into on {current_date}, between:
+
+EMPLOYER:
+{company_name}
+{company_address}
+(hereinafter referred to as "Employer")
+
+AND
+
+EMPLOYEE:
+Name: {employee_name}
+PESEL: {pesel}
+Address: {employee_address}
+(hereinafter referred to as "Employee")
+
+WHEREAS, the Employer desires to employ the Employee, and the Employee desires to be employed
+by the Employer, on the terms and conditions set forth herein.
+
+NOW, THEREFORE, in consideration of the mutual covenants and agreements contained herein,
+the parties agree as follows:
+
+1. POSITION AND DUTIES
+   The Employee shall serve as {position} in the {department} department. The Employee shall
+   perform such duties as are customarily associated with such position and such other duties
+   as may be assigned by the Employer.
+
+2. TERM OF EMPLOYMENT
+   Employment shall commence on {start_date} and shall be {contract_type}.
+   {contract_end_clause}
+
+3. COMPENSATION
+   {salary_clause}
+
+4. BENEFITS
+   {benefits_clause}
+
+5. WORKING HOURS
+   The Employee's regular working hours shall be Monday through Friday, from 8:00 AM to 5:00 PM,
+   with one hour for lunch. The Employee's work mode shall be {work_mode}.
+
+6. ANNUAL LEAVE
+   The Employee shall be entitled to {annual_leave_days} days of paid annual leave per year.
+
+7. CONFIDENTIALITY
+   The Employee agrees to maintain the confidentiality of all proprietary information of the
+   Employer during and after the term of employment.
+
+8. TERMINATION
+   This Contract may be terminated by either party with appropriate notice as per applicable
+   labor laws.
+
+9. GOVERNING LAW
+   This Contract shall be governed by the laws of the jurisdiction in which the Employer operates.
+
+{additional_terms}
+
+IN WITNESS WHEREOF, the parties have executed this Contract as of the date first above written.
+
+EMPLOYER:                              EMPLOYEE:
+
+_______________________               _______________________
+{company_representative}               {employee_name}
+{company_name}
+Date: _____________                   Date: _____________
+""",
+
+    'generic_document': """
+{company_name}
+{company_address}
+
+{document_title}
+
+Date: {current_date}
+
+Employee Information:
+Name: {employee_name}
+PESEL: {pesel}
+Position: {position}
+Department: {department}
+
+{additional_notes}
+
+_______________________
+Authorized Signature
+{company_name}
+""",
+}
+
+TEMPLATE_EXTENSION = ".txt"
+
+
+class CompiledTemplate:
+    """Template parsed once into literal text and field segments"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.fields = []
+        self._parts = []
+
+        formatter = Formatter()
+        for literal, field_name, format_spec, conversion in formatter.parse(source):
+            if literal:
+                self._parts.append((literal, None, None, None))
+            if field_name is not None:
+                if not field_name or not field_name.isidentifier():
+                    raise ValueError(f"Unsupported template placeholder: {{{field_name}}}")
+                self._parts.append((None, field_name, conversion, format_spec))
+                self.fields.append(field_name)
+
+    def render(self, context: Dict[str, Any]) -> str:
+        """Render template with the given context"""
+        out = []
+        append = out.append
+        for literal, field_name, conversion, format_spec in self._parts:
+            if field_name is None:
+                append(literal)
+                continue
+
+            value = context[field_name]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            elif conversion == 's':
+                value = str(value)
+
+            if format_spec:
+                append(format(value, format_spec))
+            elif isinstance(value, str):
+                append(value)
+            else:
+                append(str(value))
+
+        return ''.join(out)
+
+
+class TemplateEngine:
+    """Load, compile and cache document templates from a directory"""
+
+    def __init__(self, templates_dir: str = "templates"):
+        self.templates_dir = templates_dir
+        self._cache: Dict[str, Tuple[int, CompiledTemplate]] = {}
+        self._lock = threading.Lock()
+
+    def ensure_defaults(self):
+        """Write built-in templates that are missing from the templates directory"""
+        Path(self.templates_dir).mkdir(parents=True, exist_ok=True)
+        for name, source in DEFAULT_TEMPLATES.items():
+            path = self.template_path(name)
+            if not os.path.exists(path):
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(source)
+
+    def template_path(self, name: str) -> str:
+        """Get path of a template file"""
+        return os.path.join(self.templates_dir, name + TEMPLATE_EXTENSION)
+
+    def list_templates(self) -> List[str]:
+        """List available template names"""
+        names = set(DEFAULT_TEMPLATES)
+        if os.path.isdir(self.templates_dir):
+            with os.scandir(self.templates_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(TEMPLATE_EXTENSION):
+                        names.add(entry.name[:-len(TEMPLATE_EXTENSION)])
+        return sorted(names)
+
+    def get(self, name: str) -> CompiledTemplate:
+        """
+        Get compiled template
+
+        The template is compiled on first use and recompiled only when the
+        file's modification time changes. Templates missing on disk fall
+        back to the built-in defaults.
+        """
+        path = self.template_path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            if name not in DEFAULT_TEMPLATES:
+                raise KeyError(f"Template not found: {name}")
+            mtime = -1
+
+        cached = self._cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+
+            if mtime == -1:
+                source = DEFAULT_TEMPLATES[name]
+            else:
+                with open(path, 'r', encoding='utf-8') as f:
+                    source = f.read()
+
+            compiled = CompiledTemplate(source)
+            self._cache[path] = (mtime, compiled)
+            return compiled
+
+    def render(self, name: str, context: Dict[str, Any]) -> str:
+        """Render template by name"""
+        return self.get(name).render(context)
+
+    def render_many(self, name: str, contexts: Iterable[Dict[str, Any]]) -> List[str]:
+        """Render one template for many contexts, looking it up only once"""
+        template = self.get(name)
+        return [template.render(context) for context in contexts]
+
+    def clear_cache(self):
+        """Drop all compiled templates"""
+        with self._lock:
+            self._cache.clear()